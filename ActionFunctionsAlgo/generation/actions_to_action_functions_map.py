@@ -7,16 +7,28 @@ adding new actions, retrieving actions by length, and looking up actions by thei
 functions or vice versa.
 
 Type definitions:
-    ActionFunctionType: A dictionary mapping StateType to StateType
+    ActionFunctionType: A dictionary mapping StateType to StateType, or an array
+     mapping state IDs to state IDs (see BaseWorld.compute_action_function)
     DistinctActionsDataType: A dictionary mapping ActionType to ActionFunctionType
 """
 
-from utils.type_definitions import ActionType, StateType
+from collections.abc import Hashable
 
-ActionFunctionType = dict[StateType, StateType]
+import numpy as np
+
+from utils.type_definitions import ActionType, StateType, TransitionArray
+
+ActionFunctionType = dict[StateType, StateType] | TransitionArray
 DistinctActionsDataType = dict[ActionType, ActionFunctionType]
 
 
+def _action_function_key(action_function: ActionFunctionType) -> Hashable:
+    """Return a hashable key that identifies an action function."""
+    if isinstance(action_function, np.ndarray):
+        return action_function.tobytes()
+    return frozenset(action_function.items())
+
+
 class ActionsActionFunctionsMap:
     """
     A class that manages bidirectional mapping between actions and their action
@@ -34,6 +46,8 @@ class ActionsActionFunctionsMap:
 
     def __init__(self) -> None:
         self.data: DistinctActionsDataType = {}
+        # Reverse lookup from action function keys to actions.
+        self._actions_by_function: dict[Hashable, ActionType] = {}
 
     def add_action(
         self, action: ActionType, action_function: ActionFunctionType
@@ -47,6 +61,9 @@ class ActionsActionFunctionsMap:
              action.
         """
         self.data[action] = action_function
+        self._actions_by_function.setdefault(
+            _action_function_key(action_function), action
+        )
 
     def get_actions_from_length(self, length: int) -> list[ActionType]:
         """
@@ -74,10 +91,7 @@ class ActionsActionFunctionsMap:
         Returns:
             bool: True if the action function exists, False otherwise.
         """
-        return any(
-            existing_function == action_function
-            for existing_function in self.data.values()
-        )
+        return _action_function_key(action_function) in self._actions_by_function
 
     def get_action_from_action_function(
         self, action_function: ActionFunctionType
@@ -94,10 +108,12 @@ class ActionsActionFunctionsMap:
         Raises:
             ValueError: If the action function is not found in the mapping.
         """
-        for action, existing_function in self.data.items():
-            if existing_function == action_function:
-                return action
-        raise ValueError("Action function not found in self.distinct_actions")
+        try:
+            return self._actions_by_function[_action_function_key(action_function)]
+        except KeyError:
+            raise ValueError(
+                "Action function not found in self.distinct_actions"
+            ) from None
 
     def get_num_actions(self) -> int:
         """
@@ -4,6 +4,8 @@ Module for generating Cayley tables of action compositions.
 
 import time
 
+import numpy as np
+
 from ActionFunctionsAlgo.generation.actions_to_action_functions_map import (
     ActionFunctionType,
 )
@@ -29,6 +31,10 @@ def _compose_action_functions(
     Returns:
         The composed function mapping states to their final states
     """
+    if isinstance(right_action_function, np.ndarray):
+        # Array action functions are indexed by state ID.
+        return left_action_function[right_action_function]
+
     composed_action_function: ActionFunctionType = {}
     for r_initial_state in right_action_function.keys():
         r_final_state = right_action_function[r_initial_state]
@@ -175,9 +181,17 @@ class AFCayleyGenerator:
             left_action
         )
         # Compose the action functions
-        composed_action_function = _compose_action_functions(
-            left_action_function, right_action_function
-        )
+        symmetry = self.equiv_classes_generator.get_symmetry()
+        if symmetry is not None:
+            # Action functions are restricted to orbit representatives.
+            composed_action_function = symmetry.compose_action_functions(
+                left_action_function,  # type: ignore[arg-type]
+                right_action_function,  # type: ignore[arg-type]
+            )
+        else:
+            composed_action_function = _compose_action_functions(
+                left_action_function, right_action_function
+            )
 
         return composed_action_function
 
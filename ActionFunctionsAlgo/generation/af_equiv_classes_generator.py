@@ -14,10 +14,11 @@ from ActionFunctionsAlgo.generation.actions_to_action_functions_map import (
     ActionFunctionType,
     ActionsActionFunctionsMap,
 )
-from utils.action_outcome import generate_action_outcome
+from utils.action_word import ActionAlphabet
 from utils.equiv_classes import EquivClasses
 from utils.type_definitions import ActionType, MinActionsType
 from worlds.base_world import BaseWorld
+from worlds.utils.symmetry import StateSymmetry, detect_state_symmetry
 
 
 class AFEquivClassGenerator:
@@ -35,14 +36,30 @@ class AFEquivClassGenerator:
         equiv_classes: EquivClasses object storing the equivalence classes
     """
 
-    def __init__(self, world: BaseWorld):
+    def __init__(
+        self,
+        world: BaseWorld,
+        use_symmetry: bool = False,
+        use_action_words: bool = False,
+    ):
         """Initialize the generator with a world.
 
         Args:
             world: The world to analyze actions in
+            use_symmetry: If True, detect automorphisms of the world (see
+             worlds.utils.symmetry) and compute action functions on one
+             representative state per orbit only. The stored action functions are
+             then restricted to the representatives; use get_full_action_function
+             to reconstruct them.
+            use_action_words: If True, build actions as packed ActionWords (see
+             utils.action_word) instead of strings.
         """
         self.min_actions: MinActionsType = world.get_min_actions()
+        if use_action_words:
+            self.min_actions = ActionAlphabet(self.min_actions).min_action_words()  # type: ignore[assignment]
         self._world: BaseWorld = world
+        self._use_symmetry = use_symmetry
+        self._symmetry: StateSymmetry | None = None
 
         self.distinct_actions: ActionsActionFunctionsMap = ActionsActionFunctionsMap()
         self.equiv_classes: EquivClasses = EquivClasses()
@@ -60,6 +77,15 @@ class AFEquivClassGenerator:
         """
         print("\nGenerating equivalence classes.")
         start_time = time.time()
+        self._prepare_transition_array()
+        if self._use_symmetry:
+            self._symmetry = detect_state_symmetry(self._world)
+            print(
+                f"\tSymmetry group order: {self._symmetry.get_group_order()},"
+                f"\tOrbit representatives: {len(self._symmetry.representatives)}"
+                f"/{self._world.get_num_state_ids()}"
+            )
+        self._world.reset_simulation_stats()
         self._find_distinct_min_actions()
 
         num_new_actions = self.distinct_actions.get_num_actions() - 0
@@ -99,11 +125,14 @@ class AFEquivClassGenerator:
             # If no new distinct actions were found, halt.
             if prev_distinct_count == self.distinct_actions.get_num_actions():
                 total_time = time.time() - start_time
+                simulation_stats = self._world.get_simulation_stats()
                 print(
                     f"\nEquiv classes generated:"
                     f"\n\tAction length: {current_length},"
                     f"\tDistinct actions: {prev_distinct_count},"
                     f"\t\tTotal time: {total_time:.2f}s"
+                    f"\n\tSimulation steps skipped (absorbing states):"
+                    f" {simulation_stats['skipped_steps']}/{simulation_stats['steps']}"
                 )
                 break
 
@@ -123,6 +152,26 @@ class AFEquivClassGenerator:
         """
         return self.distinct_actions
 
+    def get_symmetry(self) -> StateSymmetry | None:
+        """Return the symmetry the action functions are restricted by, if any."""
+        return self._symmetry
+
+    def get_full_action_function(self, action: ActionType) -> ActionFunctionType:
+        """Return the action function of a distinct action over all states.
+
+        Args:
+            action: A distinct action (an equivalence class label)
+        """
+        action_function = self.distinct_actions.get_action_function_from_action(action)
+        if self._symmetry is None:
+            return action_function
+        return self._symmetry.reconstruct_action_function(action_function)  # type: ignore[arg-type]
+
+    def _prepare_transition_array(self) -> None:
+        """Ensure the world has a transition array over all possible states."""
+        if not self._world.is_transition_array_complete():
+            self._world.generate_transition_array()
+
     def _find_distinct_min_actions(self) -> None:
         """Find all distinct minimal actions by processing each minimal action."""
         for min_action in self.min_actions:
@@ -156,13 +205,14 @@ class AFEquivClassGenerator:
             action: The action to compute the function for
 
         Returns:
-            Dictionary mapping each state to the resulting state after applying the
-              action
+            Array mapping each state ID (or each orbit representative, when using
+             symmetry) to the ID of the resulting state after applying the action
         """
-        action_function: ActionFunctionType = {}
-        for state in self._world.get_possible_states():
-            action_function[state] = generate_action_outcome(action, state, self._world)
-        return action_function
+        if self._symmetry is not None:
+            return self._world.compute_action_function(
+                action, self._symmetry.representatives
+            )
+        return self._world.compute_action_function(action)
 
     def _generate_candidates(
         self,
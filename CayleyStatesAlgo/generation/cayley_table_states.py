@@ -1,7 +1,6 @@
-import pandas as pd
-
-from utils.action_outcome import generate_action_outcome
+from utils.action_outcome import generate_action_outcomes
 from utils.equiv_classes import EquivClasses
+from utils.outcome_cache import OutcomeCache
 from utils.type_definitions import (
     ActionType,
     CayleyTableStatesDataType,
@@ -96,6 +95,7 @@ class CayleyTableStates:
         initial_state: StateType,
         world: BaseWorld,
         take_first: bool = False,
+        outcome_cache: OutcomeCache | None = None,
     ) -> dict[ActionType, EquivElementsRowColumnDictType]:
         """Find elements that have equivalent behavior to the given element.
 
@@ -108,6 +108,7 @@ class CayleyTableStates:
             initial_state: Starting state for computing outcomes
             world: World in which actions are applied
             take_first: If True, return after finding first equivalent element
+            outcome_cache: Cache to compute outcomes with, if any
 
         Returns:
             Dictionary mapping equivalent elements to their row/column data
@@ -115,11 +116,17 @@ class CayleyTableStates:
         equiv_elements: dict[ActionType, EquivElementsRowColumnDictType] = {}
 
         element_row = self.generate_new_element_row(
-            element=element, initial_state=initial_state, world=world
+            element=element,
+            initial_state=initial_state,
+            world=world,
+            outcome_cache=outcome_cache,
         )
 
         element_column = self.generate_new_element_column(
-            element=element, initial_state=initial_state, world=world
+            element=element,
+            initial_state=initial_state,
+            world=world,
+            outcome_cache=outcome_cache,
         )
 
         for row_label in self.get_row_labels():
@@ -136,7 +143,11 @@ class CayleyTableStates:
     # Table Generation
     # --------------------------------------------------------------------------
     def generate_new_element_row(
-        self, element: ActionType, initial_state: StateType, world: BaseWorld
+        self,
+        element: ActionType,
+        initial_state: StateType,
+        world: BaseWorld,
+        outcome_cache: OutcomeCache | None = None,
     ) -> CayleyTableStatesRowType:
         """Generate a new row for an element.
 
@@ -147,24 +158,26 @@ class CayleyTableStates:
             element: The left action to generate outcomes for
             initial_state: Starting state for computing outcomes
             world: World in which actions are applied
+            outcome_cache: Cache to compute outcomes with, if any
 
         Returns:
             Dictionary mapping right actions to outcome states
         """
-        element_row = {}
-        for col_label in self.get_row_labels():
-            action_sequence = element + col_label
-            outcome = generate_action_outcome(
-                action=action_sequence,
-                initial_state=initial_state,
-                world=world,
-            )
-            element_row[col_label] = outcome
-
-        return element_row
+        col_labels = self.get_row_labels()
+        outcomes = generate_action_outcomes(
+            actions=[element + col_label for col_label in col_labels],
+            initial_state=initial_state,
+            world=world,
+            outcome_cache=outcome_cache,
+        )
+        return dict(zip(col_labels, outcomes, strict=True))
 
     def generate_new_element_column(
-        self, element: ActionType, initial_state: StateType, world: BaseWorld
+        self,
+        element: ActionType,
+        initial_state: StateType,
+        world: BaseWorld,
+        outcome_cache: OutcomeCache | None = None,
     ) -> CayleyTableStatesRowType:
         """Generate a new column for an element.
 
@@ -175,27 +188,26 @@ class CayleyTableStates:
             element: The right action to generate outcomes for
             initial_state: Starting state for computing outcomes
             world: World in which actions are applied
+            outcome_cache: Cache to compute outcomes with, if any
 
         Returns:
             Dictionary mapping left actions to outcome states
         """
-        element_column = {}
-        for row_label in self.get_row_labels():
-            action_sequence = row_label + element
-            outcome = generate_action_outcome(
-                action=action_sequence,
-                initial_state=initial_state,
-                world=world,
-            )
-            element_column[row_label] = outcome
-
-        return element_column
+        row_labels = self.get_row_labels()
+        outcomes = generate_action_outcomes(
+            actions=[row_label + element for row_label in row_labels],
+            initial_state=initial_state,
+            world=world,
+            outcome_cache=outcome_cache,
+        )
+        return dict(zip(row_labels, outcomes, strict=True))
 
     def add_equiv_classes(
         self,
         equiv_classes: EquivClasses,
         initial_state: StateType,
         world: BaseWorld,
+        outcome_cache: OutcomeCache | None = None,
     ) -> None:
         """Add new equivalence classes to the table.
 
@@ -208,16 +220,22 @@ class CayleyTableStates:
             equiv_classes: The equivalence classes to add
             initial_state: Starting state for computing outcomes
             world: World in which actions are applied
+            outcome_cache: Cache to compute outcomes with, if any
         """
         for class_label in equiv_classes.get_labels():
             self.add_new_element(
                 element=class_label,
                 initial_state=initial_state,
                 world=world,
+                outcome_cache=outcome_cache,
             )
 
     def add_new_element(
-        self, element: ActionType, initial_state: StateType, world: BaseWorld
+        self,
+        element: ActionType,
+        initial_state: StateType,
+        world: BaseWorld,
+        outcome_cache: OutcomeCache | None = None,
     ) -> None:
         """Add a new element to the table.
 
@@ -229,26 +247,28 @@ class CayleyTableStates:
             element: The action to add to the table
             initial_state: Starting state for computing outcomes
             world: World in which actions are applied
+            outcome_cache: Cache to compute outcomes with, if any
         """
-        # Generate a new row for the Cayley table
-        new_row = self.generate_new_element_row(
-            element=element,
+        # The new row has a cell for each existing column, and the new column a
+        #  cell for each existing row and for the new row. All of them are
+        #  generated in a single batch.
+        labels = self.get_row_labels()
+        outcomes = generate_action_outcomes(
+            actions=[element + col_label for col_label in labels]
+            + [row_label + element for row_label in [*labels, element]],
             initial_state=initial_state,
             world=world,
+            outcome_cache=outcome_cache,
         )
-        # Add the new row to the data.
-        self.data[element] = new_row
 
-        # Generate a new column for the Cayley table.
-        new_column = self.generate_new_element_column(
-            element=element,
-            initial_state=initial_state,
-            world=world,
-        )
+        # Add the new row to the data.
+        self.data[element] = dict(zip(labels, outcomes[: len(labels)], strict=True))
 
         # Add the new column to the data.
-        for row_label in self.get_row_labels():
-            self.data[row_label][element] = new_column[row_label]
+        for row_label, outcome in zip(
+            self.get_row_labels(), outcomes[len(labels) :], strict=True
+        ):
+            self.data[row_label][element] = outcome
 
     # --------------------------------------------------------------------------
     # String Representation
@@ -258,6 +278,8 @@ class CayleyTableStates:
         if not self.data:
             return "\nCayleyTableStates  = {}"
         # Convert the nested dictionary to a pandas DataFrame
+        import pandas as pd  # noqa: PLC0415 (slow to import)
+
         df = pd.DataFrame.from_dict(self.data, orient="index")
         # Return the string representation of the DataFrame
         return f"\nCayleyTableStates =\n{df}"
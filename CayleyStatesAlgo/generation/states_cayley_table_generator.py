@@ -2,10 +2,12 @@ import logging
 import time
 
 from CayleyStatesAlgo.generation.cayley_table_states import CayleyTableStates
-from utils.action_outcome import generate_action_outcome
+from utils.action_outcome import generate_action_outcome, generate_action_outcomes
+from utils.action_word import ActionAlphabet
 from utils.equiv_classes import (
     EquivClasses,
 )
+from utils.outcome_cache import OutcomeCache
 from utils.type_definitions import ActionType, StateType
 from worlds.base_world import BaseWorld
 
@@ -29,14 +31,20 @@ class StatesCayleyGenerator:
         min_actions: Minimal set of actions from the world
         equiv_classes: Current equivalence classes of transformations
         cayley_table_states: Current Cayley table mapping actions to states
-        candidate_elements: Set of action sequences to process
+        candidate_elements: Action sequences to process, popped shortest first
+        outcome_cache: Cache that action outcomes are computed with, if any
     """
 
     # --------------------------------------------------------------------------
     # Setup and Main Entry
     # --------------------------------------------------------------------------
     def __init__(
-        self, world: BaseWorld, initial_state: StateType, log_level: int = logging.INFO
+        self,
+        world: BaseWorld,
+        initial_state: StateType,
+        log_level: int = logging.INFO,
+        use_action_words: bool = False,
+        outcome_cache: OutcomeCache | None = None,
     ) -> None:
         """
         Initialize the generator with a world and starting state.
@@ -45,6 +53,10 @@ class StatesCayleyGenerator:
             world: World whose transformations we're analyzing
             initial_state: State from which to start applying transformations
             log_level: Logging level for progress updates
+            use_action_words: If True, build actions as packed ActionWords (see
+             utils.action_word) instead of strings
+            outcome_cache: Cache to compute action outcomes with (see
+             utils.outcome_cache). Outcomes are simulated from scratch if None.
 
         Raises:
             ValueError: If world has no minimum actions defined
@@ -52,14 +64,21 @@ class StatesCayleyGenerator:
         # Core state
         self.world = world
         self.initial_state = initial_state
+        self.outcome_cache = outcome_cache
         self.min_actions = world.get_min_actions()
         if not self.min_actions:
             raise ValueError("World must have minimum actions defined")
+        # Candidates and class elements are visited in the order of the alphabet's
+        #  sort key, which orders strings and words alike, so that the generated
+        #  algebra does not depend on set iteration order.
+        self._alphabet = ActionAlphabet(self.min_actions)
+        if use_action_words:
+            self.min_actions = self._alphabet.min_action_words()
 
         # Generation structures
         self.equiv_classes: EquivClasses
         self.cayley_table_states: CayleyTableStates
-        self.candidate_elements: set[ActionType] = set()
+        self.candidate_elements: list[ActionType] = []
 
         # Stats and logging
         self.logger = logger
@@ -102,6 +121,7 @@ class StatesCayleyGenerator:
             Exception: If generation fails for any reason
         """
         self._start_time = time.time()
+        self.world.reset_simulation_stats()
 
         try:
             self._initialize_structures()
@@ -169,7 +189,10 @@ class StatesCayleyGenerator:
         for a in self.min_actions:
             # Calculate: \hat{a} * w_{0}.
             a_outcome = generate_action_outcome(
-                action=a, initial_state=self.initial_state, world=self.world
+                action=a,
+                initial_state=self.initial_state,
+                world=self.world,
+                outcome_cache=self.outcome_cache,
             )
             for b in equiv_classes.get_labels():
                 # Calculate: b * w_{0}.
@@ -207,6 +230,7 @@ class StatesCayleyGenerator:
                     action=action,
                     initial_state=self.initial_state,
                     world=self.world,
+                    outcome_cache=self.outcome_cache,
                 )
                 cayley_table_states.data[row_label][col_label] = outcome
         return cayley_table_states
@@ -227,7 +251,7 @@ class StatesCayleyGenerator:
         self.logger.info("\n\tFinding new candidate elements...")
         start = time.time()
 
-        self.candidate_elements.clear()
+        candidates = set()
         row_labels = self.equiv_classes.get_labels()
         col_labels = self.equiv_classes.get_labels()
         processed_elements = self.equiv_classes.get_all_elements()
@@ -235,7 +259,11 @@ class StatesCayleyGenerator:
             for col_label in col_labels:
                 candidate = row_label + col_label
                 if candidate not in processed_elements:
-                    self.candidate_elements.add(candidate)
+                    candidates.add(candidate)
+        # In reverse, so that candidates are popped from the end in sort key order.
+        self.candidate_elements = sorted(
+            candidates, key=self._alphabet.sort_key, reverse=True
+        )
 
         count = len(self.candidate_elements)
         elapsed = time.time() - start
@@ -285,6 +313,7 @@ class StatesCayleyGenerator:
             initial_state=self.initial_state,
             world=self.world,
             take_first=True,
+            outcome_cache=self.outcome_cache,
         )
 
         if equiv_elements:
@@ -328,19 +357,44 @@ class StatesCayleyGenerator:
         Returns:
             EquivClasses: New equivalence classes created by breaking
         """
+        # Calculate: b_element * (candidate_element * w_{0}) for the elements of
+        #  every class that can break, in one batch if the world has a transition
+        #  array and no outcome cache is used.
+        candidate_outcomes = None
+        if self.outcome_cache is None and self.world.has_transition_array():
+            elements = [
+                element
+                for class_label in self.equiv_classes.get_labels()
+                if len(self.equiv_classes.get_class_elements(class_label)) > 1
+                for element in {
+                    class_label,
+                    *self.equiv_classes.get_class_elements(class_label),
+                }
+            ]
+            outcomes = generate_action_outcomes(
+                actions=[element + candidate_element for element in elements],
+                initial_state=self.initial_state,
+                world=self.world,
+            )
+            candidate_outcomes = dict(zip(elements, outcomes, strict=True))
+
         new_equiv_classes = EquivClasses()
         for class_label in self.equiv_classes.get_labels():
             # Check if candidate_element breaks the equiv class labelled by class_label.
             temp_new_equivs = self._check_if_equiv_class_broken(
                 candidate_element=candidate_element,
                 b_label=class_label,
+                candidate_outcomes=candidate_outcomes,
             )
             new_equiv_classes.merge_equiv_class_instances(temp_new_equivs)
 
         return new_equiv_classes
 
     def _check_if_equiv_class_broken(
-        self, candidate_element: ActionType, b_label: ActionType
+        self,
+        candidate_element: ActionType,
+        b_label: ActionType,
+        candidate_outcomes: dict[ActionType, StateType] | None = None,
     ) -> EquivClasses:
         """
         Check if a candidate breaks a specific equivalence class.
@@ -348,6 +402,8 @@ class StatesCayleyGenerator:
         Args:
             candidate_element: Action sequence to test
             b_label: Label of equivalence class to check
+            candidate_outcomes: Outcomes of element + candidate_element computed
+             in advance, by element
 
         Returns:
             EquivClasses: New classes if broken, empty if not
@@ -357,18 +413,17 @@ class StatesCayleyGenerator:
             return new_equiv_classes
 
         # Calculate: b_label * (candidate_element * w_{0}).
-        b_label_outcome = generate_action_outcome(
-            action=b_label + candidate_element,
-            initial_state=self.initial_state,
-            world=self.world,
+        b_label_outcome = self._get_candidate_outcome(
+            b_label, candidate_element, candidate_outcomes
         )
 
-        for b_element in self.equiv_classes.get_class_elements(b_label):
+        for b_element in sorted(
+            self.equiv_classes.get_class_elements(b_label),
+            key=self._alphabet.sort_key,
+        ):
             # Calculate: b_element * (candidate_element * w_{0}).
-            b_element_outcome = generate_action_outcome(
-                action=b_element + candidate_element,
-                initial_state=self.initial_state,
-                world=self.world,
+            b_element_outcome = self._get_candidate_outcome(
+                b_element, candidate_element, candidate_outcomes
             )
             # If b_label * (candidate_element * w_{0}) != b_element * (candidate_element
             # * w_{0}), then b_element should be in a different equiv class to b_label
@@ -376,10 +431,8 @@ class StatesCayleyGenerator:
             if b_label_outcome != b_element_outcome:
                 for c_label in new_equiv_classes.get_labels():
                     # Calculate: c_label * (candidate_element * w_{0}).
-                    c_outcome = generate_action_outcome(
-                        action=c_label + candidate_element,
-                        initial_state=self.initial_state,
-                        world=self.world,
+                    c_outcome = self._get_candidate_outcome(
+                        c_label, candidate_element, candidate_outcomes
                     )
 
                     # If b_element * (candidate_element * w_{0}) = c_label *
@@ -402,6 +455,22 @@ class StatesCayleyGenerator:
                     )
         return new_equiv_classes
 
+    def _get_candidate_outcome(
+        self,
+        element: ActionType,
+        candidate_element: ActionType,
+        candidate_outcomes: dict[ActionType, StateType] | None,
+    ) -> StateType:
+        """Return element * (candidate_element * w_{0}), looked up if computed."""
+        if candidate_outcomes is not None and element in candidate_outcomes:
+            return candidate_outcomes[element]
+        return generate_action_outcome(
+            action=element + candidate_element,
+            initial_state=self.initial_state,
+            world=self.world,
+            outcome_cache=self.outcome_cache,
+        )
+
     def _update_structures(
         self, candidate: ActionType, new_classes: EquivClasses
     ) -> None:
@@ -429,7 +498,10 @@ class StatesCayleyGenerator:
 
             # Create new class for candidate
             outcome = generate_action_outcome(
-                action=candidate, initial_state=self.initial_state, world=self.world
+                action=candidate,
+                initial_state=self.initial_state,
+                world=self.world,
+                outcome_cache=self.outcome_cache,
             )
             new_classes.create_new_class(
                 class_label=candidate,
@@ -440,7 +512,7 @@ class StatesCayleyGenerator:
             # Update structures
             self.equiv_classes.merge_equiv_class_instances(new_classes)
             self.cayley_table_states.add_equiv_classes(
-                new_classes, self.initial_state, self.world
+                new_classes, self.initial_state, self.world, self.outcome_cache
             )
         except Exception as e:
             raise ValueError(f"Failed to update structures: {e}") from e
@@ -485,6 +557,8 @@ class StatesCayleyGenerator:
         - Candidates added to existing classes
         - Number of classes broken
         - Total processing time
+        - Simulation steps skipped because an absorbing state was reached
+        - Outcome cache statistics, if a cache is used
         - Average processing rate
         """
         self.logger.info("\n\tGeneration completed successfully")
@@ -497,6 +571,20 @@ class StatesCayleyGenerator:
         )
         self.logger.info(f"\tTotal time: {self._stats['time']:.2f} seconds")
 
+        simulation_stats = self.world.get_simulation_stats()
+        self.logger.info(
+            "\tSimulation steps skipped (absorbing states):"
+            f" {simulation_stats['skipped_steps']}/{simulation_stats['steps']}"
+        )
+        if self.outcome_cache is not None:
+            cache_stats = ", ".join(
+                f"{key}: {round(value, 3)}"
+                for key, value in self.outcome_cache.get_stats().items()
+            )
+            self.logger.info(
+                f"\tOutcome cache ({type(self.outcome_cache).__name__}): {cache_stats}"
+            )
+
         rate = (
             self._stats["processed"] / self._stats["time"]
             if self._stats["time"] > 0
@@ -72,6 +72,10 @@ class LocalEquivClassGenerator(AFEquivClassGenerator):
 
         return self._initial_state
 
+    def _prepare_transition_array(self) -> None:
+        """Ensure the world has a transition array over states reachable from it."""
+        self._world.generate_reachable_transition_array([self._initial_state])
+
     def _compute_action_function(self, action: ActionType) -> ActionFunctionType:
         """
         Compute the action function for an action from the initial state only.
@@ -0,0 +1,75 @@
+"""
+Checks that importing the transformation algebra stays fast.
+
+Each run imports the module in a fresh interpreter, so that nothing is cached in
+ sys.modules. The best of several runs is compared with IMPORT_TIME_BUDGET_SECONDS,
+ and the heavy optional dependencies must not be imported at all, since they are
+ only needed for drawing and printing. Exits with a non-zero status if either check
+ fails.
+"""
+
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULE = "transformation_algebra.transformation_algebra"
+IMPORT_TIME_BUDGET_SECONDS = 0.5
+NUM_RUNS = 5
+LAZY_MODULES = ["pygraphviz", "pandas", "networkx", "matplotlib"]
+
+IMPORT_SNIPPET = f"""
+import sys
+import time
+
+start_time = time.perf_counter()
+import {MODULE}
+print(time.perf_counter() - start_time)
+print(",".join(m for m in {LAZY_MODULES!r} if m in sys.modules))
+"""
+
+
+def time_import() -> tuple[float, list[str]]:
+    """Import MODULE in a fresh interpreter.
+
+    Returns:
+        The import time in seconds, and the lazy modules that were imported
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_time, imported_modules = result.stdout.splitlines()[-2:]
+    return float(import_time), [m for m in imported_modules.split(",") if m]
+
+
+def main():
+    import_times = []
+    imported_modules: list[str] = []
+    for _ in range(NUM_RUNS):
+        import_time, imported_modules = time_import()
+        import_times.append(import_time)
+    best_time = min(import_times)
+
+    print(f"Import of {MODULE}:")
+    print(f"\tBest of {NUM_RUNS}: {best_time:.3f}s")
+    print(f"\tBudget: {IMPORT_TIME_BUDGET_SECONDS:.3f}s")
+
+    failed = False
+    if best_time > IMPORT_TIME_BUDGET_SECONDS:
+        print("Import time is over budget.")
+        failed = True
+    if imported_modules:
+        print(f"Lazily imported modules were imported: {imported_modules}")
+        failed = True
+    if not failed:
+        print("Import time is within budget.")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+from testing_helpers import apply_action_sequence
+from worlds.gridworlds2d.gridworld2d_walls import Gridworld2DWalls
+
+
+def make_world() -> Gridworld2DWalls:
+    return Gridworld2DWalls((2, 2), [(0.5, 0)], "masked")
+
+
+def test_absorbing_states_are_detected():
+    for generate_array in [False, True]:
+        world = make_world()
+        if generate_array:
+            world.generate_transition_array()
+        else:
+            world.generate_min_action_transformation_matrix()
+        assert world.is_absorbing_state((None,))
+        assert not world.is_absorbing_state((0, 0))
+
+
+def test_simulate_stops_at_absorbing_states():
+    for generate_array in [False, True]:
+        world = make_world()
+        if generate_array:
+            world.generate_transition_array()
+        else:
+            world.generate_min_action_transformation_matrix()
+
+        # E from (0, 0) runs into the wall, so the N and S before it are skipped.
+        world.reset_simulation_stats()
+        assert world.simulate((0, 0), "NSE") == (None,)
+        assert world.get_simulation_stats() == {
+            "sequences": 1,
+            "steps": 3,
+            "skipped_steps": 2,
+        }
+        assert list(world.iter_simulated_states((0, 0), "NSE")) == [(None,)]
+
+
+def test_apply_action_sequence_stops_at_absorbing_states():
+    world = make_world()
+    world.generate_min_action_transformation_matrix()
+    assert apply_action_sequence(world, (0, 0), "NSE") == (None,)
+    assert apply_action_sequence(world, (0, 0), "NS") == (0, 0)
+
+
+def main():
+    test_absorbing_states_are_detected()
+    test_simulate_stops_at_absorbing_states()
+    test_apply_action_sequence_stops_at_absorbing_states()
+    print("All absorbing state tests passed.")
+
+
+if __name__ == "__main__":
+    main()
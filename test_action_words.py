@@ -0,0 +1,103 @@
+import os
+import subprocess
+import sys
+
+from testing_helpers import (
+    assert_same_algebra,
+    generate_algebra,
+    get_world_factories,
+    make_action_sequences,
+)
+from transformation_algebra.utils.algebra_generation_methods import (
+    AlgebraGenerationMethod,
+)
+from utils.action_word import ActionAlphabet
+
+WORLD_FACTORIES = get_world_factories("gridworld2d", "graphworld3")
+
+# Prints the classes of a STATES_CAYLEY algebra, for runs under other hash seeds.
+STATES_CAYLEY_SNIPPET = """
+from testing_helpers import generate_algebra, get_classes
+from transformation_algebra.utils.algebra_generation_methods import (
+    AlgebraGenerationMethod,
+)
+from worlds.gridworlds2d.gridworld2d import Gridworld2D
+
+algebra = generate_algebra(
+    Gridworld2D((3, 4)), AlgebraGenerationMethod.STATES_CAYLEY, initial_state=(0, 0)
+)
+print(get_classes(algebra))
+"""
+
+
+def test_words_hash_and_sort_by_length_and_digits():
+    alphabet = ActionAlphabet(["N", "E", "S"])
+    action_sequences = ["", "S", "N", "EN", "NS", "SN", "NNN", "EEE"]
+    words = [alphabet.word(action_sequence) for action_sequence in action_sequences]
+    assert sorted(words) == [
+        alphabet.word(a) for a in ["", "N", "S", "NS", "EN", "SN", "NNN", "EEE"]
+    ]
+    assert sorted(action_sequences, key=alphabet.sort_key) == [
+        str(word) for word in sorted(words)
+    ]
+    for word in words:
+        assert hash(word) == hash((word.packed, len(word)))
+    # Words of different lengths may pack to the same integer.
+    assert alphabet.word("N") != alphabet.word("NN")
+    assert {alphabet.word("N"), alphabet.word("NN"), alphabet.word("N")} == {
+        alphabet.word("NN"),
+        alphabet.word("N"),
+    }
+
+
+def test_action_words_match_strings():
+    for make_world in WORLD_FACTORIES:
+        world = make_world()
+        world.generate_transition_array()
+        alphabet = ActionAlphabet(world.get_min_actions())
+        for action_sequence in make_action_sequences(world, 20):
+            assert str(alphabet.word(action_sequence)) == action_sequence
+
+        reference = generate_algebra(make_world())
+        algebra = generate_algebra(make_world(), use_action_words=True)
+        assert_same_algebra(algebra, reference)
+
+        initial_state = world.get_possible_states()[1]
+        reference = generate_algebra(
+            make_world(),
+            AlgebraGenerationMethod.STATES_CAYLEY,
+            initial_state=initial_state,
+        )
+        algebra = generate_algebra(
+            make_world(),
+            AlgebraGenerationMethod.STATES_CAYLEY,
+            initial_state=initial_state,
+            use_action_words=True,
+        )
+        assert_same_algebra(algebra, reference)
+
+
+def test_states_cayley_does_not_depend_on_hash_seed():
+    outputs = set()
+    for hash_seed in ["0", "1", "2"]:
+        result = subprocess.run(
+            [sys.executable, "-c", STATES_CAYLEY_SNIPPET],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            env={**os.environ, "PYTHONHASHSEED": hash_seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        outputs.add(result.stdout.splitlines()[-1])
+    assert len(outputs) == 1
+
+
+def main():
+    test_words_hash_and_sort_by_length_and_digits()
+    test_action_words_match_strings()
+    test_states_cayley_does_not_depend_on_hash_seed()
+    print("All action word tests passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import numpy as np
+
+from testing_helpers import get_world_factories, make_action_sequences
+from utils.action_word import ActionAlphabet
+
+WORLD_FACTORIES = get_world_factories()
+
+
+def test_compute_action_function_matches_simulate():
+    for make_world in WORLD_FACTORIES:
+        world = make_world()
+        world.generate_transition_array()
+        alphabet = ActionAlphabet(world.get_min_actions())
+        for action in make_action_sequences(world, 10):
+            action_function = world.compute_action_function(action)
+            assert action_function.tolist() == [
+                world.simulate_id(state_id, action)
+                for state_id in range(world.get_num_state_ids())
+            ]
+            assert np.array_equal(
+                world.compute_action_function(alphabet.word(action)), action_function
+            )
+
+
+def test_compute_action_function_on_some_states():
+    for make_world in WORLD_FACTORIES:
+        world = make_world()
+        world.generate_transition_array()
+        state_ids = np.arange(world.get_num_state_ids(), dtype=np.int32)[::2]
+        for action in make_action_sequences(world, 10):
+            assert np.array_equal(
+                world.compute_action_function(action, state_ids),
+                world.compute_action_function(action)[state_ids],
+            )
+
+
+def test_compute_action_function_needs_transition_array():
+    world = get_world_factories("gridworld2d")[0]()
+    world.generate_min_action_transformation_matrix()
+    try:
+        world.compute_action_function("N")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("An action function was computed without an array.")
+
+
+def main():
+    test_compute_action_function_matches_simulate()
+    test_compute_action_function_on_some_states()
+    test_compute_action_function_needs_transition_array()
+    print("All action function tests passed.")
+
+
+if __name__ == "__main__":
+    main()
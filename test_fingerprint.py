@@ -0,0 +1,85 @@
+from testing_helpers import get_world_factories
+from transformation_algebra.comparing_algebras.compare_generation_parameters import (
+    _compare_worlds,
+)
+from worlds.base_world import BaseWorld
+from worlds.gridworlds2d.gridworld2d import Gridworld2D
+from worlds.gridworlds2d.gridworld2d_consumable import Gridworld2DConsumable
+from worlds.gridworlds2d.gridworld2d_walls import Gridworld2DWalls
+
+WORLD_FACTORIES = get_world_factories(
+    "gridworld2d", "walls_masked", "consumable_packed", "graphworld3"
+)
+
+
+def forbid_state_enumeration(world: BaseWorld) -> None:
+    """Make the world fail if its possible states or next states are computed."""
+
+    def fail(*args):
+        raise AssertionError("The state space was enumerated.")
+
+    world.iter_possible_states = fail
+    world.generate_possible_states = fail
+    world.get_next_state = fail
+
+
+def test_fingerprint_ignores_state_ids():
+    # The reachable closure of (2, 1) is the whole grid, in another ID order.
+    world = Gridworld2D((3, 4))
+    world.generate_transition_array()
+    reachable_world = Gridworld2D((3, 4))
+    reachable_world.generate_reachable_transition_array([(2, 1)])
+    assert list(reachable_world._id_to_state) != list(world._id_to_state)
+
+    assert reachable_world.fingerprint() == world.fingerprint()
+    assert _compare_worlds(reachable_world, world) == []
+
+
+def test_fingerprint_matches_across_tables():
+    for make_world in WORLD_FACTORIES:
+        array_world = make_world()
+        array_world.generate_transition_array()
+        matrix_world = make_world()
+        matrix_world.generate_min_action_transformation_matrix()
+        assert not matrix_world.has_transition_array()
+        assert matrix_world.fingerprint() == array_world.fingerprint()
+        assert not matrix_world.has_transition_array()
+        assert make_world().fingerprint() == array_world.fingerprint()
+
+
+def test_fingerprint_of_reachable_world():
+    world = Gridworld2DConsumable((2, 2), [(0, 0)], "masked")
+    world.generate_reachable_transition_array([(0, 0, ())])
+    id_to_state = list(world._id_to_state)
+    forbid_state_enumeration(world)
+
+    fingerprint = world.fingerprint()
+    # The reachable table is hashed as it is, without building the full table.
+    assert list(world._id_to_state) == id_to_state
+    assert not world.is_transition_array_complete()
+    full_world = Gridworld2DConsumable((2, 2), [(0, 0)], "masked")
+    assert fingerprint != full_world.fingerprint()
+    assert _compare_worlds(world, full_world) != []
+
+    other_world = Gridworld2DConsumable((2, 2), [(0, 0)], "masked")
+    other_world.generate_reachable_transition_array([(1, 1, ())])
+    assert other_world.fingerprint() == fingerprint
+
+
+def test_fingerprint_distinguishes_worlds():
+    world = Gridworld2DWalls((3, 3), [(0.5, 0)], "masked")
+    other_world = Gridworld2DWalls((3, 3), [(0.5, 0)], "identity")
+    assert world.fingerprint() != other_world.fingerprint()
+    assert _compare_worlds(world, other_world) != []
+
+
+def main():
+    test_fingerprint_ignores_state_ids()
+    test_fingerprint_matches_across_tables()
+    test_fingerprint_of_reachable_world()
+    test_fingerprint_distinguishes_worlds()
+    print("All fingerprint tests passed.")
+
+
+if __name__ == "__main__":
+    main()
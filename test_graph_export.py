@@ -0,0 +1,152 @@
+import re
+import xml.etree.ElementTree as ET
+
+from testing_helpers import in_temporary_directory
+from worlds.base_world import BaseWorld
+from worlds.gridworlds2d.gridworld2d_walls import Gridworld2DWalls
+from worlds.utils.graph_export import SFDP_LAYOUT_HINT
+from worlds.utils.undefined_state import UNDEFINED_STATE_ID
+
+GRAPHML_NAMESPACE = {"g": "http://graphml.graphdrawing.org/xmlns"}
+DOT_NODE = re.compile(r'^  (\d+) \[label="[^"]*"\];$')
+DOT_EDGE = re.compile(r'^  (\d+) -> (\d+) \[color="#[0-9a-f]{6}"(, label="[^"]*")?\];$')
+
+
+def make_world() -> BaseWorld:
+    # The wall masks two moves, which lead to the undefined state.
+    world = Gridworld2DWalls((2, 3), [(0.5, 1)], "masked")
+    world.generate_transition_array()
+    return world
+
+
+def count_edges(world: BaseWorld, include_undefined_state: bool) -> int:
+    transition_array = world.get_transition_array()[1:]
+    if include_undefined_state:
+        return transition_array.size
+    return int((transition_array != UNDEFINED_STATE_ID).sum())
+
+
+def read_dot(path: str) -> tuple[list[int], list[tuple[int, int, bool]]]:
+    """Return the nodes and (source, target, is_labelled) edges of a DOT file."""
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert lines[0] == "digraph world {"
+    assert lines[-1] == "}"
+    nodes, edges = [], []
+    for line in lines[1:-1]:
+        if node_match := DOT_NODE.match(line):
+            nodes.append(int(node_match.group(1)))
+        elif edge_match := DOT_EDGE.match(line):
+            source, target, label = edge_match.groups()
+            edges.append((int(source), int(target), label is not None))
+        else:
+            assert re.match(r'^  \w+="[^"]*";$', line), line
+    return nodes, edges
+
+
+def read_graphml(path: str) -> tuple[list[str], list[tuple[str, str]], ET.Element]:
+    """Return the nodes, (source, target) edges and graph element of a GraphML file."""
+    graph = ET.parse(path).getroot().find("g:graph", GRAPHML_NAMESPACE)
+    assert graph is not None
+    nodes = [node.get("id") for node in graph.findall("g:node", GRAPHML_NAMESPACE)]
+    edges = [
+        (edge.get("source"), edge.get("target"))
+        for edge in graph.findall("g:edge", GRAPHML_NAMESPACE)
+    ]
+    return nodes, edges, graph
+
+
+def test_dot_export():
+    world = make_world()
+    with in_temporary_directory():
+        for include_undefined_state in [False, True]:
+            num_edges = world.export_graph("world.dot", include_undefined_state)
+            nodes, edges = read_dot("world.dot")
+            first_state_id = 0 if include_undefined_state else 1
+            assert nodes == list(range(first_state_id, world.get_num_state_ids()))
+            assert num_edges == len(edges)
+            assert num_edges == count_edges(world, include_undefined_state)
+            assert all(
+                source in nodes and target in nodes for source, target, _ in edges
+            )
+            assert all(is_labelled for _, _, is_labelled in edges)
+            assert (UNDEFINED_STATE_ID in {t for _, t, _ in edges}) == (
+                include_undefined_state
+            )
+
+
+def test_graphml_export():
+    world = make_world()
+    with in_temporary_directory():
+        for include_undefined_state in [False, True]:
+            num_edges = world.export_graph("world.graphml", include_undefined_state)
+            nodes, edges, _ = read_graphml("world.graphml")
+            first_state_id = 0 if include_undefined_state else 1
+            assert nodes == [
+                f"n{i}" for i in range(first_state_id, world.get_num_state_ids())
+            ]
+            assert num_edges == len(edges)
+            assert num_edges == count_edges(world, include_undefined_state)
+            assert all(source in nodes and target in nodes for source, target in edges)
+
+
+def test_export_options():
+    world = make_world()
+    with in_temporary_directory():
+        world.export_graph("world.gv", show_edge_labels=False, layout_hint=True)
+        _, edges = read_dot("world.gv")
+        assert not any(is_labelled for _, _, is_labelled in edges)
+        with open("world.gv", encoding="utf-8") as f:
+            dot = f.read()
+        for key, value in SFDP_LAYOUT_HINT.items():
+            assert f'  {key}="{value}";\n' in dot
+
+        world.export_graph("world.graphml", show_edge_labels=False, layout_hint=True)
+        _, _, graph = read_graphml("world.graphml")
+        graph_data = {
+            data.get("key"): data.text
+            for data in graph.findall("g:data", GRAPHML_NAMESPACE)
+        }
+        assert graph_data == SFDP_LAYOUT_HINT
+        edge_keys = {
+            data.get("key")
+            for data in graph.findall("g:edge/g:data", GRAPHML_NAMESPACE)
+        }
+        assert edge_keys == {"color"}
+
+
+def test_export_colors_follow_action_color_map():
+    world = make_world()
+    color_map = world.get_action_color_map()
+    assert set(color_map) == set(world.get_min_actions())
+    with in_temporary_directory():
+        world.export_graph("world.graphml")
+        _, _, graph = read_graphml("world.graphml")
+        for edge in graph.findall("g:edge", GRAPHML_NAMESPACE):
+            data = {
+                d.get("key"): d.text for d in edge.findall("g:data", GRAPHML_NAMESPACE)
+            }
+            assert data["color"] == color_map[data["action"]]
+
+
+def test_unsupported_suffix_is_rejected():
+    with in_temporary_directory():
+        try:
+            make_world().export_graph("world.png")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("A graph was exported to an unsupported file.")
+
+
+def main():
+    test_dot_export()
+    test_graphml_export()
+    test_export_options()
+    test_export_colors_follow_action_color_map()
+    test_unsupported_suffix_is_rejected()
+    print("All graph export tests passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import os
+import tempfile
+
+import numpy as np
+
+from testing_helpers import assert_same_transitions
+from worlds.base_world import BaseWorld
+from worlds.graphworlds.graphworld import (
+    GraphWorld,
+    load_graph_world,
+    load_graph_world_csr,
+)
+from worlds.graphworlds.graphworld1 import GraphWorld1
+from worlds.graphworlds.graphworld3 import GraphWorld3
+from worlds.utils.undefined_state import UndefinedStates
+
+
+def get_edge_list(reference: BaseWorld) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the edges of a world whose states are 1-tuples of consecutive ints."""
+    states = reference.generate_possible_states()
+    index_of = {state: i for i, state in enumerate(states)}
+    edges = [
+        (
+            index_of[state],
+            min_action,
+            index_of[reference.get_next_state(state, min_action)],
+        )
+        for state in states
+        for min_action in reference.get_min_actions()
+    ]
+    sources, action_labels, targets = zip(*edges, strict=True)
+    return np.array(sources), np.array(action_labels), np.array(targets)
+
+
+def test_csr_worlds_match_graph_worlds():
+    for reference in [GraphWorld1(), GraphWorld3()]:
+        states = reference.generate_possible_states()
+        to_reference = {(i,): state for i, state in enumerate(states)}
+        edges = get_edge_list(reference)
+
+        world = GraphWorld.from_edge_list(edges, reference.get_min_actions())
+        assert_same_transitions(world, reference, to_reference)
+
+        # The same edges as integer action labels, in CSR form.
+        sources, action_labels, targets = edges
+        order = np.argsort(sources, kind="stable")
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(sources))])
+        action_indices = np.array(
+            [reference.get_min_actions().index(a) for a in action_labels[order]]
+        )
+        world = GraphWorld(
+            indptr, targets[order], action_indices, reference.get_min_actions()
+        )
+        assert_same_transitions(world, reference, to_reference)
+
+
+def test_graph_world_files():
+    reference = GraphWorld3()
+    states = reference.generate_possible_states()
+    to_reference = {(i,): state for i, state in enumerate(states)}
+    sources, action_labels, targets = get_edge_list(reference)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        edge_list_path = os.path.join(tmp_dir, "edges.txt")
+        with open(edge_list_path, "w") as f:
+            for edge in zip(sources, action_labels, targets, strict=True):
+                f.write(" ".join(map(str, edge)) + "\n")
+        world = load_graph_world(edge_list_path, reference.get_min_actions())
+        assert_same_transitions(world, reference, to_reference)
+
+        action_indices = np.array(
+            [reference.get_min_actions().index(a) for a in action_labels]
+        )
+        edge_array_path = os.path.join(tmp_dir, "edges.npy")
+        np.save(edge_array_path, np.stack([sources, action_indices, targets], axis=1))
+        world = load_graph_world(edge_array_path, reference.get_min_actions())
+        assert_same_transitions(world, reference, to_reference)
+
+        paths = [os.path.join(tmp_dir, f"{name}.npy") for name in "abc"]
+        order = np.argsort(sources, kind="stable")
+        np.save(paths[0], np.concatenate([[0], np.cumsum(np.bincount(sources))]))
+        np.save(paths[1], targets[order])
+        np.save(paths[2], action_indices[order])
+        world = load_graph_world_csr(*paths, reference.get_min_actions())
+        assert_same_transitions(world, reference, to_reference)
+
+
+def test_missing_edges_follow_undefined_action_strategy():
+    edges = (np.array([0]), np.array(["a"]), np.array([1]))
+    masked_world = GraphWorld.from_edge_list(edges, ["a", "b"], num_states=2)
+    identity_world = GraphWorld.from_edge_list(
+        edges, ["a", "b"], num_states=2, undefined_action_strategy="identity"
+    )
+    for world in [masked_world, identity_world]:
+        assert world.get_next_state((0,), "a") == (1,)
+    assert masked_world.get_next_state((0,), "b") == UndefinedStates.BASIC.value
+    assert identity_world.get_next_state((0,), "b") == (0,)
+
+
+def test_vectorized_table_ignores_stored_undefined_state():
+    world = GraphWorld.from_edge_list(
+        get_edge_list(GraphWorld3()), GraphWorld3().get_min_actions()
+    )
+    world.generate_min_action_transformation_matrix()
+    states, transition_array = world._build_transition_array_vectorized()
+    assert len(states) == len(transition_array)
+    assert states[0] == UndefinedStates.BASIC.value
+    assert UndefinedStates.BASIC.value not in states[1:]
+
+
+def main():
+    test_csr_worlds_match_graph_worlds()
+    test_graph_world_files()
+    test_missing_edges_follow_undefined_action_strategy()
+    test_vectorized_table_ignores_stored_undefined_state()
+    print("All graph world tests passed.")
+
+
+if __name__ == "__main__":
+    main()
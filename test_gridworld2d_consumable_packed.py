@@ -0,0 +1,89 @@
+from testing_helpers import generate_algebra
+from worlds.gridworlds2d.gridworld2d_consumable import Gridworld2DConsumable
+from worlds.utils.undefined_state import UndefinedStates
+
+# (grid_shape, consumable_positions, consume_strategy) of the worlds compared.
+CONFIGURATIONS = [
+    ((2, 2), [(0, 0), (1, 1)], "masked"),
+    ((2, 3), [(0, 0), (1, 2), (0, 2)], "identity"),
+    ((3, 2), [(1, 1), (1, 1)], "masked"),
+]
+
+
+def make_worlds(configuration):
+    return (
+        Gridworld2DConsumable(*configuration),
+        Gridworld2DConsumable(*configuration, state_encoding="packed"),
+    )
+
+
+def decode(world: Gridworld2DConsumable, state):
+    if state == UndefinedStates.BASIC.value:
+        return state
+    return world.decode_state(state)
+
+
+def test_encode_decode_round_trip():
+    for configuration in CONFIGURATIONS:
+        tuple_world, packed_world = make_worlds(configuration)
+        tuple_states = tuple_world.generate_possible_states()
+        packed_states = packed_world.generate_possible_states()
+        assert len(packed_states) == len(tuple_states)
+        assert packed_world.count_possible_states() == len(tuple_states)
+        for state in tuple_states:
+            packed_state = packed_world.encode_state(state)
+            assert packed_state in packed_states
+            assert packed_world.decode_state(packed_state) == state
+
+
+def test_packed_transitions_match_tuple_transitions():
+    for configuration in CONFIGURATIONS:
+        tuple_world, packed_world = make_worlds(configuration)
+        for state in tuple_world.generate_possible_states():
+            packed_state = packed_world.encode_state(state)
+            for min_action in tuple_world.get_min_actions():
+                next_state = tuple_world.get_next_state(state, min_action)
+                packed_next_state = packed_world.get_next_state(
+                    packed_state, min_action
+                )
+                assert decode(packed_world, packed_next_state) == next_state
+
+
+def test_packed_transition_array_matches_tuple_transition_array():
+    for configuration in CONFIGURATIONS:
+        tuple_world, packed_world = make_worlds(configuration)
+        tuple_world.generate_transition_array()
+        packed_world.generate_transition_array()
+        tuple_array = tuple_world.get_transition_array()
+        for packed_id, row in enumerate(packed_world.get_transition_array()):
+            state = decode(packed_world, packed_world.id_to_state(packed_id))
+            tuple_row = tuple_array[tuple_world.state_to_id(state)]
+            assert [
+                decode(packed_world, packed_world.id_to_state(next_id))
+                for next_id in row
+            ] == tuple_world.ids_to_states(tuple_row)
+
+
+def test_packed_algebra_matches_tuple_algebra():
+    for configuration in CONFIGURATIONS[:2]:
+        tuple_algebra, packed_algebra = [
+            generate_algebra(world) for world in make_worlds(configuration)
+        ]
+        assert tuple_algebra.equiv_classes.data.keys() == (
+            packed_algebra.equiv_classes.data.keys()
+        )
+        assert tuple_algebra.cayley_table_actions.data == (
+            packed_algebra.cayley_table_actions.data
+        )
+
+
+def main():
+    test_encode_decode_round_trip()
+    test_packed_transitions_match_tuple_transitions()
+    test_packed_transition_array_matches_tuple_transition_array()
+    test_packed_algebra_matches_tuple_algebra()
+    print("All packed consumable tests passed.")
+
+
+if __name__ == "__main__":
+    main()
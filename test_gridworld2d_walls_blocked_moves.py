@@ -0,0 +1,77 @@
+import pickle
+
+import numpy as np
+
+from worlds.gridworlds2d.gridworld2d_walls import Gridworld2DWalls
+
+WORLD_ARGS = [
+    ((3, 3), [(0.5, 0), (1.0, 1.5)], "masked"),
+    ((3, 3), [(0.5, 0), (1.0, 1.5)], "identity"),
+    ((2, 3), [(-0.5, 1), (1.0, 2.5)], "masked"),
+    ((4, 2), [(1.5, 0), (2.5, 1)], "identity"),
+]
+
+
+def test_walls_block_moves():
+    world = Gridworld2DWalls((3, 3), [(0.5, 0), (-0.5, 2)], "masked")
+    assert world.get_next_state((0, 0), "E") == (None,)
+    assert world.get_next_state((1, 0), "W") == (None,)
+    assert world.get_next_state((0, 0), "N") == (0, 1)
+    assert world.get_next_state((1, 1), "E") == (2, 1)
+    # The wall on the left edge also blocks wrapping around from the right edge.
+    assert world.get_next_state((0, 2), "W") == (None,)
+    assert world.get_next_state((2, 2), "E") == (None,)
+
+    world = Gridworld2DWalls((3, 3), [(0.5, 0)], "identity")
+    assert world.get_next_state((0, 0), "E") == (0, 0)
+    assert world.get_next_state((1, 0), "W") == (1, 0)
+
+
+def test_blocked_directions_array():
+    world = Gridworld2DWalls((2, 3), [(0.5, 1)], "masked")
+    blocked_directions = world._blocked_directions
+    assert blocked_directions.dtype == bool
+    assert blocked_directions.shape == (6, 5)
+    # Cells (0, 1) and (1, 1) are rows 1 and 4; columns are 1, N, S, E, W.
+    assert np.argwhere(blocked_directions).tolist() == [[1, 3], [4, 4]]
+
+
+def test_vectorized_matches_get_next_state():
+    for args in WORLD_ARGS:
+        world = Gridworld2DWalls(*args)
+        states, transition_array = world._build_transition_array_vectorized()
+        for state_id, state in enumerate(states[1:], start=1):
+            for j, min_action in enumerate(world.get_min_actions()):
+                next_state = world.get_next_state(state, min_action)
+                assert states[transition_array[state_id, j]] == next_state
+
+
+def test_unpickled_bitmask_world_is_recompiled():
+    world = Gridworld2DWalls(*WORLD_ARGS[0])
+    world.generate_transition_array()
+    # Worlds pickled with per-cell bitmasks of the blocked directions.
+    pickled_state = dict(world.__getstate__())
+    pickled_state["_blocked_directions"] = {(0, 0): 4}
+    old_world = Gridworld2DWalls.__new__(Gridworld2DWalls)
+    old_world.__setstate__(pickled_state)
+    assert np.array_equal(old_world._blocked_directions, world._blocked_directions)
+
+    loaded_world = pickle.loads(pickle.dumps(world))
+    assert np.array_equal(loaded_world._blocked_directions, world._blocked_directions)
+    for state in world.get_possible_states():
+        for min_action in world.get_min_actions():
+            assert loaded_world.get_next_state(state, min_action) == (
+                world.get_next_state(state, min_action)
+            )
+
+
+def main():
+    test_walls_block_moves()
+    test_blocked_directions_array()
+    test_vectorized_matches_get_next_state()
+    test_unpickled_bitmask_world_is_recompiled()
+    print("All Gridworld2DWalls blocked move tests passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import numpy as np
+
+from testing_helpers import (
+    assert_array_matches_matrix,
+    generate_algebra,
+    get_cayley_table,
+    get_classes,
+)
+from transformation_algebra.utils.algebra_generation_methods import (
+    AlgebraGenerationMethod,
+)
+from worlds.gridworldsnd.gridworld_nd import GridworldND
+
+# Axes of size 1 and 2, where forward and backward moves coincide, and of size 3.
+SHAPES = [(4,), (2, 3), (1, 3, 2), (2, 1, 3, 2)]
+
+
+def test_vectorized_array_matches_get_next_state():
+    for shape in SHAPES:
+        world = GridworldND(shape)
+        world.generate_transition_array()
+        assert_array_matches_matrix(world, lambda: GridworldND(shape))
+
+
+def test_moves_wrap_around():
+    shape = (2, 3)
+    world = GridworldND(shape)
+    for coordinates, min_action, next_coordinates in [
+        ((1, 2), "B", (1, 0)),
+        ((1, 0), "b", (1, 2)),
+        ((1, 1), "A", (0, 1)),
+        ((1, 1), "a", (0, 1)),
+        ((1, 1), "1", (1, 1)),
+    ]:
+        state = int(np.ravel_multi_index(coordinates, shape))
+        assert world.get_next_state(state, min_action) == np.ravel_multi_index(
+            next_coordinates, shape
+        )
+
+
+def get_cayley_table_of_functions(world, algebra) -> dict:
+    """Return the Cayley table of an algebra, with classes named by action function.
+
+    The generation methods may label a class by different elements, so classes are
+     compared through their action functions.
+    """
+    to_function = {}
+    for label, elements in get_classes(algebra).items():
+        to_function[label] = tuple(world.compute_action_function(label))
+        for element in elements:
+            assert tuple(world.compute_action_function(element)) == to_function[label]
+    return {
+        (to_function[row], to_function[column]): to_function[product]
+        for row, entries in get_cayley_table(algebra).items()
+        for column, product in entries.items()
+    }
+
+
+def test_methods_generate_the_same_algebra():
+    for shape in [(4,), (2, 3)]:
+        tables = []
+        for method in AlgebraGenerationMethod:
+            world = GridworldND(shape)
+            world.generate_transition_array()
+            algebra = generate_algebra(world, method, initial_state=0)
+            tables.append(get_cayley_table_of_functions(world, algebra))
+        assert all(table == tables[0] for table in tables)
+
+
+def main():
+    test_vectorized_array_matches_get_next_state()
+    test_moves_wrap_around()
+    test_methods_generate_the_same_algebra()
+    print("All GridworldND tests passed.")
+
+
+if __name__ == "__main__":
+    main()
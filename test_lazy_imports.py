@@ -0,0 +1,17 @@
+from scripts.benchmark_import_time import LAZY_MODULES, time_import
+
+
+def test_optional_dependencies_are_not_imported():
+    _, imported_modules = time_import()
+    assert imported_modules == [], (
+        f"Importing the algebra imported {imported_modules} of {LAZY_MODULES}."
+    )
+
+
+def main():
+    test_optional_dependencies_are_not_imported()
+    print("All lazy import tests passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+from testing_helpers import assert_cache_matches_simulate, get_world_factories
+from utils.outcome_cache import LRUOutcomeCache, SuffixTrieOutcomeCache
+
+WORLD_FACTORIES = get_world_factories("gridworld2d", "walls_masked", "graphworld3")
+
+
+def test_outcomes_match_simulate():
+    for make_cache in [
+        LRUOutcomeCache,
+        lambda: LRUOutcomeCache(max_entries=5),
+        lambda: LRUOutcomeCache(max_bytes=1000, inner=SuffixTrieOutcomeCache()),
+    ]:
+        assert_cache_matches_simulate(make_cache, WORLD_FACTORIES)
+
+
+def test_lru_counters():
+    world = WORLD_FACTORIES[0]()
+    world.generate_transition_array()
+    cache = LRUOutcomeCache(max_entries=2)
+    for action in ["N", "E", "N", "S", "E"]:
+        cache.get_outcome(action, (0, 0), world)
+    stats = cache.get_stats()
+    assert stats["entries"] == cache.max_entries
+    assert {key: stats[key] for key in ["hits", "misses", "evictions"]} == {
+        "hits": 1,
+        "misses": 4,
+        "evictions": 2,
+    }
+
+    cache = LRUOutcomeCache(inner=SuffixTrieOutcomeCache())
+    for action in ["NE", "SNE", "NE"]:
+        cache.get_outcome(action, (0, 0), world)
+    stats = cache.get_stats()
+    assert stats["inner_lookups"] == stats["misses"]
+    assert stats["inner_cached_steps"] == len("NE")
+
+    cache.clear()
+    stats = cache.get_stats()
+    assert stats["entries"] == stats["bytes"] == stats["hits"] == 0
+    assert stats["inner_nodes"] == stats["inner_lookups"] == 0
+
+
+def test_lru_rejects_invalid_budgets():
+    for budgets in [{"max_entries": 0}, {"max_bytes": -1}]:
+        try:
+            LRUOutcomeCache(**budgets)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"Invalid budgets {budgets} were accepted.")
+
+
+def main():
+    test_outcomes_match_simulate()
+    test_lru_counters()
+    test_lru_rejects_invalid_budgets()
+    print("All LRU outcome cache tests passed.")
+
+
+if __name__ == "__main__":
+    main()
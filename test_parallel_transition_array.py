@@ -0,0 +1,33 @@
+import numpy as np
+
+from testing_helpers import get_world_factories
+
+# Worlds without a vectorised build, so that next states are computed in workers.
+WORLD_FACTORIES = get_world_factories(
+    "consumable", "consumable_packed", "graphworld1", "graphworld3"
+)
+
+
+def test_parallel_matches_serial_build():
+    for make_world in WORLD_FACTORIES:
+        # Worlds with a vectorised build never compute next states in workers.
+        parallel_world = make_world()
+        if parallel_world._build_transition_array_vectorized() is not None:
+            continue
+        parallel_world.generate_transition_array(num_workers=2)
+        world = make_world()
+        world.generate_min_action_transformation_matrix()
+        world.generate_transition_array()
+        assert list(parallel_world._id_to_state) == list(world._id_to_state)
+        assert np.array_equal(
+            parallel_world.get_transition_array(), world.get_transition_array()
+        )
+
+
+def main():
+    test_parallel_matches_serial_build()
+    print("All parallel transition array tests passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+import contextlib
+import io
+
+from testing_helpers import assert_same_algebra, generate_algebra
+from transformation_algebra.product_algebra import generate_product_algebra
+from worlds.graphworlds.graphworld3 import GraphWorld3
+from worlds.gridworlds2d.gridworld2d import Gridworld2D
+from worlds.gridworlds2d.gridworld2d_walls import Gridworld2DWalls
+from worlds.product_world import ProductWorld
+from worlds.utils.undefined_state import UndefinedStates
+
+
+def hold_b_at_a_start(state, min_action, next_state):
+    """Keep the second component still while the first is at state ID 1."""
+    if state[0] == 1:
+        return (next_state[0], state[1])
+    return next_state
+
+
+def make_product_world() -> ProductWorld:
+    return ProductWorld(
+        Gridworld2D((2, 2)), Gridworld2DWalls((2, 2), [(0.5, 0)], "masked")
+    )
+
+
+def test_product_algebra_matches_product_world():
+    for make_world_a, make_world_b in [
+        (lambda: Gridworld2D((2, 3)), lambda: Gridworld2D((2, 2))),
+        (
+            lambda: Gridworld2D((2, 2)),
+            lambda: Gridworld2DWalls((2, 2), [(0.5, 0)], "identity"),
+        ),
+    ]:
+        reference = generate_algebra(ProductWorld(make_world_a(), make_world_b()))
+        with contextlib.redirect_stdout(io.StringIO()):
+            algebra = generate_product_algebra(
+                generate_algebra(make_world_a()), generate_algebra(make_world_b())
+            )
+        assert_same_algebra(algebra, reference)
+
+
+def test_product_transitions_match_components():
+    world = make_product_world()
+    world_a, world_b = world.get_component_worlds()
+    for state in world.generate_possible_states():
+        state_a, state_b = world.to_component_states(state)
+        for min_action in world.get_min_actions():
+            next_state_a, next_state_b = world.to_component_states(
+                world.get_next_state(state, min_action)
+            )
+            for component_world, component_state, next_component_state in [
+                (world_a, state_a, next_state_a),
+                (world_b, state_b, next_state_b),
+            ]:
+                if component_state == UndefinedStates.BASIC.value:
+                    assert next_component_state == component_state
+                else:
+                    assert next_component_state == (
+                        component_world.get_next_state(component_state, min_action)
+                    )
+
+
+def test_vectorized_matches_get_next_state():
+    world = make_product_world()
+    states, transition_array = world._build_transition_array_vectorized()
+    for state_id, state in enumerate(states[1:], start=1):
+        for j, min_action in enumerate(world.get_min_actions()):
+            next_state = world.get_next_state(state, min_action)
+            assert states[transition_array[state_id, j]] == next_state
+
+
+def test_coupling():
+    world_a, world_b = Gridworld2D((2, 2)), Gridworld2D((2, 3))
+    world = ProductWorld(world_a, world_b, hold_b_at_a_start, "hold_b_at_a_start")
+    assert world._build_transition_array_vectorized() is None
+    world.generate_transition_array()
+    uncoupled_world = ProductWorld(world_a, world_b)
+    for state in world.generate_possible_states():
+        for min_action in world.get_min_actions():
+            assert world.simulate(state, min_action) == hold_b_at_a_start(
+                state, min_action, uncoupled_world.get_next_state(state, min_action)
+            )
+
+
+def test_couplings_are_keyed_by_name():
+    world_a, world_b = Gridworld2D((2, 2)), Gridworld2D((2, 3))
+    try:
+        ProductWorld(world_a, world_b, hold_b_at_a_start)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("A coupling without a name was accepted.")
+
+    configuration_keys = [
+        ProductWorld(world_a, world_b, coupling, name).get_configuration_key()
+        for coupling, name in [
+            (lambda state, min_action, next_state: next_state, "identity"),
+            (lambda state, min_action, next_state: state, "frozen"),
+            (hold_b_at_a_start, "frozen"),
+        ]
+    ]
+    assert configuration_keys[0] != configuration_keys[1] == configuration_keys[2]
+    assert ProductWorld(world_a, world_b).get_configuration_key() not in (
+        configuration_keys
+    )
+
+
+def test_get_next_state_id():
+    world = GraphWorld3()
+    try:
+        world.get_next_state_id(1, world.get_min_actions()[0])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("A next state ID was found without a transition array.")
+
+    world.generate_transition_array()
+    transition_array = world.get_transition_array()
+    for state_id in range(world.get_num_state_ids()):
+        for j, min_action in enumerate(world.get_min_actions()):
+            next_state_id = world.get_next_state_id(state_id, min_action)
+            assert type(next_state_id) is int
+            assert next_state_id == transition_array[state_id, j]
+    try:
+        world.get_next_state_id(1, "X")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("An invalid action was accepted.")
+
+
+def test_components_must_share_min_actions():
+    try:
+        ProductWorld(Gridworld2D((2, 2)), GraphWorld3())
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Worlds with different minimum actions were combined.")
+
+
+def main():
+    test_product_algebra_matches_product_world()
+    test_product_transitions_match_components()
+    test_vectorized_matches_get_next_state()
+    test_coupling()
+    test_couplings_are_keyed_by_name()
+    test_get_next_state_id()
+    test_components_must_share_min_actions()
+    print("All product world tests passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+from testing_helpers import (
+    apply_action_sequence,
+    assert_array_matches_matrix,
+    generate_algebra,
+    make_action_sequences,
+)
+from transformation_algebra.utils.algebra_generation_methods import (
+    AlgebraGenerationMethod,
+)
+from worlds.base_world import BaseWorld
+from worlds.gridworlds2d.gridworld2d import Gridworld2D
+from worlds.gridworlds2d.gridworld2d_consumable import Gridworld2DConsumable
+
+
+def count_next_state_calls(world: BaseWorld) -> list[int]:
+    """Count the world's get_next_state calls in the returned one-item list."""
+    num_calls = [0]
+    get_next_state = world.get_next_state
+
+    def counting_get_next_state(state, min_action):
+        num_calls[0] += 1
+        return get_next_state(state, min_action)
+
+    world.get_next_state = counting_get_next_state
+    return num_calls
+
+
+def test_reachable_transition_array():
+    world = Gridworld2DConsumable((2, 2), [(0, 0)], "masked")
+    world.generate_reachable_transition_array([(0, 0, ())])
+    assert not world.is_transition_array_complete()
+    reachable_states = set(world.ids_to_states(range(world.get_num_state_ids())))
+    assert reachable_states == {(None,)} | {
+        (x, y, ()) for x in range(2) for y in range(2)
+    }
+    assert world.simulate((0, 0, ()), "NE") == (1, 1, ())
+
+    # The dictionary matrix covers every possible state, not just reachable ones.
+    matrix = world.get_min_action_transformation_matrix()
+    assert set(matrix) == {(None,), *world.iter_possible_states()}
+    world.generate_transition_array()
+    assert world.is_transition_array_complete()
+    assert_array_matches_matrix(
+        world, lambda: Gridworld2DConsumable((2, 2), [(0, 0)], "masked")
+    )
+    assert world.simulate((0, 0, ((0, 0),)), "C") == (0, 0, ())
+
+
+def test_complete_matrix_is_kept_after_reachable_build():
+    # The reachable closure covers every state, so the array is as large as the
+    #  complete dictionary matrix.
+    world = Gridworld2D((3, 4))
+    world.generate_min_action_transformation_matrix()
+    num_calls = count_next_state_calls(world)
+    world.generate_reachable_transition_array([(0, 0)])
+    assert world.get_num_state_ids() == len(
+        world.get_min_action_transformation_matrix()
+    )
+
+    for action_sequence in make_action_sequences(world, 10):
+        apply_action_sequence(world, (1, 1), action_sequence)
+        world.simulate((1, 1), action_sequence)
+    for _ in range(3):
+        world.get_min_action_transformation_matrix()
+    assert num_calls[0] == 0
+
+
+def test_matrix_is_built_once_after_reachable_build():
+    world = Gridworld2D((3, 4))
+    num_calls = count_next_state_calls(world)
+    world.generate_reachable_transition_array([(0, 0)])
+    num_reachable_calls = num_calls[0]
+    assert num_reachable_calls > 0
+
+    for _ in range(3):
+        matrix = world.get_min_action_transformation_matrix()
+    assert set(matrix) == {(None,), *world.iter_possible_states()}
+    assert num_calls[0] == num_reachable_calls + (len(matrix) - 1) * len(
+        world.get_min_actions()
+    )
+
+
+def test_states_cayley_reuses_complete_matrix():
+    world = Gridworld2D((2, 3))
+    world.generate_min_action_transformation_matrix()
+    num_calls = count_next_state_calls(world)
+    generate_algebra(world, AlgebraGenerationMethod.STATES_CAYLEY, initial_state=(0, 0))
+    assert num_calls[0] == 0
+
+
+def main():
+    test_reachable_transition_array()
+    test_complete_matrix_is_kept_after_reachable_build()
+    test_matrix_is_built_once_after_reachable_build()
+    test_states_cayley_reuses_complete_matrix()
+    print("All reachable transition array tests passed.")
+
+
+if __name__ == "__main__":
+    main()
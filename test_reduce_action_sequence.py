@@ -0,0 +1,66 @@
+import random
+
+import numpy as np
+
+from testing_helpers import generate_algebra, get_world_factories
+
+WORLD_FACTORIES = get_world_factories("gridworld2d", "consumable", "graphworld3")
+
+
+def test_elements_reduce_to_their_class():
+    for make_world in WORLD_FACTORIES:
+        for use_action_words in [False, True]:
+            algebra = generate_algebra(make_world(), use_action_words=use_action_words)
+            equiv_classes = algebra.equiv_classes
+            for label, equiv_class in equiv_classes.data.items():
+                for element in equiv_class["elements"]:
+                    assert (
+                        equiv_classes.reduce_action_sequence(
+                            element, algebra.cayley_table_actions
+                        )
+                        == label
+                    )
+
+
+def test_sequences_reduce_to_their_action_function():
+    rng = random.Random(0)
+    for make_world in WORLD_FACTORIES:
+        world = make_world()
+        world.generate_transition_array()
+        algebra = generate_algebra(world)
+        min_actions = world.get_min_actions()
+        for _ in range(50):
+            action_sequence = "".join(
+                rng.choice(min_actions) for _ in range(rng.randint(1, 12))
+            )
+            label = algebra.equiv_classes.reduce_action_sequence(
+                action_sequence, algebra.cayley_table_actions
+            )
+            assert np.array_equal(
+                world.compute_action_function(label),
+                world.compute_action_function(action_sequence),
+            )
+
+
+def test_invalid_sequences_are_rejected():
+    algebra = generate_algebra(WORLD_FACTORIES[0]())
+    for action_sequence in ["", "NX"]:
+        try:
+            algebra.equiv_classes.reduce_action_sequence(
+                action_sequence, algebra.cayley_table_actions
+            )
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"'{action_sequence}' was reduced.")
+
+
+def main():
+    test_elements_reduce_to_their_class()
+    test_sequences_reduce_to_their_action_function()
+    test_invalid_sequences_are_rejected()
+    print("All reduce_action_sequence tests passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+from testing_helpers import (
+    apply_action_sequence,
+    get_world_factories,
+    make_action_sequences,
+)
+from utils.action_word import ActionAlphabet
+from worlds.base_world import BaseWorld
+
+WORLD_FACTORIES = get_world_factories(
+    "gridworld2d", "walls_masked", "block", "consumable", "graphworld3"
+)
+
+# Attributes missing from worlds pickled before the array-backed transition table,
+#  the wall masks and the packed consumable encoding existed.
+NEW_ATTRIBUTES = [
+    "_state_to_id",
+    "_id_to_state",
+    "_min_action_to_index",
+    "_column_of_code",
+    "_transition_array",
+    "_transition_array_reachable_only",
+    "_transition_flat",
+    "_absorbing_states",
+    "_is_absorbing_id",
+    "_simulation_stats",
+    "_memory_budget_bytes",
+    "_memory_budget_action",
+    "_fingerprint",
+    "_blocked_directions",
+    "_STATE_ENCODING",
+    "_num_consumables",
+    "_consumable_bits_by_index",
+]
+
+
+def test_simulate_matches_apply_action_sequence():
+    for make_world in WORLD_FACTORIES:
+        reference = make_world()
+        reference.generate_min_action_transformation_matrix()
+        world = make_world()
+        world.generate_transition_array()
+        alphabet = ActionAlphabet(world.get_min_actions())
+        for state in reference.get_possible_states():
+            for action_sequence in make_action_sequences(world, 20):
+                outcome = apply_action_sequence(reference, state, action_sequence)
+                assert reference.simulate(state, action_sequence) == outcome
+                assert world.simulate(state, action_sequence) == outcome
+                assert world.simulate(state, alphabet.word(action_sequence)) == outcome
+
+
+def unpickle_old_world(world: BaseWorld) -> BaseWorld:
+    """Restore a world as pickle would from an old pickle of it."""
+    state = {
+        name: value
+        for name, value in world.__dict__.items()
+        if name not in NEW_ATTRIBUTES
+    }
+    old_world = type(world).__new__(type(world))
+    old_world.__setstate__(state)
+    return old_world
+
+
+def test_simulate_old_pickled_worlds():
+    for make_world in WORLD_FACTORIES:
+        reference = make_world()
+        reference.generate_min_action_transformation_matrix()
+        world = make_world()
+        world.generate_min_action_transformation_matrix()
+        old_world = unpickle_old_world(world)
+        for state in reference.generate_possible_states():
+            for min_action in reference.get_min_actions():
+                assert old_world.get_next_state(state, min_action) == (
+                    reference.get_next_state(state, min_action)
+                )
+            for action_sequence in make_action_sequences(reference, 5):
+                outcome = apply_action_sequence(reference, state, action_sequence)
+                assert old_world.simulate(state, action_sequence) == outcome
+        assert old_world.fingerprint() == reference.fingerprint()
+
+
+def main():
+    test_simulate_matches_apply_action_sequence()
+    test_simulate_old_pickled_worlds()
+    print("All simulation tests passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+from testing_helpers import (
+    apply_action_sequence,
+    get_world_factories,
+    make_action_sequences,
+)
+from utils.action_word import ActionAlphabet
+
+WORLD_FACTORIES = get_world_factories(
+    "gridworld2d", "walls_masked", "block", "consumable", "graphworld3"
+)
+
+
+def test_simulate_batch_matches_apply_action_sequence():
+    for make_world in WORLD_FACTORIES:
+        reference = make_world()
+        reference.generate_min_action_transformation_matrix()
+        world = make_world()
+        world.generate_transition_array()
+        alphabet = ActionAlphabet(world.get_min_actions())
+        states = reference.get_possible_states()
+        action_sequences = make_action_sequences(world, 10 * len(states))
+        initial_states = [states[i % len(states)] for i in range(len(action_sequences))]
+        outcomes = [
+            apply_action_sequence(reference, state, action_sequence)
+            for state, action_sequence in zip(initial_states, action_sequences)
+        ]
+
+        state_ids = world.states_to_ids(initial_states)
+        for batch in [action_sequences, [alphabet.word(a) for a in action_sequences]]:
+            outcome_ids = world.simulate_batch(state_ids, batch)
+            assert world.ids_to_states(outcome_ids) == outcomes
+
+        # A single state ID is used for every sequence.
+        outcome_ids = world.simulate_batch(state_ids[0], action_sequences)
+        assert world.ids_to_states(outcome_ids) == [
+            world.simulate(initial_states[0], a) for a in action_sequences
+        ]
+
+
+def test_simulate_batch_rejects_invalid_actions():
+    world = WORLD_FACTORIES[0]()
+    world.generate_transition_array()
+    for action_sequences in [["NX"], ["Né"]]:
+        try:
+            world.simulate_batch(1, action_sequences)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Invalid actions were not rejected.")
+
+
+def main():
+    test_simulate_batch_matches_apply_action_sequence()
+    test_simulate_batch_rejects_invalid_actions()
+    print("All batch simulation tests passed.")
+
+
+if __name__ == "__main__":
+    main()
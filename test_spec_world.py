@@ -0,0 +1,91 @@
+import json
+import os
+
+from testing_helpers import assert_same_transitions, in_temporary_directory
+from worlds.graphworlds.graphworld1 import GraphWorld1
+from worlds.graphworlds.graphworld3 import GraphWorld3
+from worlds.specworlds.spec_world import SpecWorld, load_spec_world
+
+SPEC_EXAMPLES_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "worlds", "specworlds", "examples"
+)
+
+
+def test_spec_worlds_match_graph_worlds():
+    for file_name, reference in [
+        ("graphworld1.toml", GraphWorld1()),
+        ("graphworld3.json", GraphWorld3()),
+    ]:
+        world = load_spec_world(os.path.join(SPEC_EXAMPLES_DIR, file_name))
+        assert_same_transitions(world, reference)
+
+        world.generate_transition_array()
+        reference.generate_transition_array()
+        assert world.fingerprint() == reference.fingerprint()
+
+
+def test_spec_rules_match_transitions():
+    transitions_spec = {
+        "min_actions": ["1", "a", "b"],
+        "states": [1, 2, 3],
+        "transitions": {"1": [1, 2, 3], "a": [2, 3, 1], "b": [3, 3, 3]},
+    }
+    rules_spec = {
+        "min_actions": ["1", "a", "b"],
+        "states": [1, 2, 3],
+        "rules": {
+            "1": {"rule": "identity"},
+            "a": {"rule": "shift", "offset": 1},
+            "b": {"rule": "constant", "state": 3},
+        },
+    }
+    assert_same_transitions(SpecWorld(rules_spec), SpecWorld(transitions_spec))
+
+
+def test_invalid_specs_are_rejected():
+    rules = {"a": {"rule": "shift", "offset": 1}}
+    for spec, field in [
+        ({"min_actions": ["a"], "num_states": 0, "rules": rules}, "num_states"),
+        ({"min_actions": ["a"], "num_states": -2}, "num_states"),
+        ({"min_actions": ["a"], "num_states": "3"}, "num_states"),
+        ({"min_actions": ["a"], "num_states": True}, "num_states"),
+        ({"min_actions": ["a"], "states": [], "rules": rules}, "states"),
+        ({"min_actions": ["a"], "states": [1], "num_states": 1}, "num_states"),
+        ({"min_actions": ["a", "a"], "num_states": 2}, "min_actions"),
+        ({"min_actions": ["a"], "num_states": 2, "colour": "red"}, "colour"),
+        ({"min_actions": ["a"], "num_states": 2, "rules": {"a": {}}}, "rule"),
+        (
+            {"min_actions": ["a"], "num_states": 2, "transitions": {"a": [1]}},
+            "Transitions",
+        ),
+    ]:
+        try:
+            SpecWorld(spec)
+        except ValueError as error:
+            assert field in str(error), str(error)
+        else:
+            raise AssertionError(f"Invalid spec {spec} was accepted.")
+
+
+def test_invalid_spec_file_is_rejected():
+    with in_temporary_directory():
+        with open("empty.json", "w") as f:
+            json.dump({"min_actions": ["a"], "num_states": 0}, f)
+        try:
+            load_spec_world("empty.json")
+        except ValueError as error:
+            assert "num_states" in str(error)
+        else:
+            raise AssertionError("A spec without states was loaded.")
+
+
+def main():
+    test_spec_worlds_match_graph_worlds()
+    test_spec_rules_match_transitions()
+    test_invalid_specs_are_rejected()
+    test_invalid_spec_file_is_rejected()
+    print("All spec world tests passed.")
+
+
+if __name__ == "__main__":
+    main()
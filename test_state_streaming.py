@@ -0,0 +1,76 @@
+import warnings
+
+from testing_helpers import get_world_factories
+from utils.errors import MemoryBudgetExceededError
+from worlds.gridworlds2d.gridworld2d import Gridworld2D
+from worlds.gridworlds2d.gridworld2d_consumable import Gridworld2DConsumable
+
+WORLD_FACTORIES = get_world_factories()
+
+
+def test_streamed_states_match_generated_states():
+    for make_world in WORLD_FACTORIES:
+        world = make_world()
+        states = list(world.iter_possible_states())
+        assert states == world.generate_possible_states()
+        assert world.count_possible_states() == len(states)
+
+
+def test_memory_budget():
+    world = Gridworld2D((3, 4))
+    world.set_memory_budget(world.estimate_transition_table_bytes(5))
+    try:
+        world.generate_transition_array()
+    except MemoryBudgetExceededError:
+        pass
+    else:
+        raise AssertionError("The memory budget was not enforced.")
+    assert not world.has_transition_array()
+
+    world.set_memory_budget(world.estimate_transition_table_bytes())
+    world.generate_transition_array()
+    assert world.is_transition_array_complete()
+
+
+def test_memory_budget_warning():
+    world = Gridworld2D((3, 4))
+    world.set_memory_budget(world.estimate_transition_table_bytes(5), "warn")
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        warnings.simplefilter("always")
+        world.generate_transition_array()
+    assert len(caught_warnings) == 1
+    assert world.is_transition_array_complete()
+
+
+def test_memory_budget_limits_reachable_states():
+    world = Gridworld2DConsumable((2, 2), [(0, 0)], "masked")
+    world.set_memory_budget(world.estimate_transition_table_bytes(3))
+    try:
+        world.generate_reachable_transition_array([(0, 0, ((0, 0),))])
+    except MemoryBudgetExceededError:
+        pass
+    else:
+        raise AssertionError("The memory budget was not enforced.")
+    assert not world.has_transition_array()
+
+
+def test_invalid_budget_action_is_rejected():
+    try:
+        Gridworld2D((3, 4)).set_memory_budget(1000, "ignore")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("An invalid budget action was accepted.")
+
+
+def main():
+    test_streamed_states_match_generated_states()
+    test_memory_budget()
+    test_memory_budget_warning()
+    test_memory_budget_limits_reachable_states()
+    test_invalid_budget_action_is_rejected()
+    print("All state streaming tests passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+from testing_helpers import (
+    assert_cache_matches_simulate,
+    get_world_factories,
+    make_action_sequences,
+)
+from utils.outcome_cache import SuffixTrieOutcomeCache
+
+WORLD_FACTORIES = get_world_factories("gridworld2d", "walls_masked", "graphworld3")
+
+
+def test_outcomes_match_simulate():
+    for make_cache in [
+        SuffixTrieOutcomeCache,
+        lambda: SuffixTrieOutcomeCache(max_nodes=10),
+    ]:
+        assert_cache_matches_simulate(make_cache, WORLD_FACTORIES)
+
+
+def test_suffix_trie_counters():
+    world = WORLD_FACTORIES[0]()
+    world.generate_transition_array()
+    action_sequences = make_action_sequences(world, 50, max_length=5)
+    cache = SuffixTrieOutcomeCache()
+    world.reset_simulation_stats()
+    num_simulated_sequences = 0
+    for action_sequence in action_sequences:
+        simulated_steps = cache.get_stats()["simulated_steps"]
+        cache.get_outcome(action_sequence, (0, 0), world)
+        if cache.get_stats()["simulated_steps"] > simulated_steps:
+            num_simulated_sequences += 1
+
+    stats = cache.get_stats()
+    assert stats["lookups"] == len(action_sequences)
+    assert stats["cached_steps"] + stats["simulated_steps"] == sum(
+        len(action_sequence) for action_sequence in action_sequences
+    )
+    assert stats["nodes"] == stats["simulated_steps"]
+    assert 0 < stats["hit_rate"] < 1
+    # The trie simulates each uncached prefix as one sequence of the world.
+    world_stats = world.get_simulation_stats()
+    assert world_stats["sequences"] == num_simulated_sequences
+    assert world_stats["steps"] == stats["simulated_steps"]
+
+    # A repeated sequence is followed entirely in the trie.
+    cache.get_outcome(action_sequences[-1], (0, 0), world)
+    assert cache.get_stats()["cached_steps"] == (
+        stats["cached_steps"] + len(action_sequences[-1])
+    )
+    assert world.get_simulation_stats() == world_stats
+
+    max_nodes = 4
+    cache = SuffixTrieOutcomeCache(max_nodes=max_nodes)
+    for action_sequence in action_sequences:
+        cache.get_outcome(action_sequence, (0, 0), world)
+    assert cache.get_stats()["nodes"] == max_nodes
+
+
+def main():
+    test_outcomes_match_simulate()
+    test_suffix_trie_counters()
+    print("All suffix trie cache tests passed.")
+
+
+if __name__ == "__main__":
+    main()
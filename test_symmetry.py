@@ -0,0 +1,92 @@
+import numpy as np
+
+from testing_helpers import assert_same_algebra, generate_algebra
+from worlds.gridworlds2d.gridworld2d import Gridworld2D
+from worlds.gridworlds2d.gridworld2d_block import Gridworld2DBlock
+from worlds.gridworlds2d.gridworld2d_consumable import Gridworld2DConsumable
+from worlds.gridworlds2d.gridworld2d_walls import Gridworld2DWalls
+from worlds.utils.symmetry import (
+    detect_state_symmetry,
+    find_automorphism_group,
+    is_automorphism,
+)
+
+
+def test_symmetry_matches_direct_generation():
+    for make_world in [
+        lambda: Gridworld2D((3, 3)),
+        lambda: Gridworld2DBlock((2, 2)),
+        lambda: Gridworld2DConsumable((2, 2), [(0, 0)], "masked"),
+    ]:
+        reference = generate_algebra(make_world())
+        algebra = generate_algebra(make_world(), use_symmetry=True)
+        assert_same_algebra(algebra, reference)
+
+
+def test_automorphism_groups():
+    for world, group_order in [
+        (Gridworld2D((3, 3)), 9),
+        (Gridworld2D((2, 3)), 6),
+        (Gridworld2DBlock((2, 2)), 4),
+        # The wall breaks the translations along x, but not along y.
+        (Gridworld2DWalls((3, 3), [(0.5, 0), (0.5, 1), (0.5, 2)], "masked"), 3),
+        (Gridworld2DWalls((3, 3), [(0.5, 0)], "masked"), 1),
+    ]:
+        world.generate_transition_array()
+        group = find_automorphism_group(world)
+        assert len(group) == group_order
+        assert np.array_equal(group[0], np.arange(world.get_num_state_ids()))
+        transition_array = world.get_transition_array()
+        assert all(is_automorphism(transition_array, g) for g in group)
+
+
+def test_is_automorphism_rejects_invalid_permutations():
+    world = Gridworld2D((2, 2))
+    world.generate_transition_array()
+    transition_array = world.get_transition_array()
+    identity = np.arange(len(transition_array))
+    swap_undefined = identity.copy()
+    swap_undefined[[0, 1]] = [1, 0]
+    not_bijective = identity.copy()
+    not_bijective[2] = 1
+    for permutation in [swap_undefined, not_bijective, identity[:-1]]:
+        assert not is_automorphism(transition_array, permutation)
+
+
+def test_action_functions_on_representatives():
+    world = Gridworld2DBlock((2, 3))
+    world.generate_transition_array()
+    symmetry = detect_state_symmetry(world)
+    assert len(symmetry.representatives) < world.get_num_state_ids()
+    for left_action, right_action in [("N", "E"), ("NS", "W1"), ("NNE", "S")]:
+        left_action_function = world.compute_action_function(left_action)
+        right_action_function = world.compute_action_function(right_action)
+        for action_function in [left_action_function, right_action_function]:
+            assert np.array_equal(
+                symmetry.reconstruct_action_function(
+                    symmetry.restrict_action_function(action_function)
+                ),
+                action_function,
+            )
+        composed = symmetry.compose_action_functions(
+            symmetry.restrict_action_function(left_action_function),
+            symmetry.restrict_action_function(right_action_function),
+        )
+        assert np.array_equal(
+            composed,
+            symmetry.restrict_action_function(
+                world.compute_action_function(left_action + right_action)
+            ),
+        )
+
+
+def main():
+    test_symmetry_matches_direct_generation()
+    test_automorphism_groups()
+    test_is_automorphism_rejects_invalid_permutations()
+    test_action_functions_on_representatives()
+    print("All symmetry tests passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import numpy as np
+
+from testing_helpers import (
+    assert_array_matches_matrix,
+    get_world_factories,
+    in_temporary_directory,
+)
+from worlds.gridworlds2d.gridworld2d_walls import Gridworld2DWalls
+
+WORLD_FACTORIES = get_world_factories(
+    "gridworld2d",
+    "walls_masked",
+    "walls_identity",
+    "block",
+    "consumable",
+    "consumable_packed",
+    "graphworld1",
+)
+
+
+def test_cached_matches_built():
+    with in_temporary_directory():
+        for make_world in WORLD_FACTORIES:
+            world = make_world()
+            world.generate_transition_array(use_cache=True)
+            cached_world = make_world()
+            assert cached_world._load_cached_transition_array()
+            assert list(cached_world._id_to_state) == list(world._id_to_state)
+            assert np.array_equal(
+                cached_world.get_transition_array(), world.get_transition_array()
+            )
+            assert_array_matches_matrix(cached_world, make_world)
+
+
+def test_cache_hit_skips_next_states():
+    with in_temporary_directory():
+        for make_world in WORLD_FACTORIES:
+            make_world().generate_transition_array(use_cache=True)
+            cached_world = make_world()
+
+            def get_next_state(state, min_action):
+                raise AssertionError("A next state was computed on a cache hit.")
+
+            cached_world.get_next_state = get_next_state
+            cached_world.generate_transition_array(use_cache=True)
+            assert cached_world.is_transition_array_complete()
+
+
+def test_cache_is_keyed_by_configuration():
+    with in_temporary_directory():
+        world = Gridworld2DWalls((3, 3), [(0.5, 0)], "masked")
+        world.generate_transition_array(use_cache=True)
+        for other_world in [
+            Gridworld2DWalls((3, 3), [(0.5, 0)], "identity"),
+            Gridworld2DWalls((3, 3), [(1.0, 1.5)], "masked"),
+            Gridworld2DWalls((2, 3), [(0.5, 0)], "masked"),
+        ]:
+            assert other_world.get_configuration_key() != (
+                world.get_configuration_key()
+            )
+            assert not other_world._load_cached_transition_array()
+        same_world = Gridworld2DWalls((3, 3), [(0.5, 0)], "masked")
+        assert same_world._load_cached_transition_array()
+
+
+def main():
+    test_cached_matches_built()
+    test_cache_hit_skips_next_states()
+    test_cache_is_keyed_by_configuration()
+    print("All transition cache tests passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import pickle
+
+import numpy as np
+
+from testing_helpers import (
+    assert_array_matches_matrix,
+    get_world_factories,
+    make_action_sequences,
+)
+from worlds.base_world import BaseWorld
+
+WORLD_FACTORIES = get_world_factories(
+    "gridworld2d",
+    "walls_masked",
+    "walls_identity",
+    "block",
+    "consumable",
+    "consumable_packed",
+    "graphworld1",
+)
+
+
+def make_worlds() -> list[BaseWorld]:
+    return [make_world() for make_world in WORLD_FACTORIES]
+
+
+def test_transition_array_matches_matrix():
+    for make_world in WORLD_FACTORIES:
+        world = make_world()
+        world.generate_transition_array()
+        assert world.is_transition_array_complete()
+        assert_array_matches_matrix(world, make_world)
+
+
+def test_transition_array_from_matrix():
+    for make_world in WORLD_FACTORIES:
+        world = make_world()
+        world.generate_min_action_transformation_matrix()
+        world.generate_transition_array()
+        assert_array_matches_matrix(world, make_world)
+
+
+def test_matrix_from_transition_array():
+    for world in make_worlds():
+        world.generate_transition_array()
+        matrix = world.get_min_action_transformation_matrix()
+        for state, transitions in matrix.items():
+            for min_action, next_state in transitions.items():
+                assert world.simulate(state, min_action) == next_state
+
+
+def test_simulation_views_the_array():
+    for world in make_worlds():
+        world.generate_transition_array()
+        transition_array = world.get_transition_array()
+        # Simulation reads the array itself, not a copy of its rows or columns.
+        assert np.shares_memory(np.asarray(world._transition_flat), transition_array)
+        for state_id in range(world.get_num_state_ids()):
+            for j, min_action in enumerate(world.get_min_actions()):
+                assert (
+                    world.get_next_state_id(state_id, min_action)
+                    == (transition_array[state_id, j])
+                )
+
+
+def test_pickled_world_round_trip():
+    for world in make_worlds():
+        world.generate_transition_array()
+        loaded_world = pickle.loads(pickle.dumps(world))
+        assert np.array_equal(
+            loaded_world.get_transition_array(), world.get_transition_array()
+        )
+        for state in world.get_possible_states():
+            for action_sequence in make_action_sequences(world, 5):
+                assert loaded_world.simulate(state, action_sequence) == (
+                    world.simulate(state, action_sequence)
+                )
+
+        # Worlds pickled with row and column copies of the array drop them.
+        state = world.__getstate__()
+        state["_transition_rows"] = world.get_transition_array().tolist()
+        state["_transition_columns"] = list(world.get_transition_array().T)
+        old_world = type(world).__new__(type(world))
+        old_world.__setstate__(state)
+        assert not hasattr(old_world, "_transition_rows")
+        assert not hasattr(old_world, "_transition_columns")
+        action_sequence = "".join(world.get_min_actions())
+        assert np.array_equal(
+            old_world.compute_action_function(action_sequence),
+            world.compute_action_function(action_sequence),
+        )
+
+
+def main():
+    test_transition_array_matches_matrix()
+    test_transition_array_from_matrix()
+    test_matrix_from_transition_array()
+    test_simulation_views_the_array()
+    test_pickled_world_round_trip()
+    print("All transition table tests passed.")
+
+
+if __name__ == "__main__":
+    main()
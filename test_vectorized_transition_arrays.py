@@ -0,0 +1,60 @@
+from collections.abc import Callable
+
+import numpy as np
+
+from worlds.base_world import BaseWorld
+from worlds.gridworlds2d.gridworld2d import Gridworld2D
+from worlds.gridworlds2d.gridworld2d_block import Gridworld2DBlock
+
+WORLD_FACTORIES: list[Callable[[], BaseWorld]] = [
+    lambda: Gridworld2D((3, 4)),
+    lambda: Gridworld2D((1, 5)),
+    lambda: Gridworld2DBlock((3, 3)),
+    lambda: Gridworld2DBlock((2, 4)),
+]
+
+
+def test_vectorized_matches_per_state_build():
+    for make_world in WORLD_FACTORIES:
+        world = make_world()
+        vectorized = world._build_transition_array_vectorized()
+        assert vectorized is not None
+        states, transition_array = vectorized
+        world.generate_min_action_transformation_matrix()
+        world.generate_transition_array()
+        assert list(states) == list(world._id_to_state)
+        assert np.array_equal(transition_array, world.get_transition_array())
+
+
+def test_vectorized_matches_get_next_state():
+    for make_world in WORLD_FACTORIES:
+        world = make_world()
+        states, transition_array = world._build_transition_array_vectorized()
+        assert transition_array.dtype == np.int32
+        assert (transition_array[0] == 0).all()
+        for state_id, state in enumerate(states[1:], start=1):
+            for j, min_action in enumerate(world.get_min_actions()):
+                next_state = world.get_next_state(state, min_action)
+                assert states[transition_array[state_id, j]] == next_state
+
+
+def test_vectorized_ignores_stored_undefined_state():
+    for make_world in WORLD_FACTORIES:
+        world = make_world()
+        # Generating the dictionary matrix stores the undefined state among the
+        #  possible states.
+        world.generate_min_action_transformation_matrix()
+        states, transition_array = world._build_transition_array_vectorized()
+        assert len(states) == len(transition_array) == len(set(states))
+        assert states == list(make_world()._build_transition_array_vectorized()[0])
+
+
+def main():
+    test_vectorized_matches_per_state_build()
+    test_vectorized_matches_get_next_state()
+    test_vectorized_ignores_stored_undefined_state()
+    print("All vectorized transition array tests passed.")
+
+
+if __name__ == "__main__":
+    main()
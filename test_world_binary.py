@@ -0,0 +1,75 @@
+import os
+
+from testing_helpers import (
+    get_world_factories,
+    in_temporary_directory,
+    make_action_sequences,
+)
+from worlds.world_saver import (
+    BINARY_STATES_ARRAY_FILE,
+    BINARY_STATES_ORDER_FILE,
+    BINARY_STATES_PICKLE_FILE,
+)
+
+WORLD_FACTORIES = get_world_factories(
+    "walls_masked", "consumable", "consumable_packed", "gridworld_nd", "graphworld1"
+)
+
+
+def test_binary_round_trip():
+    with in_temporary_directory():
+        for i, make_world in enumerate(WORLD_FACTORIES):
+            path = f"world_{i}"
+            world = make_world()
+            world.save_world_binary(path)
+            loaded_world = make_world()
+            loaded_world.load_world_binary(path)
+
+            save_dir = os.path.join("saved", "worlds", path)
+            saved_as_array = os.path.exists(
+                os.path.join(save_dir, BINARY_STATES_ARRAY_FILE)
+            )
+            assert saved_as_array != os.path.exists(
+                os.path.join(save_dir, BINARY_STATES_PICKLE_FILE)
+            )
+            assert saved_as_array == os.path.exists(
+                os.path.join(save_dir, BINARY_STATES_ORDER_FILE)
+            )
+
+            assert loaded_world.get_min_actions() == world.get_min_actions()
+            assert loaded_world.fingerprint() == world.fingerprint()
+            for state in [(None,), *world.generate_possible_states()]:
+                assert loaded_world.state_to_id(state) == world.state_to_id(state)
+            for state in world.generate_possible_states():
+                for action_sequence in make_action_sequences(world, 5):
+                    assert loaded_world.simulate(state, action_sequence) == (
+                        world.simulate(state, action_sequence)
+                    )
+
+
+def test_binary_load_rejects_unknown_states():
+    with in_temporary_directory():
+        for make_world, state in [
+            (WORLD_FACTORIES[0], (5, 5)),
+            (WORLD_FACTORIES[2], (0, 0, 5)),
+            (WORLD_FACTORIES[3], (99,)),
+        ]:
+            make_world().save_world_binary("world")
+            loaded_world = make_world()
+            loaded_world.load_world_binary("world")
+            try:
+                loaded_world.state_to_id(state)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"Unknown state {state} was given an ID.")
+
+
+def main():
+    test_binary_round_trip()
+    test_binary_load_rejects_unknown_states()
+    print("All binary world tests passed.")
+
+
+if __name__ == "__main__":
+    main()
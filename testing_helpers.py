@@ -0,0 +1,190 @@
+"""
+Worlds and helpers shared by the test modules.
+
+Tests take fresh worlds from the factories in WORLD_FACTORIES, so that each test
+ builds its own transition tables.
+"""
+
+import contextlib
+import io
+import os
+import random
+import tempfile
+from collections.abc import Callable, Iterator
+
+import numpy as np
+
+from transformation_algebra.transformation_algebra import TransformationAlgebra
+from transformation_algebra.utils.algebra_generation_methods import (
+    AlgebraGenerationMethod,
+)
+from utils.action_word import ActionAlphabet
+from utils.outcome_cache import OutcomeCache
+from utils.type_definitions import ActionType, StateType
+from worlds.base_world import BaseWorld
+from worlds.graphworlds.graphworld1 import GraphWorld1
+from worlds.graphworlds.graphworld3 import GraphWorld3
+from worlds.gridworlds2d.gridworld2d import Gridworld2D
+from worlds.gridworlds2d.gridworld2d_block import Gridworld2DBlock
+from worlds.gridworlds2d.gridworld2d_consumable import Gridworld2DConsumable
+from worlds.gridworlds2d.gridworld2d_walls import Gridworld2DWalls
+from worlds.gridworldsnd.gridworld_nd import GridworldND
+from worlds.utils.undefined_state import UndefinedStates
+
+WORLD_FACTORIES: dict[str, Callable[[], BaseWorld]] = {
+    "gridworld2d": lambda: Gridworld2D((3, 4)),
+    "walls_masked": lambda: Gridworld2DWalls((3, 3), [(0.5, 0), (1.0, 1.5)], "masked"),
+    "walls_identity": lambda: Gridworld2DWalls((2, 3), [(0.5, 1)], "identity"),
+    "block": lambda: Gridworld2DBlock((3, 3)),
+    "consumable": lambda: Gridworld2DConsumable((2, 3), [(0, 0), (1, 2)], "masked"),
+    "consumable_packed": lambda: Gridworld2DConsumable(
+        (2, 3), [(0, 0), (1, 2)], "identity", "packed"
+    ),
+    "gridworld_nd": lambda: GridworldND((2, 3, 2)),
+    "graphworld1": GraphWorld1,
+    "graphworld3": GraphWorld3,
+}
+
+
+def get_world_factories(*names: str) -> list[Callable[[], BaseWorld]]:
+    """Return the factories of the named worlds, or of every world."""
+    return [WORLD_FACTORIES[name] for name in names or WORLD_FACTORIES]
+
+
+def make_action_sequences(
+    world: BaseWorld, num_sequences: int, max_length: int = 8
+) -> list[str]:
+    """Return random action sequences over the world's minimum actions."""
+    rng = random.Random(0)
+    min_actions = world.get_min_actions()
+    return [
+        "".join(rng.choice(min_actions) for _ in range(rng.randint(0, max_length)))
+        for _ in range(num_sequences)
+    ]
+
+
+def apply_action_sequence(
+    world: BaseWorld, state: StateType, action_sequence: ActionType
+) -> StateType:
+    """Return the outcome of an action sequence through set_state and get_state."""
+    world.set_state(state)
+    world.apply_action_sequence(action_sequence)
+    return world.get_state()
+
+
+def assert_array_matches_matrix(
+    world: BaseWorld, make_world: Callable[[], BaseWorld]
+) -> None:
+    """Check a world's transition array against a dictionary matrix built afresh."""
+    reference = make_world()
+    reference.generate_min_action_transformation_matrix()
+    matrix = reference.get_min_action_transformation_matrix()
+
+    transition_array = world.get_transition_array()
+    assert transition_array.dtype == np.int32
+    assert world.get_num_state_ids() == len(matrix)
+    assert world.id_to_state(0) == (None,)
+    for state, transitions in matrix.items():
+        state_id = world.state_to_id(state)
+        for min_action, next_state in transitions.items():
+            column = world.min_action_to_index(min_action)
+            assert world.id_to_state(transition_array[state_id, column]) == next_state
+
+
+def assert_same_transitions(
+    world: BaseWorld, reference: BaseWorld, to_reference: dict | None = None
+) -> None:
+    """Check that two worlds have the same transitions, up to a renaming of states.
+
+    to_reference maps the states of world to those of reference (the identity by
+     default).
+    """
+    if to_reference is None:
+        to_reference = {s: s for s in reference.generate_possible_states()}
+    to_reference = {
+        **to_reference,
+        UndefinedStates.BASIC.value: UndefinedStates.BASIC.value,
+    }
+    assert world.get_min_actions() == reference.get_min_actions()
+    assert {to_reference[s] for s in world.generate_possible_states()} == set(
+        reference.generate_possible_states()
+    )
+    for state in world.generate_possible_states():
+        for min_action in world.get_min_actions():
+            assert to_reference[world.get_next_state(state, min_action)] == (
+                reference.get_next_state(to_reference[state], min_action)
+            )
+
+
+def assert_cache_matches_simulate(
+    make_cache: Callable[[], OutcomeCache],
+    world_factories: list[Callable[[], BaseWorld]],
+) -> None:
+    """Check a cache's outcomes against simulate, with and without transition arrays.
+
+    Every action sequence is looked up both as a string and as an ActionWord.
+    """
+    for make_world in world_factories:
+        for generate_array in [False, True]:
+            world = make_world()
+            if generate_array:
+                world.generate_transition_array()
+            else:
+                world.generate_min_action_transformation_matrix()
+            alphabet = ActionAlphabet(world.get_min_actions())
+            action_sequences = make_action_sequences(world, 50, max_length=5)
+            cache = make_cache()
+            for state in world.get_possible_states():
+                for action_sequence in action_sequences:
+                    outcome = world.simulate(state, action_sequence)
+                    assert cache.get_outcome(action_sequence, state, world) == outcome
+                    action_word = alphabet.word(action_sequence)
+                    assert cache.get_outcome(action_word, state, world) == outcome
+
+
+def generate_algebra(
+    world: BaseWorld,
+    method: AlgebraGenerationMethod = AlgebraGenerationMethod.ACTION_FUNCTION,
+    **kwargs,
+) -> TransformationAlgebra:
+    """Generate the algebra of a world, without printing progress."""
+    algebra = TransformationAlgebra("test")
+    with contextlib.redirect_stdout(io.StringIO()):
+        algebra.generate(world=world, method=method, **kwargs)
+    return algebra
+
+
+def get_classes(algebra: TransformationAlgebra) -> dict[str, list[str]]:
+    """Return each class label with its sorted elements, with actions as strings."""
+    return {
+        str(label): sorted(str(element) for element in equiv_class["elements"])
+        for label, equiv_class in algebra.equiv_classes.data.items()
+    }
+
+
+def get_cayley_table(algebra: TransformationAlgebra) -> dict[str, dict[str, str]]:
+    """Return the actions Cayley table, with actions as strings."""
+    return {
+        str(row): {str(column): str(product) for column, product in entries.items()}
+        for row, entries in algebra.cayley_table_actions.data.items()
+    }
+
+
+def assert_same_algebra(
+    algebra: TransformationAlgebra, reference: TransformationAlgebra
+) -> None:
+    """Check that two algebras have the same classes and actions Cayley table."""
+    assert get_classes(algebra) == get_classes(reference)
+    assert get_cayley_table(algebra) == get_cayley_table(reference)
+
+
+@contextlib.contextmanager
+def in_temporary_directory() -> Iterator[str]:
+    """Run the body in a new temporary working directory, for files under ./saved."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.chdir(tmp_dir)
+        try:
+            yield tmp_dir
+        finally:
+            os.chdir(cwd)
@@ -32,21 +32,7 @@ def compare_generation_parameters(
             f" {world2.__class__.__name__}"
         )
     else:
-        # Compare world attributes that affect algebra generation
-        world_attrs_to_check = [
-            "_MIN_ACTIONS",
-            "_possible_states",
-            "_min_action_transformation_matrix",
-        ]
-        for attr in world_attrs_to_check:
-            val1 = getattr(world1, attr, None)
-            val2 = getattr(world2, attr, None)
-            if val1 != val2:
-                differences.append(
-                    f"World {attr} differs:\n"
-                    f"- First algebra: {val1}\n"
-                    f"- Second algebra: {val2}"
-                )
+        differences.extend(_compare_worlds(world1, world2))
 
     # Compare initial states
     initial_state1 = params1.get("initial_state")
@@ -78,6 +64,26 @@ def compare_generation_parameters(
     return True, "Generation parameters are identical"
 
 
+def _compare_worlds(world1, world2) -> list[str]:
+    """
+    Compare the transitions of two worlds of the same type.
+
+    Worlds are compared by fingerprint (see BaseWorld.fingerprint), which avoids
+     walking and printing their state spaces.
+
+    Returns:
+        list[str]: Descriptions of the differences
+    """
+    fingerprint1 = world1.fingerprint()
+    fingerprint2 = world2.fingerprint()
+    if fingerprint1 == fingerprint2:
+        return []
+    return [
+        f"World transition tables differ (fingerprints {fingerprint1[:12]}"
+        f" vs {fingerprint2[:12]})"
+    ]
+
+
 def main():
     """Example usage of the comparison function."""
     # Example usage
@@ -0,0 +1,170 @@
+"""
+Builds the algebra of a product world from the algebras of its components.
+
+For an uncoupled ProductWorld, an action's effect on the product is the pair of its
+ effects on the components, so its equivalence class in the product is the pair of
+ its component classes. The product algebra is therefore the subalgebra of the
+ direct product of the component algebras generated by the minimum actions, and is
+ found from the component Cayley tables without enumerating product states.
+
+This needs global action-function algebras: with the local methods, equivalence
+ depends on the initial state and is not preserved by composition, so component
+ Cayley tables do not determine the product's.
+"""
+
+import time
+
+from transformation_algebra.transformation_algebra import TransformationAlgebra
+from transformation_algebra.utils.algebra_generation_methods import (
+    AlgebraGenerationMethod,
+)
+from utils.cayley_table_actions import CayleyTableActions
+from utils.equiv_classes import EquivClasses
+from utils.type_definitions import ActionType
+from worlds.product_world import ProductWorld
+from worlds.utils.undefined_state import UndefinedStates
+
+
+def generate_product_algebra(
+    algebra_a: TransformationAlgebra,
+    algebra_b: TransformationAlgebra,
+    name: str | None = None,
+) -> TransformationAlgebra:
+    """
+    Generate the algebra of the uncoupled product of two worlds from their algebras.
+
+    Equivalence classes are discovered in the same order as AFEquivClassGenerator
+     does (actions of length n are built by prepending each minimum action to the
+     distinct actions of length n - 1), so the labels match those of generating the
+     product algebra directly.
+
+    Args:
+        algebra_a: The algebra of the first component world, generated with the
+         ACTION_FUNCTION method
+        algebra_b: The algebra of the second component world, generated with the
+         ACTION_FUNCTION method
+        name: Name of the product algebra. Defaults to '{name_a}_x_{name_b}'.
+
+    Returns:
+        The product algebra, with its equivalence classes and actions Cayley table
+
+    Raises:
+        ValueError: If an algebra has not been generated with the ACTION_FUNCTION
+         method, or the worlds have different minimum actions.
+    """
+    for algebra in [algebra_a, algebra_b]:
+        if not hasattr(algebra, "cayley_table_actions"):
+            raise ValueError(
+                f"Algebra '{algebra.name}' must be generated before taking products."
+            )
+        if (
+            getattr(algebra, "_generation_method", None)
+            != AlgebraGenerationMethod.ACTION_FUNCTION
+        ):
+            raise ValueError(
+                f"Algebra '{algebra.name}' must be generated with the"
+                f" {AlgebraGenerationMethod.ACTION_FUNCTION} method."
+            )
+
+    product_world = ProductWorld(
+        algebra_a._algebra_generation_parameters["world"],
+        algebra_b._algebra_generation_parameters["world"],
+    )
+
+    print(f"\nGenerating product algebra of '{algebra_a.name}' and '{algebra_b.name}'.")
+    start_time = time.time()
+    product_algebra = TransformationAlgebra(
+        name=name or f"{algebra_a.name}_x_{algebra_b.name}"
+    )
+    product_algebra._generation_method = AlgebraGenerationMethod.ACTION_FUNCTION
+    product_algebra._algebra_generation_parameters = {
+        "world": product_world,
+        "initial_state": None,
+    }
+    product_algebra.equiv_classes, class_pairs = _generate_product_equiv_classes(
+        algebra_a, algebra_b, product_world
+    )
+    product_algebra.cayley_table_actions = _generate_product_cayley_table(
+        algebra_a.cayley_table_actions, algebra_b.cayley_table_actions, class_pairs
+    )
+    time_taken = time.time() - start_time
+    print(f"\tDistinct actions: {len(class_pairs)},\tTotal time: {time_taken:.2f}s")
+    return product_algebra
+
+
+def _generate_product_equiv_classes(
+    algebra_a: TransformationAlgebra,
+    algebra_b: TransformationAlgebra,
+    product_world: ProductWorld,
+) -> tuple[EquivClasses, dict[ActionType, tuple[ActionType, ActionType]]]:
+    """
+    Find the product equivalence classes as pairs of component classes.
+
+    Returns:
+        The product equivalence classes, and the pair of component class labels of
+         each product class label
+    """
+    table_a = algebra_a.cayley_table_actions
+    table_b = algebra_b.cayley_table_actions
+    min_action_pairs = {}
+    for min_action in product_world.get_min_actions():
+        class_a = algebra_a.equiv_classes.get_element_class(min_action)
+        class_b = algebra_b.equiv_classes.get_element_class(min_action)
+        if class_a is None or class_b is None:
+            raise ValueError(f"Minimum action '{min_action}' has no class.")
+        min_action_pairs[min_action] = (class_a, class_b)
+
+    equiv_classes = EquivClasses()
+    label_of_pair: dict[tuple[ActionType, ActionType], ActionType] = {}
+    class_pairs: dict[ActionType, tuple[ActionType, ActionType]] = {}
+
+    def process_candidate(action: ActionType, pair: tuple[ActionType, ActionType]):
+        if pair in label_of_pair:
+            equiv_classes.add_element(element=action, class_label=label_of_pair[pair])
+            return
+        label_of_pair[pair] = action
+        class_pairs[action] = pair
+        equiv_classes.create_new_class(
+            class_label=action,
+            elements=[action],
+            outcome=UndefinedStates.BASIC.value,
+        )
+
+    for min_action, pair in min_action_pairs.items():
+        process_candidate(min_action, pair)
+    prev_actions = list(class_pairs)
+    while prev_actions:
+        num_classes = len(class_pairs)
+        for prev_action in prev_actions:
+            prev_a, prev_b = class_pairs[prev_action]
+            for min_action, (min_a, min_b) in min_action_pairs.items():
+                process_candidate(
+                    min_action + prev_action,
+                    (
+                        table_a.compose_actions(min_a, prev_a),
+                        table_b.compose_actions(min_b, prev_b),
+                    ),
+                )
+        prev_actions = list(class_pairs)[num_classes:]
+
+    return equiv_classes, class_pairs
+
+
+def _generate_product_cayley_table(
+    table_a: CayleyTableActions,
+    table_b: CayleyTableActions,
+    class_pairs: dict[ActionType, tuple[ActionType, ActionType]],
+) -> CayleyTableActions:
+    """Compose product classes componentwise with the component Cayley tables."""
+    label_of_pair = {pair: label for label, pair in class_pairs.items()}
+    cayley_table_actions = CayleyTableActions()
+    for left_action, (left_a, left_b) in class_pairs.items():
+        cayley_table_actions.data[left_action] = {}
+        for right_action, (right_a, right_b) in class_pairs.items():
+            cayley_table_actions.data[left_action][right_action] = label_of_pair[
+                (
+                    table_a.compose_actions(left_a, right_a),
+                    table_b.compose_actions(left_b, right_b),
+                )
+            ]
+    return cayley_table_actions
@@ -70,6 +70,8 @@ class TransformationAlgebra:
         world: BaseWorld,
         initial_state: StateType | None = None,
         method: AlgebraGenerationMethod = AlgebraGenerationMethod.STATES_CAYLEY,
+        use_symmetry: bool = False,
+        use_action_words: bool = False,
     ) -> None:
         """Generate the Cayley tables using the specified method.
 
@@ -78,6 +80,10 @@ class TransformationAlgebra:
             initial_state: The initial state to start from (required for STATE_CAYLEY
              and LOCAL_ACTION_FUNCTION methods)
             method: Which method to use for generation (defaults to STATE_CAYLEY)
+            use_symmetry: Compute action functions on orbit representatives of the
+             world's automorphisms only (ACTION_FUNCTION method only)
+            use_action_words: Build actions as packed ActionWords rather than
+             strings (STATES_CAYLEY and ACTION_FUNCTION methods only)
 
         Raises:
             ValueError: If using STATE_CAYLEY or LOCAL_ACTION_FUNCTION method and
@@ -96,25 +102,37 @@ class TransformationAlgebra:
                 " method"
             )
 
+        if method in [
+            AlgebraGenerationMethod.STATES_CAYLEY,
+            AlgebraGenerationMethod.LOCAL_ACTION_FUNCTION,
+        ]:
+            # These methods only visit states reachable from the initial state.
+            world.generate_reachable_transition_array([initial_state])  # type: ignore[list-item]
+
         self._store_algebra_generation_paramenters(world, initial_state)
         self._generation_method = method
 
         if method == AlgebraGenerationMethod.STATES_CAYLEY:
-            self._generate_using_states_cayley(world, initial_state)  # type: ignore[arg-type]
+            self._generate_using_states_cayley(world, initial_state, use_action_words)  # type: ignore[arg-type]
         elif method == AlgebraGenerationMethod.LOCAL_ACTION_FUNCTION:
             self._generate_using_local_action_function(world, initial_state)  # type: ignore[arg-type]
         elif method == AlgebraGenerationMethod.ACTION_FUNCTION:
-            self._generate_using_action_function(world)
+            self._generate_using_action_function(world, use_symmetry, use_action_words)
         else:
             raise ValueError(f"Invalid generation method: {method}")
 
     def _generate_using_states_cayley(
-        self, world: BaseWorld, initial_state: StateType
+        self,
+        world: BaseWorld,
+        initial_state: StateType,
+        use_action_words: bool = False,
     ) -> None:
         """Generate using the original state Cayley table method."""
         # Generate states table and equiv classes
         self._states_cayley_generator = StatesCayleyGenerator(
-            world=world, initial_state=initial_state
+            world=world,
+            initial_state=initial_state,
+            use_action_words=use_action_words,
         )
         self.cayley_table_states, self.equiv_classes = (
             self._states_cayley_generator.generate()
@@ -124,10 +142,17 @@ class TransformationAlgebra:
         self._actions_cayley_generator = ActionsCayleyGenerator(self.equiv_classes)
         self.cayley_table_actions = self._actions_cayley_generator.generate()
 
-    def _generate_using_action_function(self, world: BaseWorld) -> None:
+    def _generate_using_action_function(
+        self,
+        world: BaseWorld,
+        use_symmetry: bool = False,
+        use_action_words: bool = False,
+    ) -> None:
         """Generate using the new action function method."""
         # Generate equiv classes using new method
-        self._equiv_classes_generator = AFEquivClassGenerator(world)
+        self._equiv_classes_generator = AFEquivClassGenerator(
+            world, use_symmetry, use_action_words
+        )
         self._equiv_classes_generator.generate()
         self.equiv_classes = self._equiv_classes_generator.get_equiv_classes()
 
@@ -1,15 +1,52 @@
+from utils.outcome_cache import OutcomeCache
 from utils.type_definitions import ActionType, StateType
 from worlds.base_world import BaseWorld
 
+# Fewest action sequences simulated as a batch; smaller batches are faster one by
+#  one, as a batch has a fixed NumPy overhead.
+MIN_BATCH_SIZE = 64
+
 
 def generate_action_outcome(
-    action: ActionType, initial_state: StateType, world: BaseWorld
+    action: ActionType,
+    initial_state: StateType,
+    world: BaseWorld,
+    outcome_cache: OutcomeCache | None = None,
 ) -> StateType:
     """
     Generates outcome of applying an action sequence to the world from the
       initial_state.
     action * w_{0}.
+
+    The world's current state is not modified (see BaseWorld.simulate). If an
+     outcome_cache is given, the outcome is looked up in, and added to, the cache.
+    """
+    if outcome_cache is not None:
+        return outcome_cache.get_outcome(action, initial_state, world)
+    return world.simulate(initial_state, action)
+
+
+def generate_action_outcomes(
+    actions: list[ActionType],
+    initial_state: StateType,
+    world: BaseWorld,
+    outcome_cache: OutcomeCache | None = None,
+) -> list[StateType]:
+    """
+    Generates the outcomes of applying several action sequences to the world from
+      the initial_state.
+
+    Without an outcome_cache, at least MIN_BATCH_SIZE sequences are simulated
+     together with BaseWorld.simulate_batch if the world has a transition array.
     """
-    world.set_state(initial_state)
-    world.apply_action_sequence(action)
-    return world.get_state()
+    if (
+        outcome_cache is None
+        and len(actions) >= MIN_BATCH_SIZE
+        and world.has_transition_array()
+    ):
+        state_ids = world.simulate_batch(world.state_to_id(initial_state), actions)
+        return world.ids_to_states(state_ids)
+    return [
+        generate_action_outcome(action, initial_state, world, outcome_cache)
+        for action in actions
+    ]
@@ -0,0 +1,228 @@
+"""
+Action words packed into integers.
+
+An ActionWord stores a sequence of minimum actions as the digits of a base-k integer,
+ where k is the number of minimum actions of its ActionAlphabet, together with its
+ length. Concatenation is integer arithmetic rather than string copying, length is
+ O(1), hashing and comparison work on the packed integer (a few machine words per
+ long word) rather than character by character, and minimum actions are not assumed
+ to be single characters.
+
+Words behave like action strings wherever the generators use them: they concatenate
+ with +, iterate and reverse over their minimum actions, index and slice, and print
+ as their strings. Words sort by length, then by digits (see ActionAlphabet.sort_key,
+ which sorts strings the same way). Words only compare equal to words, so a
+ generator uses either strings or words throughout.
+"""
+
+from collections.abc import Iterable, Iterator
+
+from utils.type_definitions import ActionType, MinActionsType
+
+
+class ActionAlphabet:
+    """
+    The minimum actions that ActionWords are made of.
+
+    Args:
+        min_actions (MinActionsType): The minimum actions. The j-th minimum action
+         is the digit j of packed words.
+
+    Raises:
+        ValueError: If the minimum actions are empty or not unique.
+    """
+
+    def __init__(self, min_actions: MinActionsType) -> None:
+        if not min_actions or len(set(min_actions)) != len(min_actions):
+            raise ValueError("An alphabet needs unique minimum actions.")
+        self.min_actions: tuple[ActionType, ...] = tuple(min_actions)
+        self._min_action_to_index = {a: j for j, a in enumerate(self.min_actions)}
+        self._base = len(self.min_actions)
+        # Powers of the base, extended as longer words are built.
+        self._powers = [1]
+
+    def get_base(self) -> int:
+        return self._base
+
+    def index(self, min_action: ActionType) -> int:
+        """Return the digit of a minimum action."""
+        try:
+            return self._min_action_to_index[min_action]
+        except KeyError:
+            raise ValueError(f"Invalid action: '{min_action}'.") from None
+
+    def power(self, exponent: int) -> int:
+        """Return base ** exponent, from a cache of powers."""
+        powers = self._powers
+        while len(powers) <= exponent:
+            powers.append(powers[-1] * self._base)
+        return powers[exponent]
+
+    def word(self, action_sequence: "str | Iterable[ActionType]") -> "ActionWord":
+        """
+        Return the word of an action sequence.
+
+        A string is split into single-character minimum actions if every minimum
+         action is a single character, and read greedily (longest match first)
+         otherwise.
+        """
+        if isinstance(action_sequence, ActionWord):
+            return action_sequence
+        if isinstance(action_sequence, str):
+            action_sequence = self._split(action_sequence)
+        return self.word_from_indices([self.index(a) for a in action_sequence])
+
+    def word_from_indices(self, indices: Iterable[int]) -> "ActionWord":
+        """Return the word with the given minimum action digits, left to right."""
+        packed = length = 0
+        for index in indices:
+            packed = packed * self._base + index
+            length += 1
+        return ActionWord(self, packed, length)
+
+    def sort_key(
+        self, action_sequence: "str | Iterable[ActionType]"
+    ) -> tuple[int, int]:
+        """
+        Return the key that words sort by: their length, then their digits.
+
+        Sorting action strings by this key orders them like their words.
+        """
+        word = self.word(action_sequence)
+        return (word._length, word.packed)
+
+    def min_action_words(self) -> list["ActionWord"]:
+        """Return the words of length one, in minimum action order."""
+        return [ActionWord(self, j, 1) for j in range(self._base)]
+
+    def _split(self, action_sequence: str) -> list[ActionType]:
+        if all(len(a) == 1 for a in self.min_actions):
+            return list(action_sequence)
+        labels = sorted(self.min_actions, key=len, reverse=True)
+        min_actions = []
+        position = 0
+        while position < len(action_sequence):
+            label = next(
+                (a for a in labels if action_sequence.startswith(a, position)), None
+            )
+            if label is None:
+                raise ValueError(
+                    f"Cannot split '{action_sequence}' into minimum actions."
+                )
+            min_actions.append(label)
+            position += len(label)
+        return min_actions
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, ActionAlphabet) and self.min_actions == other.min_actions
+        )
+
+    def __hash__(self) -> int:
+        return hash(self.min_actions)
+
+    def __getstate__(self) -> dict:
+        return {"min_actions": self.min_actions}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(list(state["min_actions"]))
+
+
+class ActionWord:
+    """
+    A sequence of minimum actions packed into a base-k integer.
+
+    The leftmost minimum action is the most significant digit, so the rightmost
+     (first applied) one is packed % k.
+
+    Attributes:
+        alphabet (ActionAlphabet): The minimum actions of the word.
+        packed (int): The digits of the word.
+
+    Args:
+        alphabet (ActionAlphabet): The minimum actions of the word.
+        packed (int): The digits of the word.
+        length (int): The number of minimum actions in the word.
+    """
+
+    __slots__ = ("_length", "alphabet", "packed")
+
+    def __init__(self, alphabet: ActionAlphabet, packed: int, length: int) -> None:
+        self.alphabet = alphabet
+        self.packed = packed
+        self._length = length
+
+    def indices(self) -> list[int]:
+        """Return the minimum action digits, left to right."""
+        return list(self.iter_indices_reversed())[::-1]
+
+    def iter_indices_reversed(self) -> Iterator[int]:
+        """Yield the minimum action digits right to left, in the order applied."""
+        packed, base = self.packed, self.alphabet.get_base()
+        for _ in range(self._length):
+            packed, index = divmod(packed, base)
+            yield index
+
+    def labels(self) -> list[ActionType]:
+        """Return the minimum actions, left to right."""
+        min_actions = self.alphabet.min_actions
+        return [min_actions[j] for j in self.indices()]
+
+    def __add__(self, other: "ActionWord | str") -> "ActionWord":
+        if isinstance(other, str):
+            other = self.alphabet.word(other)
+        elif not isinstance(other, ActionWord):
+            return NotImplemented
+        elif other.alphabet is not self.alphabet and other.alphabet != self.alphabet:
+            raise ValueError("Cannot concatenate words over different alphabets.")
+        return ActionWord(
+            self.alphabet,
+            self.packed * self.alphabet.power(other._length) + other.packed,
+            self._length + other._length,
+        )
+
+    def __radd__(self, other: str) -> "ActionWord":
+        if isinstance(other, str):
+            return self.alphabet.word(other) + self
+        return NotImplemented
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[ActionType]:
+        return iter(self.labels())
+
+    def __reversed__(self) -> Iterator[ActionType]:
+        min_actions = self.alphabet.min_actions
+        return (min_actions[j] for j in self.iter_indices_reversed())
+
+    def __getitem__(self, index: int | slice) -> "ActionType | ActionWord":
+        if isinstance(index, slice):
+            return self.alphabet.word_from_indices(self.indices()[index])
+        return self.labels()[index]
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, ActionWord)
+            and self.packed == other.packed
+            and self._length == other._length
+            and (other.alphabet is self.alphabet or other.alphabet == self.alphabet)
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.packed, self._length))
+
+    def __lt__(self, other: "ActionWord") -> bool:
+        return (self._length, self.packed) < (other._length, other.packed)
+
+    def __str__(self) -> str:
+        return "".join(self.labels())
+
+    def __repr__(self) -> str:
+        return f"ActionWord('{self}')"
+
+    def __getstate__(self) -> tuple:
+        return (self.alphabet, self.packed, self._length)
+
+    def __setstate__(self, state: tuple) -> None:
+        self.alphabet, self.packed, self._length = state
@@ -1,5 +1,3 @@
-import pandas as pd
-
 from utils.errors import CompositionError, ValidationError
 from utils.type_definitions import ActionType, CayleyTableActionsDataType
 
@@ -140,6 +138,8 @@ class CayleyTableActions:
             return "\\begin{tabular}{c}\nEmpty Cayley Table\\\\\n\\end{tabular}"
 
         # Convert the nested dictionary to a pandas DataFrame
+        import pandas as pd  # noqa: PLC0415 (slow to import)
+
         df = pd.DataFrame.from_dict(self.data, orient="index")
 
         # Add dollar signs around all elements
@@ -194,6 +194,8 @@ class CayleyTableActions:
             return "\nCayleyTableActions = {}"
 
         # Convert the nested dictionary to a pandas DataFrame
+        import pandas as pd  # noqa: PLC0415 (slow to import)
+
         df = pd.DataFrame.from_dict(self.data, orient="index")
 
         # Add a title row to explain the composition order
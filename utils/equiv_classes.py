@@ -1,3 +1,5 @@
+from utils.action_word import ActionWord
+from utils.cayley_table_actions import CayleyTableActions
 from utils.type_definitions import (
     ActionType,
     EquivClassesDataType,
@@ -113,15 +115,54 @@ class EquivClasses:
     # --------------------------------------------------------------------------
     # Action Sequence Processing
     # --------------------------------------------------------------------------
-    # TODO: Implement this method.
-    def reduce_action_sequence(self, action_sequence: ActionType) -> ActionType:
-        """Reduce action sequence down to a single labelling element."""
-        # (1) Check each individual element is a class labelling element.
-        ## If individual element is not a class labelling element, then find equivalent
-        #  class labelling element.
-        # (2) Take pairs of elements
-        ##
-        return action_sequence
+    def reduce_action_sequence(
+        self, action_sequence: ActionType, cayley_table_actions: CayleyTableActions
+    ) -> ActionType:
+        """Reduce action sequence down to a single labelling element.
+
+        Each minimum action is replaced by the label of its class, and the labels
+         are composed right to left with the actions Cayley table, so no world is
+         simulated.
+
+        Args:
+            action_sequence: The action sequence to reduce
+            cayley_table_actions: The Cayley table of the class labels
+
+        Returns:
+            The label of the class of action_sequence
+
+        Raises:
+            ValueError: If action_sequence is empty or has a minimum action with
+             no class
+            CompositionError: If a class label is not in the Cayley table
+        """
+        # The minimum actions right to left, as digits for ActionWords.
+        if isinstance(action_sequence, ActionWord):
+            min_action_words = action_sequence.alphabet.min_action_words()
+            min_actions = list(action_sequence.iter_indices_reversed())
+        else:
+            min_actions = list(reversed(action_sequence))
+        if not min_actions:
+            raise ValueError("Cannot reduce an empty action sequence.")
+
+        min_action_labels = {}
+        for min_action in set(min_actions):
+            element = (
+                min_action_words[min_action]
+                if isinstance(action_sequence, ActionWord)
+                else min_action
+            )
+            label = self.get_element_class(element)
+            if label is None:
+                raise ValueError(f"Minimum action '{element}' has no class.")
+            min_action_labels[min_action] = label
+
+        label = min_action_labels[min_actions[0]]
+        for min_action in min_actions[1:]:
+            label = cayley_table_actions.compose_actions(
+                min_action_labels[min_action], label
+            )
+        return label
 
     # --------------------------------------------------------------------------
     # String Representation
@@ -17,3 +17,9 @@ class ValidationError(CayleyTableError):
     """Raised when Cayley table validation fails."""
 
     pass
+
+
+class MemoryBudgetExceededError(MemoryError):
+    """Raised when a table would exceed the configured memory budget."""
+
+    pass
@@ -0,0 +1,229 @@
+"""
+Caches of action outcomes.
+
+An outcome cache answers the same question as generate_action_outcome, the state
+ reached by applying an action sequence to an initial state, while reusing the
+ work of earlier questions. A cache is tied to the world it was used with: use a
+ new cache (or clear it) for another world.
+"""
+
+import sys
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from utils.type_definitions import ActionType, StateType
+from worlds.base_world import BaseWorld
+
+# Entries kept by an LRUOutcomeCache without a budget.
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+class OutcomeCache(ABC):
+    """The interface of the outcome caches used by generate_action_outcome."""
+
+    @abstractmethod
+    def get_outcome(
+        self, action: ActionType, initial_state: StateType, world: BaseWorld
+    ) -> StateType:
+        """Return the state reached by applying action to initial_state in world."""
+
+    @abstractmethod
+    def get_stats(self) -> dict[str, int | float]:
+        """Return the size and hit counters of the cache."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every cached outcome and reset the counters."""
+
+
+class _TrieNode:
+    __slots__ = ("children", "state")
+
+    def __init__(self, state: StateType) -> None:
+        self.state = state
+        self.children: dict[ActionType, _TrieNode] = {}
+
+
+class SuffixTrieOutcomeCache(OutcomeCache):
+    """
+    Caches the states reached by every suffix of the action sequences evaluated.
+
+    Action sequences are applied right to left, so sequences that share a suffix
+     (such as the candidates row_label + col_label of a Cayley table column) pass
+     through the same intermediate states. For each initial state, a trie keyed by
+     minimum actions, read right to left, stores the state reached by each suffix.
+     A sequence is evaluated by following its longest cached suffix and simulating
+     only the remaining minimum actions, whose states are added to the trie.
+
+    Args:
+        max_nodes (int | None): The maximum number of trie nodes. Once reached,
+         cached suffixes are still followed but no new nodes are added. Unbounded
+         by default.
+    """
+
+    def __init__(self, max_nodes: int | None = None) -> None:
+        self.max_nodes = max_nodes
+        self.clear()
+
+    def clear(self) -> None:
+        self._roots: dict[StateType, _TrieNode] = {}
+        self._stats = {
+            "nodes": 0,
+            "lookups": 0,
+            "cached_steps": 0,
+            "simulated_steps": 0,
+        }
+
+    def get_outcome(
+        self, action: ActionType, initial_state: StateType, world: BaseWorld
+    ) -> StateType:
+        stats = self._stats
+        stats["lookups"] += 1
+        node = self._roots.get(initial_state)
+        if node is None:
+            node = self._roots[initial_state] = _TrieNode(initial_state)
+
+        min_actions = reversed(action)
+        num_cached_steps = 0
+        # Follow the longest cached suffix.
+        for min_action in min_actions:
+            child = node.children.get(min_action)
+            if child is None:
+                break
+            node = child
+            num_cached_steps += 1
+        stats["cached_steps"] += num_cached_steps
+        if num_cached_steps == len(action):
+            return node.state
+
+        # Simulate the remaining prefix as one sequence, whose first minimum
+        #  action applied is the one the trie has no child for.
+        state = node.state
+        next_states = world.iter_simulated_states(
+            state, action[: len(action) - num_cached_steps]
+        )
+        for state, min_action in zip(next_states, (min_action, *min_actions)):
+            stats["simulated_steps"] += 1
+            if self.max_nodes is None or stats["nodes"] < self.max_nodes:
+                child = _TrieNode(state)
+                node.children[min_action] = child
+                node = child
+                stats["nodes"] += 1
+        return state
+
+    def get_stats(self) -> dict[str, int | float]:
+        """Return the number of trie nodes and how many steps the trie saved.
+
+        Returns:
+            dict: The number of nodes and lookups, the minimum actions followed in
+             the trie (cached_steps) and simulated (simulated_steps), and the
+             fraction of steps that were cached (hit_rate).
+        """
+        stats: dict[str, int | float] = dict(self._stats)
+        total_steps = stats["cached_steps"] + stats["simulated_steps"]
+        stats["hit_rate"] = stats["cached_steps"] / total_steps if total_steps else 0.0
+        return stats
+
+
+class LRUOutcomeCache(OutcomeCache):
+    """
+    Caches the outcomes of (initial state, action) pairs, evicting the least
+     recently used pairs once over budget.
+
+    A repeated pair costs a dictionary lookup. A new pair is evaluated by the inner
+     cache if one is given (such as a SuffixTrieOutcomeCache), and simulated
+     otherwise.
+
+    Args:
+        max_entries (int | None): The maximum number of cached pairs. Defaults to
+         DEFAULT_MAX_ENTRIES if max_bytes is not given either.
+        max_bytes (int | None): The maximum approximate size of the cached pairs,
+         from sys.getsizeof of their states and actions.
+        inner (OutcomeCache | None): The cache that evaluates new pairs, if any.
+
+    Raises:
+        ValueError: If a budget is not positive.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        inner: OutcomeCache | None = None,
+    ) -> None:
+        if max_entries is None and max_bytes is None:
+            max_entries = DEFAULT_MAX_ENTRIES
+        if any(
+            budget is not None and budget <= 0 for budget in [max_entries, max_bytes]
+        ):
+            raise ValueError("Cache budgets must be positive.")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.inner = inner
+        self.clear()
+
+    def clear(self) -> None:
+        self._entries: OrderedDict[
+            tuple[StateType, ActionType], tuple[StateType, int]
+        ] = OrderedDict()
+        self._num_bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+        if self.inner is not None:
+            self.inner.clear()
+
+    def get_outcome(
+        self, action: ActionType, initial_state: StateType, world: BaseWorld
+    ) -> StateType:
+        key = (initial_state, action)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry[0]
+
+        self._stats["misses"] += 1
+        if self.inner is not None:
+            outcome = self.inner.get_outcome(action, initial_state, world)
+        else:
+            outcome = world.simulate(initial_state, action)
+        num_bytes = (
+            sys.getsizeof(action)
+            + sys.getsizeof(initial_state)
+            + sys.getsizeof(outcome)
+        )
+        self._entries[key] = (outcome, num_bytes)
+        self._num_bytes += num_bytes
+        self._evict()
+        return outcome
+
+    def _evict(self) -> None:
+        """Remove least recently used pairs until within budget."""
+        entries = self._entries
+        while entries and (
+            (self.max_entries is not None and len(entries) > self.max_entries)
+            or (self.max_bytes is not None and self._num_bytes > self.max_bytes)
+        ):
+            _, (_, num_bytes) = entries.popitem(last=False)
+            self._num_bytes -= num_bytes
+            self._stats["evictions"] += 1
+
+    def get_stats(self) -> dict[str, int | float]:
+        """Return the size and the hit, miss and eviction counters of the cache.
+
+        Returns:
+            dict: The number of cached pairs (entries) and their approximate size
+             (bytes), the hits, misses and evictions, the fraction of lookups that
+             hit (hit_rate), and the statistics of the inner cache, prefixed with
+             'inner_'.
+        """
+        stats: dict[str, int | float] = {
+            "entries": len(self._entries),
+            "bytes": self._num_bytes,
+            **self._stats,
+        }
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        if self.inner is not None:
+            for key, value in self.inner.get_stats().items():
+                stats[f"inner_{key}"] = value
+        return stats
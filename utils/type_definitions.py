@@ -1,12 +1,19 @@
-from typing import Any, TypedDict
+from typing import TYPE_CHECKING, Any, TypedDict
 
-import networkx as nx
+import numpy as np
+import numpy.typing as npt
+
+if TYPE_CHECKING:
+    import networkx as nx
 
 # Base world.
 ActionType = str
 MinActionsType = list[ActionType]
-StateType = tuple[Any, ...]
+# Worlds with compact encodings may use a single integer as the state.
+StateType = tuple[Any, ...] | int
 TransformationMatrix = dict[StateType, dict[ActionType, StateType]]
+StateIdType = int
+TransitionArray = npt.NDArray[np.int32]
 
 # States Cayley table generation.
 CayleyTableStatesRowType = dict[ActionType, StateType]
@@ -34,9 +41,12 @@ class EquivElementsRowColumnDictType(TypedDict):
 # Gridworlds2d.
 GridPosition2DType = tuple[int, int]
 
+# N-dimensional gridworlds.
+GridShapeNDType = tuple[int, ...]
+
 
 class EdgeDrawingParams(TypedDict):
-    graph: nx.DiGraph
+    graph: "nx.DiGraph"
     pos: dict
     edge: tuple
     action: str
@@ -2,19 +2,74 @@
 Features present in any world class.
 """
 
+import hashlib
+import time
+import warnings
 from abc import abstractmethod
-from itertools import zip_longest
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, zip_longest
+from typing import TYPE_CHECKING
 
-import pygraphviz as pgv
+import numpy as np
 
+from utils.action_word import ActionWord
+from utils.errors import MemoryBudgetExceededError
 from utils.type_definitions import (
     ActionType,
     MinActionsType,
+    StateIdType,
     StateType,
     TransformationMatrix,
+    TransitionArray,
 )
-from worlds.utils.undefined_state import UndefinedStates
-from worlds.world_saver import WorldSaver
+from worlds.utils.graph_export import export_world_graph
+from worlds.utils.undefined_state import UNDEFINED_STATE_ID, UndefinedStates
+from worlds.world_saver import MappedStateIndex, MappedStateTable, WorldSaver
+
+if TYPE_CHECKING:
+    # Imported when drawing, as pygraphviz is slow to import.
+    import pygraphviz as pgv
+
+# Shards per worker process when building transition arrays in parallel.
+SHARDS_PER_WORKER = 4
+
+# States per chunk when streaming states into a transition array.
+STATE_CHUNK_SIZE = 65536
+
+# Rough per-state and per-transition memory costs (bytes) of the transition tables,
+#  used to project their size before building them. Array-backed tables hold the
+#  int32 array (simulated through a view, without copies) and the state
+#  interning; dictionary tables hold a nested dictionary entry per transition.
+ARRAY_TABLE_BYTES_PER_STATE = 160
+ARRAY_TABLE_BYTES_PER_TRANSITION = 4
+DICT_TABLE_BYTES_PER_STATE = 400
+DICT_TABLE_BYTES_PER_TRANSITION = 100
+
+# World used by the current worker process when building transition arrays.
+_worker_context: dict[str, "BaseWorld"] = {}
+
+
+def _init_transition_worker(world: "BaseWorld") -> None:
+    _worker_context["world"] = world
+
+
+def _compute_next_state_rows(states: list[StateType]) -> list[list[StateType]]:
+    world = _worker_context["world"]
+    min_actions = world.get_min_actions()
+    return [[world.get_next_state(s, a) for a in min_actions] for s in states]
+
+
+def _view_flat(transition_array: TransitionArray | None) -> memoryview | None:
+    """Return a flat int32 view of a transition array (see _transition_flat).
+
+    The array is only copied if it is not a C-contiguous int32 array.
+    """
+    if transition_array is None:
+        return None
+    contiguous_array = np.ascontiguousarray(transition_array, dtype=np.int32)
+    return memoryview(contiguous_array).cast("B").cast("i")
 
 
 class BaseWorld:
@@ -22,9 +77,88 @@ class BaseWorld:
         self._current_state: StateType
         self._MIN_ACTIONS: list[ActionType] = min_actions
         self._min_action_transformation_matrix: TransformationMatrix = {}
+        # False if the dictionary matrix may not cover every possible state, as in
+        #  worlds pickled with a matrix derived from a reachable-only array.
+        self._is_transformation_matrix_complete = True
         self._possible_states: list[StateType] = []
         self.world_saver = WorldSaver()
 
+        # Array-backed transition table over dense integer state IDs.
+        self._state_to_id: dict[StateType, StateIdType] | MappedStateIndex = {}
+        self._id_to_state: list[StateType] = []
+        self._min_action_to_index: dict[ActionType, int] = {}
+        # Column of each ASCII character code, for converting strings of
+        #  single-character minimum actions at once (None for other actions).
+        self._column_of_code: np.ndarray | None = None
+        self._transition_array: TransitionArray | None = None
+        # True if the array only covers states reachable from some seed states.
+        self._transition_array_reachable_only = False
+        # Flat view of the array (entry state_id * num_min_actions + column), for
+        #  fast scalar lookups in simulate without copying the array.
+        self._transition_flat: memoryview | None = None
+
+        # Absorbing states (every minimum action self-loops), found when a
+        #  transition table is built, so that simulation can stop early.
+        self._absorbing_states: set[StateType] = set()
+        self._is_absorbing_id: bytes = b""
+        self._simulation_stats = {"sequences": 0, "steps": 0, "skipped_steps": 0}
+
+        # Maximum projected size of a transition table, checked before building it.
+        self._memory_budget_bytes: int | None = None
+        self._memory_budget_action = "raise"
+
+        # Digest of the transition table, computed by fingerprint on first use.
+        self._fingerprint: str | None = None
+
+    def __getstate__(self) -> dict:
+        # The flat view cannot be pickled, and is recreated from the array.
+        state = self.__dict__.copy()
+        state.pop("_transition_flat", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore a pickled world, filling in attributes added since it was saved.
+
+        Worlds pickled before the array-backed table existed only hold the nested
+         dictionary matrix, from which the absorbing states are recomputed.
+        """
+        self.__dict__.update(state)
+        # Row and column copies of the array kept by older worlds.
+        self.__dict__.pop("_transition_rows", None)
+        self.__dict__.pop("_transition_columns", None)
+        defaults = {
+            "_state_to_id": {},
+            "_id_to_state": [],
+            "_min_action_to_index": {},
+            "_transition_array": None,
+            "_transition_array_reachable_only": False,
+            "_is_absorbing_id": b"",
+            "_simulation_stats": {"sequences": 0, "steps": 0, "skipped_steps": 0},
+            "_memory_budget_bytes": None,
+            "_memory_budget_action": "raise",
+            "_fingerprint": None,
+        }
+        for name, value in defaults.items():
+            if name not in state:
+                setattr(self, name, value)
+        if "_is_transformation_matrix_complete" not in state:
+            # A matrix no larger than a reachable-only array may have been derived
+            #  from it.
+            self._is_transformation_matrix_complete = not (
+                self._transition_array is not None
+                and self._transition_array_reachable_only
+                and len(self._min_action_transformation_matrix)
+                <= len(self._id_to_state)
+            )
+        if "_column_of_code" not in state:
+            self._column_of_code = self._compile_column_of_code()
+        self._transition_flat = _view_flat(self._transition_array)
+        if "_absorbing_states" not in state:
+            self._set_min_action_transformation_matrix(
+                self._min_action_transformation_matrix,
+                self._is_transformation_matrix_complete,
+            )
+
     @abstractmethod
     def generate_possible_states(self) -> list[StateType]:
         """Return a list of possible states for the world."""
@@ -60,17 +194,137 @@ class BaseWorld:
             self._possible_states = self.generate_possible_states()
         return self._possible_states
 
-    def generate_min_action_transformation_matrix(self) -> None:
+    def iter_possible_states(self) -> Iterator[StateType]:
+        """Yield the possible states, in the order of generate_possible_states.
+
+        Unlike get_possible_states, the states are not stored. Subclasses that can
+         enumerate their states lazily override this (and usually implement
+         generate_possible_states as list(self.iter_possible_states())).
+        """
+        if self._possible_states:
+            yield from self._possible_states
+        else:
+            yield from self.generate_possible_states()
+
+    def count_possible_states(self) -> int:
+        """Return the number of possible states without storing them.
+
+        Subclasses override this with a closed-form count where one exists; the
+         default counts the states yielded by iter_possible_states.
+        """
+        if self._possible_states:
+            return len(self._possible_states)
+        return sum(1 for _ in self.iter_possible_states())
+
+    # --------------------------------------------------------------------------
+    # Memory budget
+    # --------------------------------------------------------------------------
+    def set_memory_budget(
+        self, max_bytes: int | None, on_exceed: str = "raise"
+    ) -> None:
+        """Limit the projected size of the transition tables this world builds.
+
+        The size is projected from count_possible_states before any table is
+         built, so generation fails (or warns) up front instead of running out of
+         memory part way through.
+
+        Args:
+            max_bytes: The budget in bytes, or None for no budget.
+            on_exceed: 'raise' to raise MemoryBudgetExceededError, or 'warn' to
+             issue a warning and build the table anyway.
+
+        Raises:
+            ValueError: If on_exceed is not 'raise' or 'warn'.
+        """
+        if on_exceed not in ["raise", "warn"]:
+            raise ValueError("on_exceed must be either 'raise' or 'warn'")
+        self._memory_budget_bytes = max_bytes
+        self._memory_budget_action = on_exceed
+
+    def estimate_transition_table_bytes(
+        self, num_states: int | None = None, array_backed: bool = True
+    ) -> int:
+        """Project the memory used by a transition table over num_states states.
+
+        Args:
+            num_states: Number of states, including the undefined state. Defaults to
+             count_possible_states() + 1.
+            array_backed: Estimate the array-backed table rather than the nested
+             dictionary.
+
+        Returns:
+            int: The rough size of the table in bytes.
+        """
+        if num_states is None:
+            num_states = self.count_possible_states() + 1
+        if array_backed:
+            bytes_per_state = ARRAY_TABLE_BYTES_PER_STATE
+            bytes_per_transition = ARRAY_TABLE_BYTES_PER_TRANSITION
+        else:
+            bytes_per_state = DICT_TABLE_BYTES_PER_STATE
+            bytes_per_transition = DICT_TABLE_BYTES_PER_TRANSITION
+        return num_states * (
+            bytes_per_state + bytes_per_transition * len(self._MIN_ACTIONS)
+        )
+
+    def _check_memory_budget(
+        self, num_states: int | None = None, array_backed: bool = True
+    ) -> None:
+        """Raise or warn if a table over num_states states exceeds the budget.
+
+        Raises:
+            MemoryBudgetExceededError: If the budget is exceeded and the budget
+             action is 'raise'.
+        """
+        if self._memory_budget_bytes is None:
+            return
+        projected_bytes = self.estimate_transition_table_bytes(num_states, array_backed)
+        if projected_bytes <= self._memory_budget_bytes:
+            return
+        message = (
+            f"Projected transition table size {projected_bytes / 2**20:.2f} MiB"
+            f" exceeds the memory budget of"
+            f" {self._memory_budget_bytes / 2**20:.2f} MiB."
+        )
+        if self._memory_budget_action == "raise":
+            raise MemoryBudgetExceededError(message)
+        warnings.warn(message, stacklevel=3)
+
+    def _get_max_states_within_budget(self) -> int | None:
+        """Return the largest number of states an array-backed table may hold."""
+        if self._memory_budget_bytes is None or self._memory_budget_action != "raise":
+            return None
+        return self._memory_budget_bytes // self.estimate_transition_table_bytes(1)
+
+    def generate_min_action_transformation_matrix(
+        self,
+        array_backed: bool = False,
+        num_workers: int | None = None,
+        use_cache: bool = False,
+    ) -> None:
         """Generate the transformation matrix for all possible state-action pairs.
 
+        Args:
+            array_backed: If True, store the transitions in a dense integer array
+             (see generate_transition_array) instead of a nested dictionary.
+            num_workers: Worker processes used to build the array (array_backed
+             only).
+            use_cache: Load or store the array in the on-disk cache (array_backed
+             only).
+
         Raises:
             ValueError: If possible states or minimum actions are not defined.
+            MemoryBudgetExceededError: If the projected table exceeds the memory
+             budget (see set_memory_budget).
         """
-        if self._min_action_transformation_matrix:
+        if array_backed:
+            self.generate_transition_array(num_workers=num_workers, use_cache=use_cache)
+        elif self._get_complete_transformation_matrix():
             print("Transformation matrix already exists.")
         elif not self._MIN_ACTIONS:
             raise ValueError("Minimum actions are not defined.")
         else:
+            self._check_memory_budget(array_backed=False)
             self._add_undefined_state_to_possible_states()
             transformation_matrix: TransformationMatrix = {}
             for state in self.get_possible_states():
@@ -82,7 +336,503 @@ class BaseWorld:
                     else:
                         next_state = self.get_next_state(state, min_action)
                     transformation_matrix[state][min_action] = next_state
-            self._min_action_transformation_matrix = transformation_matrix
+            self._set_min_action_transformation_matrix(transformation_matrix)
+
+    def get_min_action_transformation_matrix(self) -> TransformationMatrix:
+        """Return the nested-dictionary transformation matrix.
+
+        If a transition array over all possible states has been generated, the
+         dictionary is built from it (once) so that dictionary-based consumers keep
+         working. Otherwise the dictionary is generated over all possible states, as
+         a reachable-only array does not cover them.
+        """
+        if (
+            self._get_complete_transformation_matrix()
+            or not self.has_transition_array()
+        ):
+            return self._min_action_transformation_matrix
+        if self._transition_array_reachable_only:
+            self._set_min_action_transformation_matrix({})
+            self.generate_min_action_transformation_matrix()
+        else:
+            transition_rows = self.get_transition_array().tolist()
+            self._set_min_action_transformation_matrix(
+                {
+                    self._id_to_state[state_id]: {
+                        min_action: self._id_to_state[next_state_id]
+                        for min_action, next_state_id in zip(
+                            self._MIN_ACTIONS, row, strict=True
+                        )
+                    }
+                    for state_id, row in enumerate(transition_rows)
+                }
+            )
+        return self._min_action_transformation_matrix
+
+    def _get_complete_transformation_matrix(self) -> TransformationMatrix:
+        """Return the nested-dictionary matrix, or {} if it may be partial."""
+        if not self._is_transformation_matrix_complete:
+            return {}
+        return self._min_action_transformation_matrix
+
+    def _set_min_action_transformation_matrix(
+        self, transformation_matrix: TransformationMatrix, is_complete: bool = True
+    ) -> None:
+        """Install a nested-dictionary matrix and record its absorbing states.
+
+        Args:
+            transformation_matrix: The matrix to install.
+            is_complete: Whether the matrix covers every possible state.
+        """
+        self._min_action_transformation_matrix = transformation_matrix
+        self._is_transformation_matrix_complete = is_complete
+        self._absorbing_states = {
+            state
+            for state, transitions in transformation_matrix.items()
+            if all(next_state == state for next_state in transitions.values())
+        }
+
+    # --------------------------------------------------------------------------
+    # Array-backed transition table
+    # --------------------------------------------------------------------------
+    def generate_transition_array(
+        self, num_workers: int | None = None, use_cache: bool = False
+    ) -> None:
+        """Generate an array-backed transition table over dense integer state IDs.
+
+        Every possible state is interned to a dense integer ID, with the undefined
+         state reserved as UNDEFINED_STATE_ID. Transitions are stored in an int32
+         array of shape (num_states, num_min_actions), where entry [i, j] is the ID
+         of the state reached by applying the j-th minimum action to state i.
+        If the nested-dictionary matrix already exists it is converted rather than
+         recomputed.
+
+        Args:
+            num_workers: If greater than 1, compute next states in this many worker
+             processes (see _compute_next_states_in_parallel). Worthwhile when
+             get_next_state is expensive; the reported throughput shows whether it
+             pays off.
+            use_cache: If True, load the table from the on-disk cache when an entry
+             exists for this world configuration (see get_configuration_key),
+             skipping generate_possible_states and get_next_state; otherwise build
+             it and write it to the cache.
+
+        States are streamed from iter_possible_states and their next states are
+         computed and written into the array in chunks of STATE_CHUNK_SIZE, so no
+         intermediate per-state rows are held for the whole state space.
+
+        Raises:
+            ValueError: If minimum actions are not defined, or if a transition leads
+             to a state that is not a possible state.
+            MemoryBudgetExceededError: If the projected table exceeds the memory
+             budget (see set_memory_budget).
+        """
+        if self.is_transition_array_complete():
+            print("Transition array already exists.")
+            return
+        if not self._MIN_ACTIONS:
+            raise ValueError("Minimum actions are not defined.")
+        if use_cache and self._load_cached_transition_array():
+            return
+
+        transformation_matrix = self._get_complete_transformation_matrix()
+        if not transformation_matrix:
+            self._check_memory_budget()
+
+        start_time = time.time()
+        vectorized_table = (
+            None if transformation_matrix else self._build_transition_array_vectorized()
+        )
+        if vectorized_table is not None:
+            states, transition_array = vectorized_table
+            self._intern_states(states)
+            if not self._possible_states:
+                self._possible_states = states[1:]
+            self._transition_array_reachable_only = False
+            self._set_transition_array(transition_array)
+            self._report_transition_array_build(len(states), start_time, num_workers)
+            self._save_cached_transition_array(use_cache)
+            return
+
+        undefined_state = UndefinedStates.BASIC.value
+        states = [undefined_state]
+        if transformation_matrix:
+            states.extend(s for s in transformation_matrix if s != undefined_state)
+        else:
+            states.extend(
+                s for s in self.iter_possible_states() if s != undefined_state
+            )
+        self._intern_states(states)
+        if not self._possible_states:
+            self._possible_states = states[1:]
+
+        transition_array = np.full(
+            (len(states), len(self._MIN_ACTIONS)), UNDEFINED_STATE_ID, dtype=np.int32
+        )
+        next_state_rows = self._iter_next_state_rows(states[1:], num_workers)
+        start = 1
+        while chunk := list(islice(next_state_rows, STATE_CHUNK_SIZE)):
+            transition_array[start : start + len(chunk)] = [
+                [self._lookup_state_id(s) for s in next_states] for next_states in chunk
+            ]
+            start += len(chunk)
+
+        self._transition_array_reachable_only = False
+        self._set_transition_array(transition_array)
+        self._report_transition_array_build(len(states), start_time, num_workers)
+        self._save_cached_transition_array(use_cache)
+
+    def _iter_next_state_rows(
+        self, states: list[StateType], num_workers: int | None
+    ) -> Iterator[list[StateType]]:
+        """Yield, for each state, its next state under each minimum action."""
+        transformation_matrix = self._get_complete_transformation_matrix()
+        if transformation_matrix:
+            for state in states:
+                yield [transformation_matrix[state][a] for a in self._MIN_ACTIONS]
+        elif num_workers is not None and num_workers > 1:
+            yield from self._compute_next_states_in_parallel(states, num_workers)
+        else:
+            for state in states:
+                yield [self.get_next_state(state, a) for a in self._MIN_ACTIONS]
+
+    def _build_transition_array_vectorized(
+        self,
+    ) -> tuple[list[StateType], TransitionArray] | None:
+        """Build the whole transition table at once, if the world supports it.
+
+        Subclasses whose transitions can be computed with array arithmetic override
+         this to skip the per-state get_next_state loop.
+
+        Returns:
+            tuple | None: The states in ID order (starting with the undefined state)
+             and the transition array, or None to use get_next_state.
+        """
+        return None
+
+    def _report_transition_array_build(
+        self, num_states: int, start_time: float, num_workers: int | None
+    ) -> None:
+        elapsed = time.time() - start_time
+        rate = num_states / elapsed if elapsed > 0 else float("inf")
+        print(
+            f"\tTransition array built: {num_states} states in {elapsed:.2f}s"
+            f" ({rate:.1f} states/s, {num_workers or 1} worker(s))."
+        )
+
+    def _save_cached_transition_array(self, use_cache: bool) -> None:
+        if use_cache:
+            self.world_saver.save_cached_transition_table(
+                self.get_configuration_key(),
+                {
+                    "minimum_actions": self._MIN_ACTIONS,
+                    "states": self._id_to_state,
+                    "transition_array": self._transition_array,
+                },
+            )
+
+    def fingerprint(self) -> str:
+        """Return a digest of the world's minimum actions and transitions.
+
+        The table the world holds is hashed: its transition array, which covers
+         only the reachable states if built by generate_reachable_transition_array,
+         or else its dictionary matrix. A world with neither generates its
+         transition array. States are ordered by their repr (after the undefined
+         state) before hashing, so worlds with the same transitions have the same
+         fingerprint however their state IDs were assigned. The digest is computed
+         once and cached.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = self._compute_fingerprint()
+        return self._fingerprint
+
+    def _compute_fingerprint(self) -> str:
+        states, transition_array = self._get_transition_table_for_fingerprint()
+        state_reprs = [repr(state) for state in states]
+        order = np.array(
+            [
+                UNDEFINED_STATE_ID,
+                *sorted(range(1, len(state_reprs)), key=state_reprs.__getitem__),
+            ],
+            dtype=np.int64,
+        )
+        canonical_ids = np.empty_like(order)
+        canonical_ids[order] = np.arange(len(order))
+        canonical_array = canonical_ids[transition_array[order]]
+
+        digest = hashlib.sha256(repr(self._MIN_ACTIONS).encode())
+        for state_id in order.tolist():
+            digest.update(state_reprs[state_id].encode() + b"\n")
+        digest.update(canonical_array.astype(np.int32).tobytes())
+        return digest.hexdigest()
+
+    def _get_transition_table_for_fingerprint(
+        self,
+    ) -> tuple[Sequence[StateType], TransitionArray]:
+        """Return the states and transition array of the table the world holds."""
+        transformation_matrix = self._min_action_transformation_matrix
+        if not self.has_transition_array() and not transformation_matrix:
+            self.generate_transition_array()
+        if self.has_transition_array():
+            return self._id_to_state, self.get_transition_array()
+
+        undefined_state = UndefinedStates.BASIC.value
+        states = [undefined_state]
+        states.extend(s for s in transformation_matrix if s != undefined_state)
+        state_to_id = {state: i for i, state in enumerate(states)}
+        transition_array = np.full(
+            (len(states), len(self._MIN_ACTIONS)), UNDEFINED_STATE_ID, dtype=np.int32
+        )
+        for state_id, state in enumerate(states[1:], start=1):
+            transitions = transformation_matrix[state]
+            transition_array[state_id] = [
+                state_to_id[transitions[min_action]] for min_action in self._MIN_ACTIONS
+            ]
+        return states, transition_array
+
+    def get_configuration_key(self) -> str:
+        """Return a key identifying the world configuration.
+
+        The key hashes the world class, its additional properties for saving and
+         its minimum actions, which together determine the transition table.
+        Cached tables are not invalidated if get_next_state itself changes.
+        """
+        world_class = type(self)
+        configuration = (
+            f"{world_class.__module__}.{world_class.__qualname__}",
+            sorted(self._get_additional_properties_for_save().items()),
+            self._MIN_ACTIONS,
+        )
+        return hashlib.sha256(repr(configuration).encode()).hexdigest()
+
+    def _load_cached_transition_array(self) -> bool:
+        """Install the cached transition table for this configuration, if any.
+
+        Returns:
+            bool: True on a cache hit.
+        """
+        table = self.world_saver.load_cached_transition_table(
+            self.get_configuration_key()
+        )
+        if table is None or table["minimum_actions"] != self._MIN_ACTIONS:
+            return False
+
+        states = table["states"]
+        self._intern_states(states)
+        if not self._possible_states:
+            self._possible_states = states[1:]
+        self._transition_array_reachable_only = False
+        self._set_transition_array(table["transition_array"])
+        print(f"\tTransition array loaded from cache: {len(states)} states.")
+        return True
+
+    def _compute_next_states_in_parallel(
+        self, states: list[StateType], num_workers: int
+    ) -> Iterator[list[StateType]]:
+        """Compute the next states of each state in a pool of worker processes.
+
+        The states are split into contiguous shards and the results are yielded in
+         shard order, so the output does not depend on worker scheduling.
+
+        Args:
+            states: The states to compute next states for.
+            num_workers: Number of worker processes.
+
+        Yields:
+            list[StateType]: For each state, its next state under each minimum
+             action.
+        """
+        num_shards = num_workers * SHARDS_PER_WORKER
+        shard_size = max(1, -(-len(states) // num_shards))
+        shards = [states[i : i + shard_size] for i in range(0, len(states), shard_size)]
+
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_transition_worker,
+            initargs=(self,),
+        ) as executor:
+            for shard_rows in executor.map(_compute_next_state_rows, shards):
+                yield from shard_rows
+
+    def generate_reachable_transition_array(
+        self, seed_states: Iterable[StateType]
+    ) -> None:
+        """Generate a transition array covering only states reachable from seeds.
+
+        States are discovered by breadth-first search through get_next_state, so the
+         possible states are never enumerated. Calling this again with new seed
+         states extends an existing reachable array. Does nothing if a transition
+         array over all possible states already exists.
+
+        Args:
+            seed_states: States from which to discover reachable states.
+
+        Raises:
+            ValueError: If minimum actions are not defined.
+            MemoryBudgetExceededError: If the discovered states outgrow the memory
+             budget (see set_memory_budget).
+        """
+        if self.is_transition_array_complete():
+            return
+        if not self._MIN_ACTIONS:
+            raise ValueError("Minimum actions are not defined.")
+
+        if self._transition_array is None:
+            states = [UndefinedStates.BASIC.value]
+            rows = [[UNDEFINED_STATE_ID] * len(self._MIN_ACTIONS)]
+        else:
+            states = list(self._id_to_state)
+            rows = self._transition_array.tolist()
+        state_to_id = {state: i for i, state in enumerate(states)}
+
+        # IDs are assigned in the order states are queued, so rows are appended in
+        #  ID order.
+        queue: deque[StateType] = deque()
+        for state in seed_states:
+            if state not in state_to_id:
+                state_to_id[state] = len(states)
+                states.append(state)
+                queue.append(state)
+
+        # The number of reachable states is not known up front, so the budget is
+        #  enforced as states are discovered.
+        max_states = self._get_max_states_within_budget()
+        transformation_matrix = self._get_complete_transformation_matrix()
+        while queue:
+            if max_states is not None and len(states) > max_states:
+                self._check_memory_budget(len(states))
+            state = queue.popleft()
+            row = []
+            for min_action in self._MIN_ACTIONS:
+                if transformation_matrix:
+                    next_state = transformation_matrix[state][min_action]
+                else:
+                    next_state = self.get_next_state(state, min_action)
+                next_state_id = state_to_id.get(next_state)
+                if next_state_id is None:
+                    next_state_id = len(states)
+                    state_to_id[next_state] = next_state_id
+                    states.append(next_state)
+                    queue.append(next_state)
+                row.append(next_state_id)
+            rows.append(row)
+
+        self._intern_states(states)
+        self._transition_array_reachable_only = True
+        self._set_transition_array(np.array(rows, dtype=np.int32))
+        # Only a complete matrix that the array was built from is kept as complete.
+        self._is_transformation_matrix_complete = bool(transformation_matrix)
+
+    def _set_transition_array(self, transition_array: TransitionArray | None) -> None:
+        """Install a transition array and the derived lookup structures."""
+        self._transition_array = transition_array
+        self._fingerprint = None
+        self._transition_flat = _view_flat(transition_array)
+        if transition_array is None:
+            self._is_absorbing_id = b""
+            return
+        # In chunks, so that memory-mapped arrays are not read into memory at once.
+        is_absorbing_id = np.zeros(len(transition_array), dtype=bool)
+        for start in range(0, len(transition_array), STATE_CHUNK_SIZE):
+            chunk = transition_array[start : start + STATE_CHUNK_SIZE]
+            state_ids = np.arange(start, start + len(chunk))
+            is_absorbing_id[start : start + len(chunk)] = np.all(
+                chunk == state_ids[:, np.newaxis], axis=1
+            )
+        self._is_absorbing_id = is_absorbing_id.tobytes()
+
+    def _intern_states(self, states: list[StateType] | MappedStateTable) -> None:
+        """Assign dense integer IDs to states in the order given."""
+        self._id_to_state = states
+        if isinstance(states, MappedStateTable):
+            self._state_to_id = MappedStateIndex(states)
+        else:
+            self._state_to_id = {state: i for i, state in enumerate(states)}
+        self._min_action_to_index = {
+            min_action: i for i, min_action in enumerate(self._MIN_ACTIONS)
+        }
+        self._column_of_code = self._compile_column_of_code()
+
+    def _compile_column_of_code(self) -> np.ndarray | None:
+        if not self._min_action_to_index or not all(
+            len(min_action) == 1 and min_action.isascii()
+            for min_action in self._MIN_ACTIONS
+        ):
+            return None
+        column_of_code = np.full(128, -1, dtype=np.int32)
+        for min_action, column in self._min_action_to_index.items():
+            column_of_code[ord(min_action)] = column
+        return column_of_code
+
+    def _lookup_state_id(self, state: StateType) -> StateIdType:
+        try:
+            return self._state_to_id[state]
+        except KeyError:
+            raise ValueError(
+                f"State {state} is not a possible state of the world."
+            ) from None
+
+    def has_transition_array(self) -> bool:
+        return self._transition_array is not None
+
+    def is_transition_array_complete(self) -> bool:
+        """Return True if a transition array covers every possible state."""
+        return (
+            self._transition_array is not None
+            and not self._transition_array_reachable_only
+        )
+
+    def get_transition_array(self) -> TransitionArray:
+        """Return the (num_states, num_min_actions) int32 transition array.
+
+        Raises:
+            ValueError: If the transition array has not been generated.
+        """
+        if self._transition_array is None:
+            raise ValueError("Transition array is not defined.")
+        return self._transition_array
+
+    def get_num_state_ids(self) -> int:
+        """Return the number of interned states, including the undefined state."""
+        return len(self._id_to_state)
+
+    def state_to_id(self, state: StateType) -> StateIdType:
+        """Return the dense integer ID of a state."""
+        return self._lookup_state_id(state)
+
+    def id_to_state(self, state_id: StateIdType) -> StateType:
+        """Return the state with the given dense integer ID."""
+        return self._id_to_state[state_id]
+
+    def states_to_ids(self, states: Iterable[StateType]) -> np.ndarray:
+        """Return the dense integer IDs of several states as an int32 array."""
+        return np.array([self._lookup_state_id(s) for s in states], dtype=np.int32)
+
+    def ids_to_states(self, state_ids: Iterable[StateIdType]) -> list[StateType]:
+        """Return the states with the given dense integer IDs."""
+        id_to_state = self._id_to_state
+        return [id_to_state[i] for i in np.asarray(state_ids).tolist()]
+
+    def min_action_to_index(self, min_action: ActionType) -> int:
+        """Return the column of a minimum action in the transition array."""
+        return self._min_action_to_index[min_action]
+
+    def get_next_state_id(
+        self, state_id: StateIdType, min_action: ActionType
+    ) -> StateIdType:
+        """Return the ID of the state reached by applying a minimum action.
+
+        Raises:
+            ValueError: If the transition array has not been generated or the
+             minimum action is invalid.
+        """
+        if self._transition_array is None:
+            raise ValueError("Transition array is not defined.")
+        if min_action not in self._min_action_to_index:
+            raise ValueError(f"Invalid action: '{min_action}'.")
+        return self._transition_flat[  # type: ignore[index]
+            state_id * len(self._MIN_ACTIONS) + self._min_action_to_index[min_action]
+        ]
 
     def _add_undefined_state_to_possible_states(self) -> None:
         """
@@ -103,19 +853,18 @@ class BaseWorld:
             ValueError: If the minimum action transformation matrix is not defined or if
             the state-action pair is invalid.
         """
-        if self._min_action_transformation_matrix is None:
+        transformation_matrix = self.get_min_action_transformation_matrix()
+        if not transformation_matrix:
             raise ValueError("Minimum action transformation matrix is not defined.")
 
-        if self._current_state not in self._min_action_transformation_matrix:
+        if self._current_state not in transformation_matrix:
             raise ValueError(
                 f"Current state {self._current_state} is not valid in the"
                 " transformation matrix."
             )
 
         try:
-            self._current_state = self._min_action_transformation_matrix[
-                self._current_state
-            ][min_action]
+            self._current_state = transformation_matrix[self._current_state][min_action]
         except KeyError:
             raise ValueError(
                 f"Invalid state-action pair: {self._current_state}-{min_action}. "
@@ -125,15 +874,315 @@ class BaseWorld:
     def apply_action_sequence(self, action_sequence: ActionType) -> None:
         """Apply a sequence of actions in reverse order.
 
+        Stops early once an absorbing state (e.g. the undefined state) is reached.
+
         Args:
             action_sequence (ActionType): The sequence of actions to apply.
-
-        # TODO: Build in a check here so that if action goes to the undefined state, we
-        #  can skip the rest of the lookups.
         """
         for min_action in action_sequence[::-1]:
+            if self._current_state in self._absorbing_states:
+                break
             self._apply_min_action(min_action)
 
+    # --------------------------------------------------------------------------
+    # Stateless simulation
+    # --------------------------------------------------------------------------
+    def simulate(self, state: StateType, action_sequence: ActionType) -> StateType:
+        """Return the state reached by applying an action sequence to a state.
+
+        Actions are applied in reverse order, stopping as soon as an absorbing state
+         is entered. Unlike set_state and apply_action_sequence, this neither
+         validates its inputs nor touches the world's current state, so it can be
+         called concurrently from threads (the simulation statistics are then
+         approximate).
+
+        Args:
+            state: The state to start from.
+            action_sequence: The sequence of actions to apply.
+
+        Returns:
+            StateType: The resulting state.
+
+        Raises:
+            ValueError: If no transition table has been generated.
+        """
+        if self._transition_flat is not None:
+            state_id = self.simulate_id(self._state_to_id[state], action_sequence)
+            return self._id_to_state[state_id]
+
+        transformation_matrix = self._min_action_transformation_matrix
+        if not transformation_matrix:
+            raise ValueError("Minimum action transformation matrix is not defined.")
+        absorbing_states = self._absorbing_states
+        remaining_steps = len(action_sequence)
+        for min_action in reversed(action_sequence):
+            if state in absorbing_states:
+                break
+            state = transformation_matrix[state][min_action]
+            remaining_steps -= 1
+        self._record_simulation(len(action_sequence), remaining_steps)
+        return state
+
+    def simulate_id(
+        self, state_id: StateIdType, action_sequence: ActionType
+    ) -> StateIdType:
+        """Apply an action sequence to a state ID using the transition array.
+
+        Args:
+            state_id: The ID of the state to start from.
+            action_sequence: The sequence of actions to apply.
+
+        Returns:
+            StateIdType: The ID of the resulting state.
+        """
+        transition_flat = self._transition_flat
+        num_min_actions = len(self._MIN_ACTIONS)
+        is_absorbing_id = self._is_absorbing_id
+        remaining_steps = len(action_sequence)
+        for min_action_index in self._iter_min_action_indices_reversed(action_sequence):
+            if is_absorbing_id[state_id]:
+                break
+            state_id = transition_flat[state_id * num_min_actions + min_action_index]
+            remaining_steps -= 1
+        self._record_simulation(len(action_sequence), remaining_steps)
+        return state_id
+
+    def iter_simulated_states(
+        self, state: StateType, action_sequence: ActionType
+    ) -> Iterator[StateType]:
+        """Yield the state reached after each minimum action that simulate applies.
+
+        The sequence is recorded in the simulation statistics once the iterator is
+         exhausted or closed.
+
+        Args:
+            state: The state to start from.
+            action_sequence: The sequence of actions to apply.
+
+        Yields:
+            StateType: The state reached by each minimum action, in the order
+             applied (right to left), until an absorbing state is entered.
+
+        Raises:
+            ValueError: If no transition table has been generated.
+        """
+        remaining_steps = len(action_sequence)
+        try:
+            if self._transition_flat is not None:
+                transition_flat = self._transition_flat
+                num_min_actions = len(self._MIN_ACTIONS)
+                is_absorbing_id = self._is_absorbing_id
+                state_id = self._state_to_id[state]
+                for min_action_index in self._iter_min_action_indices_reversed(
+                    action_sequence
+                ):
+                    if is_absorbing_id[state_id]:
+                        break
+                    state_id = transition_flat[
+                        state_id * num_min_actions + min_action_index
+                    ]
+                    remaining_steps -= 1
+                    yield self._id_to_state[state_id]
+                return
+
+            transformation_matrix = self._min_action_transformation_matrix
+            if not transformation_matrix:
+                raise ValueError("Minimum action transformation matrix is not defined.")
+            for min_action in reversed(action_sequence):
+                if state in self._absorbing_states:
+                    break
+                state = transformation_matrix[state][min_action]
+                remaining_steps -= 1
+                yield state
+        finally:
+            self._record_simulation(len(action_sequence), remaining_steps)
+
+    def simulate_batch(
+        self,
+        state_ids: StateIdType | Iterable[StateIdType],
+        action_sequences: Sequence[ActionType],
+    ) -> TransitionArray:
+        """Apply many action sequences, of any lengths, to state IDs at once.
+
+        Actions are applied in reverse order, so the sequences are aligned on their
+         last actions, padded, and advanced in lockstep: each step is a single
+         NumPy gather on the transition array, kept only for the sequences that
+         have actions left. Absorbing states map to themselves, so none of them is
+         checked for.
+
+        Args:
+            state_ids: The IDs of the states to start from, one per sequence, or a
+             single ID to start every sequence from.
+            action_sequences: The sequences of actions to apply.
+
+        Returns:
+            TransitionArray: The IDs of the resulting states, where entry i is the ID
+             reached by applying action_sequences[i] to state_ids[i].
+
+        Raises:
+            ValueError: If the transition array has not been generated, or there is
+             not one state ID per sequence.
+        """
+        if self._transition_array is None:
+            raise ValueError("Transition array is not defined.")
+        num_sequences = len(action_sequences)
+        state_ids = np.broadcast_to(
+            np.asarray(state_ids, dtype=np.int32), (num_sequences,)
+        )
+
+        lengths, flat_columns, flat_steps = self._get_batch_columns(action_sequences)
+        # Row i of padded_columns holds the columns of sequence i in the order
+        #  applied, then zeros.
+        max_length = int(lengths.max()) if num_sequences else 0
+        padded_columns = np.zeros((num_sequences, max_length), dtype=np.int32)
+        padded_columns[np.repeat(np.arange(num_sequences), lengths), flat_steps] = (
+            flat_columns
+        )
+        is_running = np.arange(max_length) < lengths[:, None]
+
+        transition_array = self._transition_array
+        for step in range(max_length):
+            state_ids = np.where(
+                is_running[:, step],
+                transition_array[state_ids, padded_columns[:, step]],
+                state_ids,
+            )
+
+        stats = self._simulation_stats
+        stats["sequences"] += num_sequences
+        stats["steps"] += len(flat_columns)
+        return np.array(state_ids, dtype=np.int32)
+
+    def _get_batch_columns(
+        self, action_sequences: Sequence[ActionType]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the columns of the minimum actions of several sequences.
+
+        Strings over single-character minimum actions are converted all at once,
+         through a table from character codes to columns.
+
+        Returns:
+            The length of each sequence, and the column and the step (0 for the
+             action applied first) of every minimum action, sequence by sequence.
+        """
+        lengths = np.fromiter(
+            (len(a) for a in action_sequences),
+            dtype=np.int64,
+            count=len(action_sequences),
+        )
+        num_min_actions = int(lengths.sum())
+        starts = np.cumsum(lengths) - lengths
+        positions = np.arange(num_min_actions) - np.repeat(starts, lengths)
+
+        column_of_code = self._column_of_code
+        if column_of_code is not None and all(
+            isinstance(a, str) for a in action_sequences
+        ):
+            try:
+                codes = np.frombuffer(
+                    "".join(action_sequences).encode("ascii"), dtype=np.uint8
+                )
+            except UnicodeEncodeError:
+                raise ValueError("Invalid action in action sequences.") from None
+            flat_columns = column_of_code[codes]
+            if np.any(flat_columns < 0):
+                raise ValueError("Invalid action in action sequences.")
+            # Strings are written left to right, but applied right to left.
+            steps = np.repeat(lengths, lengths) - 1 - positions
+            return lengths, flat_columns, steps
+
+        flat_columns = np.fromiter(
+            (
+                column
+                for a in action_sequences
+                for column in self._iter_min_action_indices_reversed(a)
+            ),
+            dtype=np.int32,
+            count=num_min_actions,
+        )
+        return lengths, flat_columns, positions
+
+    def _record_simulation(self, num_steps: int, skipped_steps: int) -> None:
+        stats = self._simulation_stats
+        stats["sequences"] += 1
+        stats["steps"] += num_steps
+        stats["skipped_steps"] += skipped_steps
+
+    def is_absorbing_state(self, state: StateType) -> bool:
+        """Return True if every minimum action maps the state to itself."""
+        if len(self._is_absorbing_id):
+            return bool(self._is_absorbing_id[self._state_to_id[state]])
+        return state in self._absorbing_states
+
+    def get_simulation_stats(self) -> dict[str, int]:
+        """Return counters for sequences simulated and steps skipped.
+
+        Returns:
+            dict: Number of sequences simulated, total steps requested, and steps
+             skipped because an absorbing state was reached.
+        """
+        return dict(self._simulation_stats)
+
+    def reset_simulation_stats(self) -> None:
+        self._simulation_stats = {"sequences": 0, "steps": 0, "skipped_steps": 0}
+
+    def compute_action_function(
+        self,
+        action_sequence: ActionType,
+        state_ids: TransitionArray | None = None,
+    ) -> TransitionArray:
+        """Apply an action sequence to many states at once.
+
+        Each minimum action is applied to every state with a single NumPy gather
+         on the transition array, in reverse order.
+
+        Args:
+            action_sequence: The sequence of actions to apply.
+            state_ids: IDs of the states to start from. Defaults to all states.
+
+        Returns:
+            TransitionArray: The action function as an array, where entry i is the
+             ID of the state reached from state_ids[i] (or from state i).
+
+        Raises:
+            ValueError: If the transition array has not been generated.
+        """
+        if self._transition_array is None:
+            raise ValueError("Transition array is not defined.")
+        if state_ids is None:
+            state_ids = np.arange(len(self._transition_array), dtype=np.int32)
+
+        transition_array = self._transition_array
+        for min_action_index in self._iter_min_action_indices_reversed(action_sequence):
+            state_ids = transition_array[state_ids, min_action_index]
+        return state_ids
+
+    def _iter_min_action_indices_reversed(
+        self, action_sequence: ActionType
+    ) -> Iterator[int]:
+        """Yield the array columns of a sequence's minimum actions, right to left.
+
+        ActionWords over the world's minimum actions already hold the columns as
+         their digits, so no minimum action is looked up.
+        """
+        if (
+            isinstance(action_sequence, ActionWord)
+            and list(action_sequence.alphabet.min_actions) == self._MIN_ACTIONS
+        ):
+            return action_sequence.iter_indices_reversed()
+        min_action_to_index = self._min_action_to_index
+        return (min_action_to_index[a] for a in reversed(action_sequence))
+
+    def get_candidate_automorphisms(self) -> list[np.ndarray]:
+        """Return candidate automorphisms of the world's transition array.
+
+        Each candidate is a permutation of the state IDs (entry i is the image of
+         state ID i) that may commute with every minimum action, such as a
+         translation of a cyclic grid. Candidates are verified against the
+         transition array by worlds.utils.symmetry. None by default.
+        """
+        return []
+
     def get_min_actions(self) -> MinActionsType:
         return self._MIN_ACTIONS
 
@@ -157,9 +1206,10 @@ class BaseWorld:
         # Set the properties
         self._MIN_ACTIONS = properties["minimum_actions"]
         self._possible_states = properties["possible_states"]
-        self._min_action_transformation_matrix = properties[
-            "min_action_transformation_matrix"
-        ]
+        self._set_min_action_transformation_matrix(
+            properties["min_action_transformation_matrix"]
+        )
+        self._set_transition_array(None)
 
         # Set additional properties
         for key, value in properties.items():
@@ -170,6 +1220,54 @@ class BaseWorld:
             ]:
                 setattr(self, f"_{key.upper()}", value)
 
+    def save_world_binary(self, path: str) -> None:
+        """Save the world in the memory-mappable binary layout of WorldSaver.
+
+        The transition array over all possible states is generated if needed.
+
+        Args:
+            path: The directory, relative to ./saved/worlds, to save to.
+        """
+        if not self.is_transition_array_complete():
+            self.generate_transition_array()
+        properties = {
+            "minimum_actions": self._MIN_ACTIONS,
+            **self._get_additional_properties_for_save(),
+        }
+        self.world_saver.save_world_binary(
+            properties,
+            self._id_to_state,
+            self.get_transition_array(),
+            path,
+            fingerprint=self.fingerprint(),
+        )
+
+    def load_world_binary(self, path: str) -> None:
+        """Load a world saved with save_world_binary.
+
+        The transition array is memory-mapped read-only, and the states too when
+         they are integers or tuples of integers, so nothing is copied onto the heap
+         and worker processes loading the same world share it.
+
+        Args:
+            path: The directory, relative to ./saved/worlds, to load from.
+        """
+        properties = self.world_saver.load_world_binary(path)
+        states = properties.pop("states")
+        transition_array = properties.pop("transition_array")
+
+        self._MIN_ACTIONS = properties.pop("minimum_actions")
+        self._intern_states(states)
+        self._possible_states = states[1:]
+        self._set_min_action_transformation_matrix({})
+        self._transition_array_reachable_only = False
+        self._set_transition_array(transition_array)
+        self._fingerprint = properties.pop("fingerprint")
+
+        # Set additional properties
+        for key, value in properties.items():
+            setattr(self, f"_{key.upper()}", value)
+
     def _get_world_properties_for_save(self) -> dict:
         """Collect all relevant world properties into a dictionary.
 
@@ -180,7 +1278,9 @@ class BaseWorld:
         return {
             "minimum_actions": self._MIN_ACTIONS,
             "possible_states": self._possible_states,
-            "min_action_transformation_matrix": self._min_action_transformation_matrix,
+            "min_action_transformation_matrix": (
+                self.get_min_action_transformation_matrix()
+            ),
             **self._get_additional_properties_for_save(),
         }
 
@@ -222,14 +1322,38 @@ class BaseWorld:
 
             webbrowser.open(f"file://{output_path.absolute()}")
 
+    def export_graph(
+        self,
+        path: str,
+        include_undefined_state: bool = False,
+        show_edge_labels: bool = True,
+        layout_hint: bool = False,
+    ) -> int:
+        """Stream the world's graph to a DOT or GraphML file, without a layout.
+
+        See worlds.utils.graph_export.export_world_graph.
+
+        Returns:
+            int: The number of edges written.
+        """
+        return export_world_graph(
+            self,
+            path,
+            include_undefined_state,
+            show_edge_labels,
+            layout_hint,
+        )
+
     def _create_and_layout_graph(
         self,
         include_undefined_state: bool,
         show_edge_labels: bool = False,
         show_legend: bool = True,
         layout_engine: str = "dot",
-    ) -> pgv.AGraph:
+    ) -> "pgv.AGraph":
         """Create and layout the graph."""
+        import pygraphviz as pgv  # noqa: PLC0415 (slow to import)
+
         # Layout engine specific settings
         layout_settings = {
             "dot": {
@@ -293,8 +1417,8 @@ class BaseWorld:
         graph.layout(prog=layout_engine)
         return graph
 
-    def _create_color_map(self) -> dict[str, str]:
-        """Create a color map for actions."""
+    def get_action_color_map(self) -> dict[str, str]:
+        """Return the color of each minimum action in drawn and exported graphs."""
         colors = [
             "#1f77b4",  # Steel blue
             "#d62728",  # Crimson
@@ -314,7 +1438,7 @@ class BaseWorld:
 
     def _create_legend_label(self) -> str:
         """Create HTML-like label for the legend."""
-        color_map = self._create_color_map()
+        color_map = self.get_action_color_map()
         undefined_state = UndefinedStates.BASIC.value
 
         # Build legend table with two columns
@@ -359,14 +1483,14 @@ class BaseWorld:
         return "".join(legend)
 
     def _add_nodes_and_edges(
-        self, graph: pgv.AGraph, include_undefined_state: bool, show_edge_labels: bool
+        self, graph: "pgv.AGraph", include_undefined_state: bool, show_edge_labels: bool
     ) -> None:
         """Add nodes and edges to the graph."""
         # Unicode subscript digits mapping
         subscripts = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
 
         undefined_state = UndefinedStates.BASIC.value
-        color_map = self._create_color_map()
+        color_map = self.get_action_color_map()
 
         # Track self-loops per node to position them
         self_loop_counts = {}
@@ -399,7 +1523,7 @@ class BaseWorld:
                 graph.add_node(state, label=f"w{subscript}")
 
         # Add edges
-        for state, actions in self._min_action_transformation_matrix.items():
+        for state, actions in self.get_min_action_transformation_matrix().items():
             if state != undefined_state or include_undefined_state:
                 for action, next_state in actions.items():
                     if next_state != undefined_state or include_undefined_state:
@@ -449,7 +1573,7 @@ class BaseWorld:
 
     def _add_edge(
         self,
-        graph: pgv.AGraph,
+        graph: "pgv.AGraph",
         source: StateType,
         target: StateType,
         action: str,
@@ -468,7 +1592,7 @@ class BaseWorld:
 
     def _add_node(
         self,
-        graph: pgv.AGraph,
+        graph: "pgv.AGraph",
         state: StateType,
         index: int,
         subscripts: dict[int, int],
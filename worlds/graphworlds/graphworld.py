@@ -0,0 +1,286 @@
+"""
+Graph worlds built from explicit edge lists or CSR arrays.
+
+States are (i,) for i in range(num_states). Each edge takes a state to a next
+ state under a minimum action; a negative next state index is the undefined state.
+The edges are compiled once into the dense transition array, from which
+ transitions are served.
+"""
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+
+from utils.type_definitions import (
+    ActionType,
+    MinActionsType,
+    StateType,
+    TransitionArray,
+)
+from worlds.base_world import BaseWorld
+from worlds.utils.undefined_action_strat import UndefinedActionStrat
+from worlds.utils.undefined_state import UNDEFINED_STATE_ID, UndefinedStates
+
+# Columns (state, action index, next state) of an edge list array.
+EDGE_LIST_COLUMNS = 3
+
+
+class GraphWorld(BaseWorld):
+    """
+    A world given by a deterministic labelled graph in CSR form.
+
+    The outgoing edges of state i are indices[indptr[i]:indptr[i + 1]], labelled
+     with the minimum actions action_labels[indptr[i]:indptr[i + 1]].
+
+    Args:
+        indptr (np.ndarray): CSR row pointers, of length num_states + 1.
+        indices (np.ndarray): The next state index of each edge.
+        action_labels (np.ndarray): The minimum action of each edge, either as
+         indices into min_actions or as the actions themselves.
+        min_actions (MinActionsType): The minimum actions of the world.
+        undefined_action_strategy (str): What minimum actions without an edge do,
+         must be either 'identity' or 'masked'.
+
+    Raises:
+        ValueError: If the arrays are inconsistent, an edge refers to an unknown
+         state or action, or a state has two edges with the same action.
+    """
+
+    def __init__(
+        self,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        action_labels: np.ndarray,
+        min_actions: MinActionsType,
+        undefined_action_strategy: str = "masked",
+    ) -> None:
+        super().__init__(list(min_actions))
+        indptr = np.asarray(indptr, dtype=np.int64)
+        indices = np.asarray(indices, dtype=np.int64)
+        if indptr.ndim != 1 or len(indptr) == 0 or indptr[0] != 0:
+            raise ValueError("indptr must be a non-empty 1D array starting at 0.")
+        if np.any(np.diff(indptr) < 0) or indptr[-1] != len(indices):
+            raise ValueError("indptr must be non-decreasing and end at len(indices).")
+        if len(action_labels) != len(indices):
+            raise ValueError("action_labels and indices must have the same length.")
+
+        self._NUM_STATES = len(indptr) - 1
+        self._UNDEFINED_ACTION_STRATEGY = undefined_action_strategy
+        sources = np.repeat(np.arange(self._NUM_STATES), np.diff(indptr))
+        self._transition_table = _create_default_transition_array(
+            self._NUM_STATES,
+            len(self._MIN_ACTIONS),
+            UndefinedActionStrat(undefined_action_strategy),
+        )
+        _compile_edges(
+            self._transition_table,
+            sources,
+            self._get_action_indices(np.asarray(action_labels)),
+            indices,
+        )
+
+    @classmethod
+    def from_edge_list(
+        cls,
+        edges: tuple[np.ndarray, np.ndarray, np.ndarray],
+        min_actions: MinActionsType,
+        num_states: int | None = None,
+        undefined_action_strategy: str = "masked",
+    ) -> "GraphWorld":
+        """
+        Creates a graph world from an edge list.
+
+        Args:
+            edges: Parallel arrays of the edge states, action labels and next states.
+            num_states: Number of states. Defaults to one more than the largest
+             state index in the edges.
+        """
+        sources = np.asarray(edges[0], dtype=np.int64)
+        action_labels = edges[1]
+        targets = np.asarray(edges[2], dtype=np.int64)
+        if num_states is None:
+            num_states = int(max(sources.max(initial=-1), targets.max(initial=-1)) + 1)
+        if np.any(sources < 0) or np.any(sources >= num_states):
+            raise ValueError(f"Edge sources must be in range [0, {num_states}).")
+        order = np.argsort(sources, kind="stable")
+        indptr = np.zeros(num_states + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_states), out=indptr[1:])
+        return cls(
+            indptr,
+            targets[order],
+            np.asarray(action_labels)[order],
+            min_actions,
+            undefined_action_strategy,
+        )
+
+    def _get_action_indices(self, action_labels: np.ndarray) -> np.ndarray:
+        """Converts edge action labels to indices into the minimum actions."""
+        if action_labels.dtype.kind in "iu":
+            action_indices = action_labels.astype(np.int64)
+            if np.any(action_indices < 0) or np.any(
+                action_indices >= len(self._MIN_ACTIONS)
+            ):
+                raise ValueError(
+                    f"Action indices must be in range [0, {len(self._MIN_ACTIONS)})."
+                )
+            return action_indices
+
+        action_to_index = {a: j for j, a in enumerate(self._MIN_ACTIONS)}
+        labels, inverse = np.unique(action_labels.astype(str), return_inverse=True)
+        unknown_labels = [label for label in labels if label not in action_to_index]
+        if unknown_labels:
+            raise ValueError(f"Invalid actions in edges: {unknown_labels}.")
+        label_indices = np.array(
+            [action_to_index[label] for label in labels], dtype=np.int64
+        )
+        return label_indices[inverse]
+
+    def generate_possible_states(self) -> list[StateType]:
+        return [(i,) for i in range(self._NUM_STATES)]
+
+    def count_possible_states(self) -> int:
+        return self._NUM_STATES
+
+    def get_next_state(self, state: StateType, min_action: ActionType) -> StateType:
+        if min_action not in self._MIN_ACTIONS:
+            raise ValueError(f"Invalid action: '{min_action}'.")
+        if not (isinstance(state, tuple) and 0 <= state[0] < self._NUM_STATES):
+            raise ValueError(f"Invalid state: '{state}'.")
+        next_state_id = int(
+            self._transition_table[state[0] + 1, self._MIN_ACTIONS.index(min_action)]
+        )
+        if next_state_id == UNDEFINED_STATE_ID:
+            return UndefinedStates.BASIC.value
+        return (next_state_id - 1,)
+
+    def _build_transition_array_vectorized(
+        self,
+    ) -> tuple[list[StateType], TransitionArray] | None:
+        states = [UndefinedStates.BASIC.value, *self.generate_possible_states()]
+        return states, self._transition_table
+
+    def draw(self):
+        pass
+
+    def _get_additional_properties_for_save(self) -> dict:
+        """Get additional properties specific to GraphWorld.
+
+        Returns:
+            dict: Additional properties including the number of states, the
+             undefined action strategy and a digest of the transitions.
+        """
+        return {
+            "num_states": self._NUM_STATES,
+            "undefined_action_strategy": self._UNDEFINED_ACTION_STRATEGY,
+            "transitions_sha256": hashlib.sha256(
+                self._transition_table.tobytes()
+            ).hexdigest(),
+        }
+
+
+def load_graph_world(
+    path: str,
+    min_actions: MinActionsType | None = None,
+    num_states: int | None = None,
+    undefined_action_strategy: str = "masked",
+) -> GraphWorld:
+    """
+    Creates a graph world from an edge list file.
+
+    A .npy file holds an integer array of shape (num_edges, 3) with rows
+     (state, action index, next state). Any other file is read as text with one
+     'state action next_state' edge per line, where action is the action label.
+
+    Args:
+        min_actions: The minimum actions. Required for .npy files; for text files
+         defaults to the action labels in order of first appearance.
+    """
+    if Path(path).suffix == ".npy":
+        edges = np.load(path)
+        if edges.shape[1:] != (EDGE_LIST_COLUMNS,):
+            raise ValueError(
+                f"Edge list arrays must have shape (num_edges, {EDGE_LIST_COLUMNS})."
+            )
+        if min_actions is None:
+            raise ValueError("min_actions is required for .npy edge lists.")
+        sources, action_labels, targets = edges[:, 0], edges[:, 1], edges[:, 2]
+    else:
+        edges = np.loadtxt(path, dtype=str, ndmin=2)
+        sources = edges[:, 0].astype(np.int64)
+        action_labels = edges[:, 1]
+        targets = edges[:, 2].astype(np.int64)
+        if min_actions is None:
+            min_actions = list(dict.fromkeys(action_labels.tolist()))
+    return GraphWorld.from_edge_list(
+        (sources, action_labels, targets),
+        min_actions,
+        num_states,
+        undefined_action_strategy,
+    )
+
+
+def load_graph_world_csr(
+    indptr_path: str,
+    indices_path: str,
+    action_labels_path: str,
+    min_actions: MinActionsType,
+    undefined_action_strategy: str = "masked",
+) -> GraphWorld:
+    """
+    Creates a graph world from CSR arrays stored in .npy or text files.
+
+    Action labels in text files are read as labels unless they are all integers,
+     in which case they are indices into min_actions.
+    """
+    return GraphWorld(
+        _load_array(indptr_path, np.int64),
+        _load_array(indices_path, np.int64),
+        _load_array(action_labels_path, None),
+        min_actions,
+        undefined_action_strategy,
+    )
+
+
+def _load_array(path: str, dtype: type | None) -> np.ndarray:
+    if Path(path).suffix == ".npy":
+        array = np.load(path)
+    else:
+        array = np.loadtxt(path, dtype=str, ndmin=1)
+        if dtype is not None or all(value.lstrip("-").isdigit() for value in array):
+            array = array.astype(np.int64)
+    return array if dtype is None else array.astype(dtype)
+
+
+def _create_default_transition_array(
+    num_states: int, num_actions: int, strategy: UndefinedActionStrat
+) -> TransitionArray:
+    """
+    Creates the transition array of a graph without edges, over state IDs where
+     state (i,) has ID i + 1 and the undefined state has ID UNDEFINED_STATE_ID.
+    """
+    transition_array = np.full(
+        (num_states + 1, num_actions), UNDEFINED_STATE_ID, dtype=np.int32
+    )
+    if strategy == UndefinedActionStrat.IDENTITY:
+        state_ids = np.arange(1, num_states + 1, dtype=np.int32)
+        transition_array[1:] = state_ids[:, np.newaxis]
+    return transition_array
+
+
+def _compile_edges(
+    transition_array: TransitionArray,
+    sources: np.ndarray,
+    action_indices: np.ndarray,
+    targets: np.ndarray,
+) -> None:
+    """Writes edges into a transition array from _create_default_transition_array."""
+    num_states, num_actions = transition_array.shape[0] - 1, transition_array.shape[1]
+    if np.any(targets >= num_states):
+        raise ValueError(f"Edge targets must be less than {num_states}.")
+    edge_keys = sources * num_actions + action_indices
+    if len(np.unique(edge_keys)) != len(edge_keys):
+        raise ValueError("Each state may have at most one edge per action.")
+    transition_array[sources + 1, action_indices] = np.where(
+        targets < 0, UNDEFINED_STATE_ID, targets + 1
+    )
@@ -1,8 +1,16 @@
+from typing import ClassVar
+
 from utils.type_definitions import ActionType, StateType
 from worlds.base_world import BaseWorld
 
 
 class GraphWorld2(BaseWorld):
+    _MIN_ACTION_TRANSITIONS: ClassVar[dict[ActionType, dict[StateType, StateType]]] = {
+        "a": {(1,): (1,), (2,): (2,), (3,): (3,)},
+        "b": {(1,): (2,), (2,): (1,), (3,): (2,)},
+        "c": {(1,): (3,), (2,): (2,), (3,): (1,)},
+    }
+
     def __init__(self) -> None:
         min_actions = ["a", "b", "c"]
         super().__init__(min_actions)
@@ -11,14 +19,8 @@ class GraphWorld2(BaseWorld):
         return [(1,), (2,), (3,)]
 
     def get_next_state(self, state: StateType, min_action: ActionType) -> StateType:
-        min_action_transitions = {
-            "a": {(1,): (1,), (2,): (2,), (3,): (3,)},
-            "b": {(1,): (2,), (2,): (1,), (3,): (2,)},
-            "c": {(1,): (3,), (2,): (2,), (3,): (1,)},
-        }
-
-        if min_action in min_action_transitions:
-            next_state = min_action_transitions[min_action].get(state)
+        if min_action in self._MIN_ACTION_TRANSITIONS:
+            next_state = self._MIN_ACTION_TRANSITIONS[min_action].get(state)
             if next_state is None:
                 raise ValueError(
                     f"Invalid state: '{state}' for action: '{min_action}'."
@@ -1,5 +1,17 @@
-from utils.type_definitions import GridPosition2DType, StateType
+import numpy as np
+
+from utils.type_definitions import (
+    ActionType,
+    GridPosition2DType,
+    StateType,
+    TransitionArray,
+)
 from worlds.gridworlds2d.utils.move_objects_2d import MoveObject2DGrid
+from worlds.gridworlds2d.utils.translate_objects_2d import (
+    generate_translation_candidates,
+    translate_position,
+)
+from worlds.utils.undefined_state import UNDEFINED_STATE_ID, UndefinedStates
 
 from ..base_world import BaseWorld
 from .utils.generate_2d_grid_positions import generate_2d_grid_positions
@@ -33,11 +45,50 @@ class Gridworld2D(BaseWorld):
         possible_states = generate_2d_grid_positions(grid_size=self._GRID_SHAPE)
         return possible_states
 
+    def count_possible_states(self) -> int:
+        return self._GRID_SHAPE[0] * self._GRID_SHAPE[1]
+
     def get_next_state(self, state, min_action):
         return MoveObject2DGrid(min_action).apply(
             object_position=state, grid_shape=self._GRID_SHAPE
         )
 
+    def _build_transition_array_vectorized(
+        self,
+    ) -> tuple[list[StateType], TransitionArray] | None:
+        """Build the transition table with array arithmetic over all positions."""
+        states = [UndefinedStates.BASIC.value, *self.generate_possible_states()]
+        transition_array = np.full(
+            (len(states), len(self._MIN_ACTIONS)), UNDEFINED_STATE_ID, dtype=np.int32
+        )
+        xs, ys = np.divmod(np.arange(len(states) - 1), self._GRID_SHAPE[1])
+        for j, min_action in enumerate(self._MIN_ACTIONS):
+            transition_array[1:, j] = self._get_next_state_ids(xs, ys, min_action)
+        return states, transition_array
+
+    def _get_next_state_ids(
+        self, xs: np.ndarray, ys: np.ndarray, min_action: ActionType
+    ) -> np.ndarray:
+        """Return the next state IDs of the positions (xs, ys) under min_action.
+
+        State IDs follow the order of generate_possible_states, offset by one for the
+         undefined state.
+        """
+        new_xs, new_ys = MoveObject2DGrid(min_action).apply_to_arrays(
+            xs, ys, self._GRID_SHAPE
+        )
+        return new_xs * self._GRID_SHAPE[1] + new_ys + 1
+
+    def get_candidate_automorphisms(self) -> list[np.ndarray]:
+        return generate_translation_candidates(
+            self, self._GRID_SHAPE, self._translate_state
+        )
+
+    def _translate_state(
+        self, state: StateType, offset: GridPosition2DType
+    ) -> StateType | None:
+        return translate_position(state, offset, self._GRID_SHAPE)  # type: ignore[arg-type]
+
     def draw(self):
         # TODO: Implement this.
         pass
@@ -1,9 +1,23 @@
-from utils.type_definitions import ActionType, GridPosition2DType, StateType
+from collections.abc import Iterator
+
+import numpy as np
+
+from utils.type_definitions import (
+    ActionType,
+    GridPosition2DType,
+    StateType,
+    TransitionArray,
+)
 from worlds.base_world import BaseWorld
 from worlds.gridworlds2d.utils.generate_2d_grid_positions import (
     generate_2d_grid_positions,
 )
 from worlds.gridworlds2d.utils.move_objects_2d import MoveObject2DGrid
+from worlds.gridworlds2d.utils.translate_objects_2d import (
+    generate_translation_candidates,
+    translate_position,
+)
+from worlds.utils.undefined_state import UNDEFINED_STATE_ID, UndefinedStates
 
 
 class Gridworld2DBlock(BaseWorld):
@@ -17,7 +31,9 @@ class Gridworld2DBlock(BaseWorld):
         self._GRID_SHAPE = grid_shape
 
     def generate_possible_states(self) -> list[StateType]:
-        possible_states = []
+        return list(self.iter_possible_states())
+
+    def iter_possible_states(self) -> Iterator[StateType]:
         possible_agent_positions = generate_2d_grid_positions(
             grid_size=self._GRID_SHAPE
         )
@@ -27,9 +43,11 @@ class Gridworld2DBlock(BaseWorld):
         for agent_position in possible_agent_positions:
             for block_position in possible_block_positions:
                 if agent_position != block_position:
-                    state = (*agent_position, block_position)
-                    possible_states.append(state)
-        return possible_states
+                    yield (*agent_position, block_position)
+
+    def count_possible_states(self) -> int:
+        num_positions = self._GRID_SHAPE[0] * self._GRID_SHAPE[1]
+        return num_positions * (num_positions - 1)
 
     def get_next_state(self, state: StateType, min_action: ActionType):
         agent_position = state[:2]
@@ -47,6 +65,62 @@ class Gridworld2DBlock(BaseWorld):
         next_state = (*new_agent_position, new_block_position)
         return next_state
 
+    def _build_transition_array_vectorized(
+        self,
+    ) -> tuple[list[StateType], TransitionArray] | None:
+        """Build the transition table with array arithmetic over all
+        (agent, block) position pairs, pushing the block element-wise."""
+        states = [UndefinedStates.BASIC.value, *self.iter_possible_states()]
+        max_x, max_y = self._GRID_SHAPE
+        num_positions = max_x * max_y
+
+        # Position pairs are indexed agent-major, as in generate_possible_states.
+        agent_indices, block_indices = np.divmod(
+            np.arange(num_positions * num_positions), num_positions
+        )
+        is_valid_pair = agent_indices != block_indices
+        agent_indices = agent_indices[is_valid_pair]
+        block_indices = block_indices[is_valid_pair]
+        pair_to_state_id = np.full(
+            num_positions * num_positions, UNDEFINED_STATE_ID, dtype=np.int32
+        )
+        pair_to_state_id[is_valid_pair] = np.arange(1, len(states), dtype=np.int32)
+
+        agent_xs, agent_ys = np.divmod(agent_indices, max_y)
+        block_xs, block_ys = np.divmod(block_indices, max_y)
+        transition_array = np.full(
+            (len(states), len(self._MIN_ACTIONS)), UNDEFINED_STATE_ID, dtype=np.int32
+        )
+        for j, min_action in enumerate(self._MIN_ACTIONS):
+            move = MoveObject2DGrid(min_action)
+            new_agent_xs, new_agent_ys = move.apply_to_arrays(
+                agent_xs, agent_ys, self._GRID_SHAPE
+            )
+            pushed_block_xs, pushed_block_ys = move.apply_to_arrays(
+                block_xs, block_ys, self._GRID_SHAPE
+            )
+            is_pushed = (new_agent_xs == block_xs) & (new_agent_ys == block_ys)
+            new_block_xs = np.where(is_pushed, pushed_block_xs, block_xs)
+            new_block_ys = np.where(is_pushed, pushed_block_ys, block_ys)
+            new_agent_indices = new_agent_xs * max_y + new_agent_ys
+            new_block_indices = new_block_xs * max_y + new_block_ys
+            transition_array[1:, j] = pair_to_state_id[
+                new_agent_indices * num_positions + new_block_indices
+            ]
+        return states, transition_array
+
+    def get_candidate_automorphisms(self) -> list[np.ndarray]:
+        return generate_translation_candidates(
+            self, self._GRID_SHAPE, self._translate_state
+        )
+
+    def _translate_state(
+        self, state: StateType, offset: GridPosition2DType
+    ) -> StateType | None:
+        agent_position = translate_position(state[:2], offset, self._GRID_SHAPE)  # type: ignore[index]
+        block_position = translate_position(state[2], offset, self._GRID_SHAPE)  # type: ignore[index]
+        return (*agent_position, block_position)
+
     def draw(self):
         pass
 
@@ -1,4 +1,7 @@
 import itertools
+from collections.abc import Iterator
+
+import numpy as np
 
 from utils.type_definitions import ActionType, GridPosition2DType, StateType
 from worlds.base_world import BaseWorld
@@ -6,6 +9,10 @@ from worlds.gridworlds2d.utils.generate_2d_grid_positions import (
     generate_2d_grid_positions,
 )
 from worlds.gridworlds2d.utils.move_objects_2d import MoveObject2DGrid
+from worlds.gridworlds2d.utils.translate_objects_2d import (
+    generate_translation_candidates,
+    translate_position,
+)
 from worlds.utils.undefined_action_strat import UndefinedActionStrat
 
 
@@ -15,13 +22,19 @@ class Gridworld2DConsumable(BaseWorld):
         grid_shape: GridPosition2DType,
         consumable_positions: list[GridPosition2DType],
         consume_strategy: str,
+        state_encoding: str = "tuple",
     ):
         """
         Initializes the Gridworld2DConsumable instance.
-        States are of the form:
+        With the 'tuple' state encoding, states are of the form:
         (agent_x, agent_y, ((consumable1_x, consumable1_y),
           (consumable2_x, consumable2_y),
           ...))
+        With the 'packed' state encoding, states are single integers
+        (agent_index << num_consumables) | remaining_mask, where agent_index is
+        agent_x * max_y + agent_y and bit i of remaining_mask is set if the i-th
+        consumable in consumable_positions has not been consumed (see encode_state
+        and decode_state).
 
         Args:
             grid_shape (GridPosition2DType): The shape of the grid.
@@ -29,17 +42,40 @@ class Gridworld2DConsumable(BaseWorld):
              consumables are located.
             consume_strategy (str): The strategy for consuming items, must be either
              'identity' or 'masked'.
+            state_encoding (str): How states are represented, must be either 'tuple'
+             or 'packed'.
 
         Raises:
-            ValueError: If consume_strategy is not 'identity' or 'masked'.
+            ValueError: If consume_strategy is not 'identity' or 'masked', or if
+             state_encoding is not 'tuple' or 'packed'.
         """
         min_actions = ["1", "W", "E", "N", "S", "C"]
         super().__init__(min_actions)
         if consume_strategy not in ["identity", "masked"]:
             raise ValueError("wall_strategy must be either 'identity' or 'masked'")
+        if state_encoding not in ["tuple", "packed"]:
+            raise ValueError("state_encoding must be either 'tuple' or 'packed'")
         self._CONSUME_STRATEGY = consume_strategy
         self._GRID_SHAPE = grid_shape
         self._CONSUMABLE_POSITIONS = consumable_positions
+        self._STATE_ENCODING = state_encoding
+        self._compile_consumable_bits()
+
+    def __setstate__(self, state: dict) -> None:
+        super().__setstate__(state)
+        # Worlds pickled before the packed encoding existed use tuple states.
+        if "_STATE_ENCODING" not in state:
+            self._STATE_ENCODING = "tuple"
+            self._compile_consumable_bits()
+
+    def _compile_consumable_bits(self) -> None:
+        """Record, for the packed encoding, the consumable bits at each agent index."""
+        self._num_consumables = len(self._CONSUMABLE_POSITIONS)
+        self._consumable_bits_by_index = [0] * (
+            self._GRID_SHAPE[0] * self._GRID_SHAPE[1]
+        )
+        for i, position in enumerate(self._CONSUMABLE_POSITIONS):
+            self._consumable_bits_by_index[self._agent_index(position)] |= 1 << i
 
     def generate_possible_states(self) -> list[StateType]:
         """
@@ -47,18 +83,35 @@ class Gridworld2DConsumable(BaseWorld):
          positions.
 
         Returns:
-            list[StateType]: A list of possible states represented as tuples.
+            list[StateType]: A list of possible states represented as tuples (or as
+             integers with the packed state encoding).
+        """
+        return list(self.iter_possible_states())
+
+    def iter_possible_states(self) -> Iterator[StateType]:
+        """
+        Yields the possible states in the order of generate_possible_states,
+         without storing them.
         """
-        possible_states = []
+        if self._STATE_ENCODING == "packed":
+            yield from range(self.count_possible_states())
+            return
+
         agent_positions = generate_2d_grid_positions(grid_size=self._GRID_SHAPE)
         for agent_position in agent_positions:
             for num_consumables in range(len(self._CONSUMABLE_POSITIONS) + 1):
                 for consumable_positions in itertools.combinations(
                     self._CONSUMABLE_POSITIONS, num_consumables
                 ):
-                    state = (*agent_position, (*consumable_positions,))
-                    possible_states.append(state)
-        return possible_states
+                    yield (*agent_position, (*consumable_positions,))
+
+    def count_possible_states(self) -> int:
+        """
+        Returns the number of possible states: each agent position combined with
+         each subset of the consumables.
+        """
+        num_agent_positions = self._GRID_SHAPE[0] * self._GRID_SHAPE[1]
+        return num_agent_positions << self._num_consumables
 
     def get_next_state(self, state: StateType, min_action: ActionType) -> StateType:
         """
@@ -71,6 +124,9 @@ class Gridworld2DConsumable(BaseWorld):
         Returns:
             StateType: The next state after the action is applied.
         """
+        if self._STATE_ENCODING == "packed":
+            return self._get_next_packed_state(state, min_action)  # type: ignore[arg-type]
+
         if min_action == "C":
             next_state = _apply_consume_action(state, self._CONSUME_STRATEGY)
         else:
@@ -83,6 +139,107 @@ class Gridworld2DConsumable(BaseWorld):
 
         return next_state
 
+    def _get_next_packed_state(self, state: int, min_action: ActionType) -> StateType:
+        """
+        Computes the next state for the packed state encoding.
+
+        Consuming clears the highest remaining consumable bit at the agent's
+         position. Consumables sharing a position are interchangeable, so keeping the
+         lowest bits set matches the canonical form produced by encode_state.
+        """
+        agent_index = state >> self._num_consumables
+        remaining_mask = state & ((1 << self._num_consumables) - 1)
+
+        if min_action == "C":
+            consumable_bits = (
+                remaining_mask & self._consumable_bits_by_index[agent_index]
+            )
+            if consumable_bits:
+                return state & ~(1 << (consumable_bits.bit_length() - 1))
+            return UndefinedActionStrat(self._CONSUME_STRATEGY).apply(state)
+
+        agent_position = divmod(agent_index, self._GRID_SHAPE[1])
+        new_agent_position = MoveObject2DGrid(min_action).apply(
+            object_position=agent_position, grid_shape=self._GRID_SHAPE
+        )
+        new_agent_index = self._agent_index(new_agent_position)
+        return (new_agent_index << self._num_consumables) | remaining_mask
+
+    def _agent_index(self, agent_position: GridPosition2DType) -> int:
+        return agent_position[0] * self._GRID_SHAPE[1] + agent_position[1]
+
+    def encode_state(self, state: StateType) -> int:
+        """
+        Packs a tuple-encoded state into an integer.
+
+        Args:
+            state (StateType): A state of the form (agent_x, agent_y,
+             (consumable positions...)).
+
+        Returns:
+            int: The packed state.
+        """
+        agent_position = state[:2]  # type: ignore[index]
+        remaining_mask = 0
+        for position in state[2]:  # type: ignore[index]
+            candidate_bits = (
+                self._consumable_bits_by_index[self._agent_index(position)]
+                & ~remaining_mask
+            )
+            remaining_mask |= candidate_bits & -candidate_bits
+        agent_index = self._agent_index(agent_position)
+        return (agent_index << self._num_consumables) | remaining_mask
+
+    def decode_state(self, state: int) -> StateType:
+        """
+        Unpacks a packed state into the tuple encoding.
+
+        Args:
+            state (int): The packed state.
+
+        Returns:
+            StateType: The state as (agent_x, agent_y, (consumable positions...)).
+        """
+        agent_index = state >> self._num_consumables
+        consumable_positions = tuple(
+            position
+            for i, position in enumerate(self._CONSUMABLE_POSITIONS)
+            if state >> i & 1
+        )
+        return (*divmod(agent_index, self._GRID_SHAPE[1]), consumable_positions)
+
+    def get_candidate_automorphisms(self) -> list[np.ndarray]:
+        """
+        Returns the translations of the grid as candidate automorphisms. They are
+         only candidates if the consumable positions are translation invariant.
+        """
+        return generate_translation_candidates(
+            self, self._GRID_SHAPE, self._translate_state
+        )
+
+    def _translate_state(
+        self, state: StateType, offset: GridPosition2DType
+    ) -> StateType | None:
+        """
+        Translates the agent and the remaining consumables of a state, or returns
+         None if a consumable is translated off the consumable positions.
+        """
+        if self._STATE_ENCODING == "packed":
+            state = self.decode_state(state)  # type: ignore[arg-type]
+        agent_position = translate_position(state[:2], offset, self._GRID_SHAPE)  # type: ignore[index]
+        consumable_positions = [
+            translate_position(position, offset, self._GRID_SHAPE)
+            for position in state[2]  # type: ignore[index]
+        ]
+        if any(p not in self._CONSUMABLE_POSITIONS for p in consumable_positions):
+            return None
+        # Tuple states list their consumables in the order of the positions.
+        consumable_positions.sort(key=self._CONSUMABLE_POSITIONS.index)
+        translated_state = (*agent_position, (*consumable_positions,))
+        if self._STATE_ENCODING == "packed":
+            return self.encode_state(translated_state)
+        return translated_state
+
     def draw(self):
         """
         Draws the current state of the grid. (To be implemented)
@@ -95,12 +252,13 @@ class Gridworld2DConsumable(BaseWorld):
 
         Returns:
             dict: Additional properties including grid shape, consumable positions,
-                 and consume strategy.
+                 consume strategy and state encoding.
         """
         return {
             "grid_shape": self._GRID_SHAPE,
             "consumable_positions": self._CONSUMABLE_POSITIONS,
             "consume_strategy": self._CONSUME_STRATEGY,
+            "state_encoding": self._STATE_ENCODING,
         }
 
 
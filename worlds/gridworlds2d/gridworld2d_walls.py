@@ -1,14 +1,30 @@
+import numpy as np
+
 from utils.type_definitions import ActionType, StateType
 from worlds.gridworlds2d.gridworld2d import GridPosition2DType, Gridworld2D
+from worlds.gridworlds2d.utils.generate_2d_grid_positions import (
+    generate_2d_grid_positions,
+)
 from worlds.gridworlds2d.utils.make_world_cyclical import make_world_cyclical
 from worlds.gridworlds2d.utils.move_objects_2d import MoveObject2DGrid
 from worlds.utils.undefined_action_strat import UndefinedActionStrat
+from worlds.utils.undefined_state import UNDEFINED_STATE_ID
 
 WallPositionsType = list[tuple[float, float]]
 
 # Define constant for wall position relative to states.
 HALF_INT = 0.5
 
+# Column of each move in the blocked-directions array, and the offset from a cell to
+#  the wall position that blocks the move.
+DIRECTION_COLUMNS: dict[ActionType, int] = {"1": 0, "N": 1, "S": 2, "E": 3, "W": 4}
+DIRECTION_WALL_OFFSETS: dict[ActionType, tuple[float, float]] = {
+    "N": (0.0, HALF_INT),
+    "S": (0.0, -HALF_INT),
+    "E": (HALF_INT, 0.0),
+    "W": (-HALF_INT, 0.0),
+}
+
 
 class Gridworld2DWalls(Gridworld2D):
     """
@@ -23,6 +39,9 @@ class Gridworld2DWalls(Gridworld2D):
         _wall_strategy (str): The strategy for handling wall interactions ('identity' or
          'masked').
         _wall_positions (WallPositionsType): The list of wall positions in the grid.
+        _blocked_directions (np.ndarray): Boolean array of shape (cells, moves),
+         True where a wall blocks the move (column in DIRECTION_COLUMNS) from the
+         cell (row x * max_y + y).
 
     Args:
         grid_shape (GridPosition2DType): The shape of the grid (max_x, max_y).
@@ -51,15 +70,25 @@ class Gridworld2DWalls(Gridworld2D):
             wall_positions, grid_shape
         )
         self._wall_positions = wall_positions + pseudo_wall_positions
+        self._blocked_directions = compile_blocked_directions(
+            self._wall_positions, grid_shape
+        )
+
+    def __setstate__(self, state: dict) -> None:
+        super().__setstate__(state)
+        # Worlds pickled before the blocked-directions array existed hold the wall
+        #  positions only, or per-cell bitmasks; the array is compiled afresh.
+        if not isinstance(state.get("_blocked_directions"), np.ndarray):
+            self._blocked_directions = compile_blocked_directions(
+                self._wall_positions, self._GRID_SHAPE
+            )
 
     def get_next_state(self, state: StateType, min_action: ActionType) -> StateType:
-        agent_position = state
-        agent_moving_into_wall = self._is_object_moving_into_wall(
-            object_position=agent_position,
-            wall_positions=self._wall_positions,
-            min_action=min_action,
-        )
-        if agent_moving_into_wall:
+        if min_action not in DIRECTION_COLUMNS:
+            raise Exception(f"Minimum action not in {self._MIN_ACTIONS}")
+
+        cell = state[0] * self._GRID_SHAPE[1] + state[1]
+        if self._blocked_directions[cell, DIRECTION_COLUMNS[min_action]]:
             next_state = UndefinedActionStrat(self._wall_strategy).apply(state)
         else:
             next_state = MoveObject2DGrid(min_action).apply(
@@ -67,65 +96,25 @@ class Gridworld2DWalls(Gridworld2D):
             )
         return next_state
 
-    def _is_object_moving_into_wall(
-        self,
-        object_position: GridPosition2DType,
-        wall_positions: WallPositionsType,
-        min_action: ActionType,
-    ) -> bool:
-        if min_action == "1":
-            return False
-        # Moving up into wall.
-        elif min_action == "N":
-            x_change = 0.0
-            y_change = HALF_INT
-        # Moving down into wall.
-        elif min_action == "S":
-            x_change = 0.0
-            y_change = -HALF_INT
-        # Moving right into wall.
-        elif min_action == "E":
-            x_change = HALF_INT
-            y_change = 0.0
-        # Moving left into wall.
-        elif min_action == "W":
-            x_change = -HALF_INT
-            y_change = 0.0
-        else:
+    def _get_next_state_ids(
+        self, xs: np.ndarray, ys: np.ndarray, min_action: ActionType
+    ) -> np.ndarray:
+        if min_action not in DIRECTION_COLUMNS:
             raise Exception(f"Minimum action not in {self._MIN_ACTIONS}")
 
-        return self._is_wall_at_position(
-            object_position=object_position,
-            wall_positions=wall_positions,
-            x_change=x_change,
-            y_change=y_change,
-        )
+        next_state_ids = super()._get_next_state_ids(xs, ys, min_action)
+        cells = xs * self._GRID_SHAPE[1] + ys
+        is_blocked = self._blocked_directions[cells, DIRECTION_COLUMNS[min_action]]
+        if UndefinedActionStrat(self._wall_strategy) == UndefinedActionStrat.IDENTITY:
+            blocked_state_ids = cells + 1
+        else:
+            blocked_state_ids = UNDEFINED_STATE_ID
+        return np.where(is_blocked, blocked_state_ids, next_state_ids)
 
     def draw(self):
         # TODO: use draw from GridWorld2D, then draw in walls.
         pass
 
-    def _is_wall_at_position(
-        self,
-        object_position: GridPosition2DType,
-        wall_positions: WallPositionsType,
-        x_change: float,
-        y_change: float,
-    ):
-        for wall_position in wall_positions:
-            possible_wall_position_that_object_traverses = (
-                object_position[0] + x_change,
-                object_position[1] + y_change,
-            )
-            if wall_position == possible_wall_position_that_object_traverses:
-                return True
-            # Enforcing cyclical world.
-            if wall_position == make_world_cyclical(
-                possible_wall_position_that_object_traverses, self._GRID_SHAPE
-            ):
-                return True
-        return False
-
     def _get_additional_properties_for_save(self) -> dict:
         """Get additional properties specific to Gridworld2DWalls.
 
@@ -183,6 +172,30 @@ def check_walls(
             )
 
 
+def compile_blocked_directions(
+    wall_positions: WallPositionsType, grid_shape: GridPosition2DType
+) -> np.ndarray:
+    """
+    Compiles wall positions into a boolean array of blocked moves per cell.
+
+    A move from a cell is blocked if a wall lies half a cell away in the direction of
+     movement, either directly or after wrapping the wall position cyclically. Rows
+     follow generate_2d_grid_positions (x * max_y + y) and columns DIRECTION_COLUMNS.
+    """
+    wall_set = set(wall_positions)
+    cells = generate_2d_grid_positions(grid_size=grid_shape)
+    blocked_directions = np.zeros((len(cells), len(DIRECTION_COLUMNS)), dtype=bool)
+    for i, cell in enumerate(cells):
+        for min_action, (x_change, y_change) in DIRECTION_WALL_OFFSETS.items():
+            traversed_position = (cell[0] + x_change, cell[1] + y_change)
+            if (
+                traversed_position in wall_set
+                or make_world_cyclical(traversed_position, grid_shape) in wall_set
+            ):
+                blocked_directions[i, DIRECTION_COLUMNS[min_action]] = True
+    return blocked_directions
+
+
 def generate_cyclical_pseudo_wall_positions(
     wall_positions: WallPositionsType, grid_shape: GridPosition2DType
 ) -> WallPositionsType:
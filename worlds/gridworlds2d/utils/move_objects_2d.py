@@ -9,6 +9,8 @@ grid boundaries.
 
 from enum import Enum
 
+import numpy as np
+
 from utils.type_definitions import GridPosition2DType
 from worlds.gridworlds2d.utils.make_world_cyclical import make_world_cyclical
 
@@ -52,3 +54,27 @@ class MoveObject2DGrid(Enum):
             position=object_position, grid_shape=grid_shape
         )
         return object_position
+
+    def apply_to_arrays(
+        self, xs: np.ndarray, ys: np.ndarray, grid_shape: tuple[int, int]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Apply the movement direction element-wise to arrays of object positions.
+
+        Parameters:
+        - xs (np.ndarray): The x coordinates of the objects.
+        - ys (np.ndarray): The y coordinates of the objects.
+        - grid_shape (tuple[int, int]): The shape of the grid (width, height).
+
+        Returns:
+        - tuple[np.ndarray, np.ndarray]: The new x and y coordinates after movement,
+          wrapped cyclically.
+        """
+        x_change, y_change = {
+            self.NOOP: (0, 0),
+            self.LEFT: (-1, 0),
+            self.RIGHT: (1, 0),
+            self.UP: (0, 1),
+            self.DOWN: (0, -1),
+        }[self]
+        return (xs + x_change) % grid_shape[0], (ys + y_change) % grid_shape[1]
@@ -0,0 +1,105 @@
+"""
+Provides cyclic translations of objects and states in a 2D grid world environment.
+
+Since 2D grid worlds wrap around their boundaries, translating every object in a
+ state by the same offset is a candidate symmetry of the world (see
+ worlds/utils/symmetry.py).
+"""
+
+from collections.abc import Callable
+
+import numpy as np
+
+from utils.type_definitions import GridPosition2DType, StateType
+from worlds.base_world import BaseWorld
+from worlds.gridworlds2d.utils.generate_2d_grid_positions import (
+    generate_2d_grid_positions,
+)
+from worlds.gridworlds2d.utils.make_world_cyclical import make_world_cyclical
+from worlds.utils.undefined_state import UNDEFINED_STATE_ID
+
+
+def translate_position(
+    position: GridPosition2DType,
+    offset: GridPosition2DType,
+    grid_shape: GridPosition2DType,
+) -> GridPosition2DType:
+    """
+    Translates a position by an offset, wrapping cyclically.
+
+    Args:
+        position (GridPosition2DType): The (x, y) position.
+        offset (GridPosition2DType): The (x, y) offset.
+        grid_shape (GridPosition2DType): The dimensions of the grid (width, height).
+
+    Returns:
+        GridPosition2DType: The translated position.
+    """
+    return make_world_cyclical(
+        (position[0] + offset[0], position[1] + offset[1]), grid_shape
+    )
+
+
+def generate_translation_candidates(
+    world: BaseWorld,
+    grid_shape: GridPosition2DType,
+    translate_state: Callable[[StateType, GridPosition2DType], StateType | None],
+) -> list[np.ndarray]:
+    """
+    Generates the permutations of the state IDs of a world given by the cyclic
+     translations of the grid that map states to states.
+
+    If the unit translations map states to states, the other translations are
+     composed from them; otherwise each translation is computed state by state.
+
+    Args:
+        world (BaseWorld): A world with a transition array over all possible states.
+        grid_shape (GridPosition2DType): The dimensions of the grid (width, height).
+        translate_state (Callable): Translates a state by an offset, returning None
+         if the translated state is not a state of the world.
+
+    Returns:
+        list[np.ndarray]: One permutation per translation (in x-major order of the
+         offsets, starting with the identity), where entry i is the ID of the
+         translation of state i.
+    """
+    x_translation = _get_translation_permutation(world, (1, 0), translate_state)
+    y_translation = _get_translation_permutation(world, (0, 1), translate_state)
+    if x_translation is None or y_translation is None:
+        candidates = [
+            _get_translation_permutation(world, offset, translate_state)
+            for offset in generate_2d_grid_positions(grid_size=grid_shape)
+        ]
+        return [candidate for candidate in candidates if candidate is not None]
+
+    candidates = []
+    translation = np.arange(world.get_num_state_ids(), dtype=np.int32)
+    for _ in range(grid_shape[0]):
+        candidate = translation
+        for _ in range(grid_shape[1]):
+            candidates.append(candidate)
+            candidate = y_translation[candidate]
+        translation = x_translation[translation]
+    return candidates
+
+
+def _get_translation_permutation(
+    world: BaseWorld,
+    offset: GridPosition2DType,
+    translate_state: Callable[[StateType, GridPosition2DType], StateType | None],
+) -> np.ndarray | None:
+    """
+    Returns the permutation of the state IDs given by translating every state by
+     offset, or None if a state is not translated to a state of the world.
+    """
+    permutation = np.empty(world.get_num_state_ids(), dtype=np.int32)
+    permutation[UNDEFINED_STATE_ID] = UNDEFINED_STATE_ID
+    for state_id in range(1, len(permutation)):
+        translated_state = translate_state(world.id_to_state(state_id), offset)
+        if translated_state is None:
+            return None
+        try:
+            permutation[state_id] = world.state_to_id(translated_state)
+        except ValueError:
+            return None
+    return permutation
@@ -0,0 +1,122 @@
+"""
+N-dimensional cyclic grid worlds with flat integer states.
+
+The agent's position is stored as its flat (C-order) index into the grid, so states
+ are plain ints and the transition array is built with index arithmetic over all
+ states at once, without enumerating coordinate tuples.
+"""
+
+import math
+import string
+from collections.abc import Iterator
+
+import numpy as np
+
+from utils.type_definitions import (
+    ActionType,
+    GridShapeNDType,
+    StateType,
+    TransitionArray,
+)
+from worlds.base_world import BaseWorld
+from worlds.utils.undefined_state import UNDEFINED_STATE_ID, UndefinedStates
+from worlds.world_saver import MappedStateTable
+
+# Minimum actions moving the agent along axis k: forward (+1) and backward (-1).
+FORWARD_ACTIONS = string.ascii_uppercase
+BACKWARD_ACTIONS = string.ascii_lowercase
+
+
+class GridworldND(BaseWorld):
+    """
+    A cyclic grid world of any number of dimensions.
+
+    The minimum actions are "1" (stay) and, for each axis k, a forward and a
+     backward move: "A"/"a" along axis 0, "B"/"b" along axis 1 and so on. Moves wrap
+     around the grid boundaries. State s is the position with flat index s, so the
+     state of coordinates c is np.ravel_multi_index(c, shape).
+
+    Args:
+        shape (GridShapeNDType): The size of the grid along each axis.
+
+    Raises:
+        ValueError: If the shape is empty, has more than 26 axes, or has sizes that
+         are not positive integers.
+    """
+
+    def __init__(self, shape: GridShapeNDType) -> None:
+        if not 0 < len(shape) <= len(FORWARD_ACTIONS):
+            raise ValueError(
+                f"Grids must have between 1 and {len(FORWARD_ACTIONS)} dimensions."
+            )
+        if not all(isinstance(n, int) and n > 0 for n in shape):
+            raise ValueError("Grid dimensions must be positive integers")
+        min_actions = ["1"]
+        for axis in range(len(shape)):
+            min_actions += [FORWARD_ACTIONS[axis], BACKWARD_ACTIONS[axis]]
+        super().__init__(min_actions)
+
+        self._SHAPE = tuple(shape)
+        self._NUM_POSITIONS = math.prod(shape)
+        # Flat index step of each axis, for C-order indexing.
+        self._STRIDES = tuple(
+            math.prod(shape[axis + 1 :]) for axis in range(len(shape))
+        )
+        self._MOVES = {"1": (0, 0)}
+        for axis in range(len(shape)):
+            self._MOVES[FORWARD_ACTIONS[axis]] = (axis, 1)
+            self._MOVES[BACKWARD_ACTIONS[axis]] = (axis, -1)
+
+    def generate_possible_states(self) -> list[StateType]:
+        return list(range(self._NUM_POSITIONS))
+
+    def iter_possible_states(self) -> Iterator[StateType]:
+        return iter(range(self._NUM_POSITIONS))
+
+    def count_possible_states(self) -> int:
+        return self._NUM_POSITIONS
+
+    def get_next_state(self, state: StateType, min_action: ActionType) -> StateType:
+        if min_action not in self._MOVES:
+            raise ValueError(f"Invalid action: '{min_action}'.")
+        if state == UndefinedStates.BASIC.value:
+            return state
+        return int(self._move(np.int64(state), min_action))
+
+    def _move(self, positions: np.ndarray, min_action: ActionType) -> np.ndarray:
+        """Return the flat indices of positions after a minimum action."""
+        axis, step = self._MOVES[min_action]
+        if step == 0:
+            return positions
+        size, stride = self._SHAPE[axis], self._STRIDES[axis]
+        coordinates = positions // stride % size
+        return positions + ((coordinates + step) % size - coordinates) * stride
+
+    def _build_transition_array_vectorized(
+        self,
+    ) -> tuple[MappedStateTable, TransitionArray] | None:
+        """Build the transition table with index arithmetic over all positions.
+
+        State s has ID s + 1, after the undefined state. The states are served from
+         an array rather than a list of ints, which keeps large grids compact.
+        """
+        positions = np.arange(self._NUM_POSITIONS, dtype=np.int64)
+        # The positions are sorted, so they are their own sorting permutation.
+        states = MappedStateTable(positions, order=positions)
+        transition_array = np.full(
+            (len(states), len(self._MIN_ACTIONS)), UNDEFINED_STATE_ID, dtype=np.int32
+        )
+        for j, min_action in enumerate(self._MIN_ACTIONS):
+            transition_array[1:, j] = self._move(positions, min_action) + 1
+        return states, transition_array
+
+    def draw(self):
+        pass
+
+    def _get_additional_properties_for_save(self) -> dict:
+        """Get additional properties specific to GridworldND.
+
+        Returns:
+            dict: Additional properties including the grid shape.
+        """
+        return {"shape": self._SHAPE}
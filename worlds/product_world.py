@@ -0,0 +1,167 @@
+"""
+Products of worlds that share their minimum actions.
+
+Each minimum action is applied to both component worlds at once. Product states are
+ pairs (i, j) of component state IDs, and transitions are looked up in the
+ component transition arrays when they are needed, so the product state space is
+ never enumerated unless asked for.
+"""
+
+from collections.abc import Callable, Iterator
+
+import numpy as np
+
+from utils.type_definitions import ActionType, StateType, TransitionArray
+from worlds.base_world import BaseWorld
+from worlds.utils.undefined_state import UNDEFINED_STATE_ID, UndefinedStates
+
+# Maps (state, min_action, uncoupled next state) to the coupled next state, where
+#  states are pairs of component state IDs.
+CouplingType = Callable[[StateType, ActionType, StateType], StateType]
+
+
+class ProductWorld(BaseWorld):
+    """
+    The synchronous product of two worlds with the same minimum actions.
+
+    A component that reaches its undefined state stays there while the other
+     component keeps moving; the product is in its undefined state only when both
+     components are, which keeps the product's action functions in one-to-one
+     correspondence with pairs of component action functions.
+
+    Attributes:
+        _world_a (BaseWorld): The first component world.
+        _world_b (BaseWorld): The second component world.
+        _coupling (CouplingType | None): Adjusts the next state of the uncoupled
+         product, for components that interact.
+        _coupling_name (str | None): Identifies the coupling in the world
+         configuration.
+
+    Args:
+        world_a (BaseWorld): The first component world.
+        world_b (BaseWorld): The second component world.
+        coupling (CouplingType | None): Called with the state, the minimum action
+         and the uncoupled next state (as pairs of component state IDs), and returns
+         the next state.
+        coupling_name (str | None): A name identifying the coupling, required with
+         a coupling. Worlds with the same components and coupling name share their
+         configuration key (see get_configuration_key) and so their cached tables.
+
+    Raises:
+        ValueError: If the component worlds have different minimum actions, or if a
+         coupling is given without a name.
+    """
+
+    def __init__(
+        self,
+        world_a: BaseWorld,
+        world_b: BaseWorld,
+        coupling: CouplingType | None = None,
+        coupling_name: str | None = None,
+    ) -> None:
+        if world_a.get_min_actions() != world_b.get_min_actions():
+            raise ValueError(
+                "Component worlds must have the same minimum actions:"
+                f" {world_a.get_min_actions()} != {world_b.get_min_actions()}."
+            )
+        if coupling is not None and not coupling_name:
+            raise ValueError("A coupling must be given a coupling_name.")
+        super().__init__(list(world_a.get_min_actions()))
+        self._world_a = world_a
+        self._world_b = world_b
+        self._coupling = coupling
+        self._coupling_name = coupling_name
+
+        for world in [world_a, world_b]:
+            if not world.is_transition_array_complete():
+                world.generate_transition_array()
+        self._num_states_a = world_a.get_num_state_ids()
+        self._num_states_b = world_b.get_num_state_ids()
+
+    def get_component_worlds(self) -> tuple[BaseWorld, BaseWorld]:
+        """Return the two component worlds."""
+        return self._world_a, self._world_b
+
+    def from_component_states(
+        self, state_a: StateType, state_b: StateType
+    ) -> StateType:
+        """Return the product state of a pair of component states."""
+        state = (self._world_a.state_to_id(state_a), self._world_b.state_to_id(state_b))
+        return _to_product_state(state)
+
+    def to_component_states(self, state: StateType) -> tuple[StateType, StateType]:
+        """Return the pair of component states of a product state."""
+        if state == UndefinedStates.BASIC.value:
+            state = (UNDEFINED_STATE_ID, UNDEFINED_STATE_ID)
+        return (
+            self._world_a.id_to_state(state[0]),  # type: ignore[index]
+            self._world_b.id_to_state(state[1]),  # type: ignore[index]
+        )
+
+    def generate_possible_states(self) -> list[StateType]:
+        return list(self.iter_possible_states())
+
+    def iter_possible_states(self) -> Iterator[StateType]:
+        for i in range(self._num_states_a):
+            for j in range(self._num_states_b):
+                if (i, j) != (UNDEFINED_STATE_ID, UNDEFINED_STATE_ID):
+                    yield (i, j)
+
+    def count_possible_states(self) -> int:
+        return self._num_states_a * self._num_states_b - 1
+
+    def get_next_state(self, state: StateType, min_action: ActionType) -> StateType:
+        if min_action not in self._MIN_ACTIONS:
+            raise ValueError(f"Invalid action: '{min_action}'.")
+        if state == UndefinedStates.BASIC.value:
+            return state
+        next_state = (
+            self._world_a.get_next_state_id(state[0], min_action),  # type: ignore[index]
+            self._world_b.get_next_state_id(state[1], min_action),  # type: ignore[index]
+        )
+        if self._coupling is not None:
+            next_state = self._coupling(state, min_action, next_state)
+        return _to_product_state(next_state)
+
+    def _build_transition_array_vectorized(
+        self,
+    ) -> tuple[list[StateType], TransitionArray] | None:
+        """Build the table of an uncoupled product from the component tables.
+
+        The product state (i, j) gets the ID i * num_states_b + j, so the undefined
+         state (both components undefined) gets UNDEFINED_STATE_ID.
+        """
+        if self._coupling is not None:
+            return None
+        states = [UndefinedStates.BASIC.value, *self.iter_possible_states()]
+        table_a = self._world_a.get_transition_array()
+        table_b = self._world_b.get_transition_array()
+        state_ids_a, state_ids_b = np.divmod(np.arange(len(states)), self._num_states_b)
+        transition_array = (
+            table_a[state_ids_a] * self._num_states_b + table_b[state_ids_b]
+        ).astype(np.int32)
+        return states, transition_array
+
+    def draw(self):
+        pass
+
+    def _get_additional_properties_for_save(self) -> dict:
+        """Get additional properties specific to ProductWorld.
+
+        Returns:
+            dict: Additional properties including the configuration keys of the
+             component worlds and the coupling name.
+        """
+        return {
+            "component_configurations": (
+                self._world_a.get_configuration_key(),
+                self._world_b.get_configuration_key(),
+            ),
+            "coupling": self._coupling_name,
+        }
+
+
+def _to_product_state(state: StateType) -> StateType:
+    if state == (UNDEFINED_STATE_ID, UNDEFINED_STATE_ID):
+        return UndefinedStates.BASIC.value
+    return state
@@ -0,0 +1,269 @@
+"""
+Worlds defined declaratively by a JSON or TOML specification.
+
+A specification describes the states, the minimum actions and the transitions of a
+ world, and is compiled straight into the dense transition array (see
+ BaseWorld.generate_transition_array) when the world is created:
+
+    min_actions = ["1", "a", "b"]
+    states = [1, 2, 3]                      # or num_states = 3, for states (0,)...
+    undefined_action_strategy = "masked"    # transitions not given ('identity'
+                                            #  or 'masked', default 'masked')
+
+    [transitions]                           # next state of each state, in order
+    a = [2, 3, 1]
+
+    [[edges]]                               # or single transitions
+    state = 1
+    action = "b"
+    next_state = 2
+
+    [rules]                                 # or rule templates over state indices
+    "1" = { rule = "identity" }
+    b = { rule = "shift", offset = -1 }     # state i -> state (i + offset) % n
+    c = { rule = "constant", state = 3 }    # every state -> state
+
+Scalar states are wrapped as 1-tuples and lists become tuples, so that states have
+ the same form as in the other worlds. A next state of null is the undefined state.
+"""
+
+import json
+import tomllib
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from utils.type_definitions import ActionType, StateType, TransitionArray
+from worlds.base_world import BaseWorld
+from worlds.utils.undefined_action_strat import UndefinedActionStrat
+from worlds.utils.undefined_state import UNDEFINED_STATE_ID, UndefinedStates
+
+SPEC_RULES = ["identity", "shift", "constant"]
+
+
+class SpecWorld(BaseWorld):
+    """
+    A world whose transitions are compiled from a declarative specification.
+
+    Attributes:
+        _SPEC (dict): The specification the world was compiled from.
+        _compiled_states (list[StateType]): The states in ID order, starting with the
+         undefined state.
+        _compiled_transition_array (TransitionArray): The compiled transitions over
+         the IDs of _compiled_states.
+
+    Args:
+        spec (dict): The world specification (see the module docstring).
+
+    Raises:
+        ValueError: If the specification is invalid or incomplete.
+    """
+
+    def __init__(self, spec: dict) -> None:
+        if "min_actions" not in spec or not spec["min_actions"]:
+            raise ValueError("The world spec must define min_actions.")
+        super().__init__(list(spec["min_actions"]))
+        self._SPEC = spec
+        self._compiled_states, self._compiled_transition_array = compile_world_spec(
+            spec
+        )
+        self._compiled_state_to_id = {
+            state: i for i, state in enumerate(self._compiled_states)
+        }
+
+    def generate_possible_states(self) -> list[StateType]:
+        return self._compiled_states[1:]
+
+    def count_possible_states(self) -> int:
+        return len(self._compiled_states) - 1
+
+    def get_next_state(self, state: StateType, min_action: ActionType) -> StateType:
+        state_id = self._compiled_state_to_id.get(state)
+        if state_id is None:
+            raise ValueError(f"Invalid state: '{state}'.")
+        if min_action not in self._MIN_ACTIONS:
+            raise ValueError(f"Invalid action: '{min_action}'.")
+        next_state_id = self._compiled_transition_array[
+            state_id, self._MIN_ACTIONS.index(min_action)
+        ]
+        return self._compiled_states[next_state_id]
+
+    def _build_transition_array_vectorized(
+        self,
+    ) -> tuple[list[StateType], TransitionArray] | None:
+        return self._compiled_states, self._compiled_transition_array
+
+    def draw(self):
+        pass
+
+    def _get_additional_properties_for_save(self) -> dict:
+        """Get additional properties specific to SpecWorld.
+
+        Returns:
+            dict: Additional properties including the world specification.
+        """
+        return {"spec": self._SPEC}
+
+
+def load_spec_world(path: str) -> SpecWorld:
+    """
+    Creates a world from a JSON (.json) or TOML (.toml) specification file.
+
+    Raises:
+        ValueError: If the file type is not supported or the specification is
+         invalid.
+    """
+    file_path = Path(path)
+    if file_path.suffix == ".json":
+        with open(file_path) as f:
+            spec = json.load(f)
+    elif file_path.suffix == ".toml":
+        with open(file_path, "rb") as f:
+            spec = tomllib.load(f)
+    else:
+        raise ValueError(
+            f"Unsupported world spec file: {path}. Must be .json or .toml."
+        )
+    return SpecWorld(spec)
+
+
+def compile_world_spec(spec: dict) -> tuple[list[StateType], TransitionArray]:
+    """
+    Compiles a world specification into its states and dense transition array.
+
+    Returns:
+        tuple[list[StateType], TransitionArray]: The states in ID order (starting
+         with the undefined state, which has ID UNDEFINED_STATE_ID) and the int32
+         array whose entry [i, j] is the ID of the state reached by applying the
+         j-th minimum action to state i.
+
+    Raises:
+        ValueError: If the specification is invalid.
+    """
+    min_actions = list(spec["min_actions"])
+    if len(set(min_actions)) != len(min_actions):
+        raise ValueError("The min_actions of the world spec must be unique.")
+    action_to_index = {min_action: j for j, min_action in enumerate(min_actions)}
+    unknown_keys = set(spec) - {
+        "name",
+        "min_actions",
+        "states",
+        "num_states",
+        "undefined_action_strategy",
+        "transitions",
+        "edges",
+        "rules",
+    }
+    if unknown_keys:
+        raise ValueError(f"Unknown world spec keys: {sorted(unknown_keys)}.")
+
+    states = [UndefinedStates.BASIC.value, *_get_spec_states(spec)]
+    state_to_id = {state: i for i, state in enumerate(states)}
+    if len(state_to_id) != len(states):
+        raise ValueError("The states of the world spec must be unique.")
+    num_states = len(states) - 1
+
+    def lookup_state_id(state) -> int:
+        if state is None:
+            return UNDEFINED_STATE_ID
+        state_id = state_to_id.get(_to_state(state))
+        if state_id is None:
+            raise ValueError(f"Invalid state in world spec: '{state}'.")
+        return state_id
+
+    def lookup_action_index(min_action) -> int:
+        if min_action not in action_to_index:
+            raise ValueError(f"Invalid action in world spec: '{min_action}'.")
+        return action_to_index[min_action]
+
+    # Transitions that are not specified follow the undefined action strategy.
+    strategy = UndefinedActionStrat(spec.get("undefined_action_strategy", "masked"))
+    state_ids = np.arange(1, num_states + 1, dtype=np.int32)
+    transition_array = np.full(
+        (num_states + 1, len(min_actions)), UNDEFINED_STATE_ID, dtype=np.int32
+    )
+    if strategy == UndefinedActionStrat.IDENTITY:
+        transition_array[1:] = state_ids[:, np.newaxis]
+
+    for min_action, rule in spec.get("rules", {}).items():
+        j = lookup_action_index(min_action)
+        transition_array[1:, j] = _compile_spec_rule(
+            min_action, rule, state_ids, lookup_state_id
+        )
+
+    for min_action, next_states in spec.get("transitions", {}).items():
+        j = lookup_action_index(min_action)
+        if len(next_states) != num_states:
+            raise ValueError(
+                f"Transitions for action '{min_action}' must list one next state"
+                f" per state ({num_states}), got {len(next_states)}."
+            )
+        transition_array[1:, j] = [lookup_state_id(s) for s in next_states]
+
+    for edge in spec.get("edges", []):
+        i = lookup_state_id(edge["state"])
+        if i == UNDEFINED_STATE_ID:
+            raise ValueError("Edges cannot start from the undefined state.")
+        transition_array[i, lookup_action_index(edge["action"])] = lookup_state_id(
+            edge["next_state"]
+        )
+
+    return states, transition_array
+
+
+def _compile_spec_rule(
+    min_action: ActionType,
+    rule: dict,
+    state_ids: np.ndarray,
+    lookup_state_id: Callable[[Any], int],
+) -> np.ndarray:
+    """Returns the next state IDs of the states with IDs state_ids under a rule."""
+    rule_name = rule.get("rule")
+    if rule_name == "identity":
+        return state_ids
+    if rule_name == "shift":
+        offset = int(rule.get("offset", 1))
+        return (state_ids - 1 + offset) % len(state_ids) + 1
+    if rule_name == "constant":
+        return np.full_like(state_ids, lookup_state_id(rule.get("state")))
+    raise ValueError(
+        f"Invalid rule for action '{min_action}': '{rule_name}'."
+        f" Must be one of {SPEC_RULES}."
+    )
+
+
+def _get_spec_states(spec: dict) -> list[StateType]:
+    if "states" in spec and "num_states" in spec:
+        raise ValueError("The world spec must define states or num_states, not both.")
+    if "states" in spec:
+        if not spec["states"]:
+            raise ValueError("The states of the world spec must not be empty.")
+        return [_to_state(state) for state in spec["states"]]
+    if "num_states" in spec:
+        num_states = spec["num_states"]
+        if isinstance(num_states, bool) or not isinstance(num_states, int):
+            raise ValueError(
+                f"The num_states of the world spec must be an integer, got"
+                f" '{num_states}'."
+            )
+        if num_states <= 0:
+            raise ValueError(
+                f"The num_states of the world spec must be positive, got {num_states}."
+            )
+        return [(i,) for i in range(num_states)]
+    raise ValueError("The world spec must define states or num_states.")
+
+
+def _to_state(value) -> StateType:
+    """Converts a JSON/TOML value to a state: lists become tuples, scalars 1-tuples."""
+    if isinstance(value, list | tuple):
+        return tuple(_to_nested_tuple(v) for v in value)
+    return (value,)
+
+
+def _to_nested_tuple(value):
+    if isinstance(value, list | tuple):
+        return tuple(_to_nested_tuple(v) for v in value)
+    return value
@@ -0,0 +1,199 @@
+"""
+Streaming export of world graphs to DOT and GraphML files.
+
+Unlike BaseWorld.draw_graph, no graph object is built and no layout is run: nodes
+ and edges are written to the file as they are read from the transition array, a
+ chunk of states at a time, so the memory used does not grow with the number of
+ edges. The files can be rendered offline, e.g. 'sfdp -Tpng world.dot -o world.png'.
+
+Nodes are named by their state IDs and labelled with their states.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+from utils.type_definitions import StateType
+from worlds.utils.undefined_state import UNDEFINED_STATE_ID, UndefinedStates
+
+if TYPE_CHECKING:
+    from worlds.base_world import BaseWorld
+
+# Graph formats by file suffix.
+GRAPH_EXPORT_FORMATS = {".dot": "dot", ".gv": "dot", ".graphml": "graphml"}
+
+# States per chunk of transition array rows written at a time.
+EXPORT_CHUNK_SIZE = 65536
+
+# Graph attributes that make Graphviz lay out large graphs quickly with sfdp.
+SFDP_LAYOUT_HINT = {
+    "layout": "sfdp",
+    "overlap": "prism",
+    "splines": "false",
+    "outputorder": "edgesfirst",
+}
+
+
+def export_world_graph(
+    world: "BaseWorld",
+    path: str,
+    include_undefined_state: bool = False,
+    show_edge_labels: bool = True,
+    layout_hint: bool = False,
+) -> int:
+    """
+    Write the graph of a world's states and transitions to a DOT or GraphML file.
+
+    The transition array of the world is generated if it does not exist yet.
+
+    Args:
+        world: The world to export.
+        path: The file to write, with suffix '.dot', '.gv' or '.graphml'.
+        include_undefined_state: Whether to write the undefined state and the
+         transitions into it.
+        show_edge_labels: Whether to label edges with their minimum actions.
+        layout_hint: Whether to add the SFDP_LAYOUT_HINT graph attributes, so that
+         Graphviz renders the file with sfdp.
+
+    Returns:
+        int: The number of edges written.
+
+    Raises:
+        ValueError: If the file suffix is not supported.
+    """
+    graph_format = GRAPH_EXPORT_FORMATS.get(Path(path).suffix)
+    if graph_format is None:
+        raise ValueError(
+            f"Unsupported graph file: {path}."
+            f" Must be one of {list(GRAPH_EXPORT_FORMATS)}."
+        )
+    if not world.is_transition_array_complete():
+        world.generate_transition_array()
+
+    with open(path, "w", encoding="utf-8") as f:
+        if graph_format == "dot":
+            return _write_dot(
+                world, f, include_undefined_state, show_edge_labels, layout_hint
+            )
+        return _write_graphml(
+            world, f, include_undefined_state, show_edge_labels, layout_hint
+        )
+
+
+def _write_dot(
+    world: "BaseWorld",
+    f: TextIO,
+    include_undefined_state: bool,
+    show_edge_labels: bool,
+    layout_hint: bool,
+) -> int:
+    color_map = world.get_action_color_map()
+    f.write("digraph world {\n")
+    if layout_hint:
+        for key, value in SFDP_LAYOUT_HINT.items():
+            f.write(f'  {key}="{value}";\n')
+    for state_id, state in _iter_nodes(world, include_undefined_state):
+        f.write(f"  {state_id} [label={_quote_dot(_get_node_label(state))}];\n")
+
+    num_edges = 0
+    for state_id, min_action, next_state_id in _iter_edges(
+        world, include_undefined_state
+    ):
+        label = f", label={_quote_dot(min_action)}" if show_edge_labels else ""
+        color = color_map[min_action]
+        f.write(f'  {state_id} -> {next_state_id} [color="{color}"{label}];\n')
+        num_edges += 1
+    f.write("}\n")
+    return num_edges
+
+
+def _write_graphml(
+    world: "BaseWorld",
+    f: TextIO,
+    include_undefined_state: bool,
+    show_edge_labels: bool,
+    layout_hint: bool,
+) -> int:
+    color_map = world.get_action_color_map()
+    f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n')
+    f.write('  <key id="label" for="node" attr.name="label" attr.type="string"/>\n')
+    f.write('  <key id="action" for="edge" attr.name="action" attr.type="string"/>\n')
+    f.write('  <key id="color" for="edge" attr.name="color" attr.type="string"/>\n')
+    if layout_hint:
+        for key in SFDP_LAYOUT_HINT:
+            f.write(
+                f'  <key id="{key}" for="graph" attr.name="{key}"'
+                ' attr.type="string"/>\n'
+            )
+    f.write('  <graph id="world" edgedefault="directed">\n')
+    if layout_hint:
+        for key, value in SFDP_LAYOUT_HINT.items():
+            f.write(f'    <data key="{key}">{value}</data>\n')
+    for state_id, state in _iter_nodes(world, include_undefined_state):
+        f.write(
+            f'    <node id="n{state_id}"><data key="label">'
+            f"{escape(_get_node_label(state))}</data></node>\n"
+        )
+
+    num_edges = 0
+    for state_id, min_action, next_state_id in _iter_edges(
+        world, include_undefined_state
+    ):
+        action_data = (
+            f'<data key="action">{escape(min_action)}</data>'
+            if show_edge_labels
+            else ""
+        )
+        f.write(
+            f'    <edge source="n{state_id}" target="n{next_state_id}">'
+            f'{action_data}<data key="color">{color_map[min_action]}</data></edge>\n'
+        )
+        num_edges += 1
+    f.write("  </graph>\n</graphml>\n")
+    return num_edges
+
+
+def _iter_nodes(
+    world: "BaseWorld", include_undefined_state: bool
+) -> Iterator[tuple[int, StateType]]:
+    first_state_id = UNDEFINED_STATE_ID if include_undefined_state else 1
+    for state_id in range(first_state_id, world.get_num_state_ids()):
+        yield state_id, world.id_to_state(state_id)
+
+
+def _iter_edges(
+    world: "BaseWorld", include_undefined_state: bool
+) -> Iterator[tuple[int, str, int]]:
+    """Yield (state ID, minimum action, next state ID) for each transition.
+
+    Transitions of the undefined state are always skipped, as it is absorbing.
+    """
+    transition_array = world.get_transition_array()
+    min_actions = world.get_min_actions()
+    for start in range(1, len(transition_array), EXPORT_CHUNK_SIZE):
+        chunk = transition_array[start : start + EXPORT_CHUNK_SIZE]
+        state_ids, action_indices = np.nonzero(
+            np.ones_like(chunk, dtype=bool)
+            if include_undefined_state
+            else chunk != UNDEFINED_STATE_ID
+        )
+        next_state_ids = chunk[state_ids, action_indices]
+        for state_id, action_index, next_state_id in zip(
+            (state_ids + start).tolist(),
+            action_indices.tolist(),
+            next_state_ids.tolist(),
+            strict=True,
+        ):
+            yield state_id, min_actions[action_index], next_state_id
+
+
+def _get_node_label(state: StateType) -> str:
+    return "⊥" if state == UndefinedStates.BASIC.value else str(state)
+
+
+def _quote_dot(text: str) -> str:
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
@@ -0,0 +1,155 @@
+"""
+Symmetries of world transition tables.
+
+A permutation g of the state IDs that fixes the undefined state and commutes with
+ every minimum action (T[g[i], j] == g[T[i, j]] for the transition array T) is an
+ automorphism of the world. Automorphisms then commute with every action function
+ f, so f(g[i]) == g[f(i)]: an action function is determined by its values on one
+ representative state per orbit of the automorphism group, and two action functions
+ are equal if and only if they agree on the representatives.
+"""
+
+import numpy as np
+
+from utils.type_definitions import TransitionArray
+from worlds.base_world import BaseWorld
+from worlds.utils.undefined_state import UNDEFINED_STATE_ID
+
+
+def is_automorphism(transition_array: TransitionArray, permutation: np.ndarray) -> bool:
+    """
+    Checks whether a permutation of the state IDs is an automorphism of the
+     transition array.
+
+    Args:
+        transition_array (TransitionArray): The transition array of the world.
+        permutation (np.ndarray): Entry i is the image of state ID i.
+
+    Returns:
+        bool: True if the permutation is a bijection that fixes the undefined state
+         and commutes with every minimum action.
+    """
+    num_states = len(transition_array)
+    return (
+        permutation.shape == (num_states,)
+        and permutation[UNDEFINED_STATE_ID] == UNDEFINED_STATE_ID
+        and np.array_equal(np.sort(permutation), np.arange(num_states))
+        and np.array_equal(transition_array[permutation], permutation[transition_array])
+    )
+
+
+def find_automorphism_group(world: BaseWorld) -> list[np.ndarray]:
+    """
+    Finds the automorphisms among the candidate automorphisms of a world.
+
+    The candidates (see BaseWorld.get_candidate_automorphisms) should form a group,
+     such as the translations of a cyclic grid, so that the verified candidates form
+     a subgroup of it.
+
+    Args:
+        world (BaseWorld): A world with a transition array over all possible states.
+
+    Returns:
+        list[np.ndarray]: The verified automorphisms, starting with the identity.
+    """
+    transition_array = world.get_transition_array()
+    identity = np.arange(len(transition_array), dtype=np.int32)
+    group = [identity]
+    for candidate in world.get_candidate_automorphisms():
+        if not np.array_equal(candidate, identity) and is_automorphism(
+            transition_array, candidate
+        ):
+            group.append(candidate)
+    return group
+
+
+class StateSymmetry:
+    """
+    Orbits of a group of automorphisms of a world, used to store and compose action
+     functions by their values on the orbit representatives only.
+
+    Attributes:
+        representatives (np.ndarray): The smallest state ID in each orbit, in
+         increasing order.
+
+    Args:
+        group (list[np.ndarray]): The automorphisms, forming a group.
+    """
+
+    def __init__(self, group: list[np.ndarray]) -> None:
+        self._group = np.stack(group)
+        num_states = self._group.shape[1]
+
+        # Representative of each state's orbit, and its position in representatives.
+        self._representative_of = self._group.min(axis=0)
+        self.representatives = np.flatnonzero(
+            self._representative_of == np.arange(num_states)
+        ).astype(np.int32)
+        self._representative_index = np.full(num_states, -1, dtype=np.int32)
+        self._representative_index[self.representatives] = np.arange(
+            len(self.representatives), dtype=np.int32
+        )
+
+        # Index of an automorphism mapping each state's representative to it.
+        self._element_of = np.full(num_states, -1, dtype=np.int32)
+        for k, automorphism in enumerate(self._group):
+            is_image = (
+                automorphism[self._representative_of] == np.arange(num_states)
+            ) & (self._element_of < 0)
+            self._element_of[is_image] = k
+
+    def get_group_order(self) -> int:
+        """Return the number of automorphisms in the group."""
+        return len(self._group)
+
+    def restrict_action_function(self, action_function: np.ndarray) -> np.ndarray:
+        """Return the values of a full action function on the representatives."""
+        return action_function[self.representatives]
+
+    def reconstruct_action_function(
+        self, restricted_action_function: np.ndarray
+    ) -> np.ndarray:
+        """Return the full action function given its values on the representatives."""
+        return self._apply_restricted_action_function(
+            restricted_action_function,
+            np.arange(self._group.shape[1], dtype=np.int32),
+        )
+
+    def compose_action_functions(
+        self, left_action_function: np.ndarray, right_action_function: np.ndarray
+    ) -> np.ndarray:
+        """
+        Compose two action functions given by their values on the representatives.
+
+        Args:
+            left_action_function: Function applied second
+            right_action_function: Function applied first
+
+        Returns:
+            The composed function's values on the representatives
+        """
+        return self._apply_restricted_action_function(
+            left_action_function, right_action_function
+        )
+
+    def _apply_restricted_action_function(
+        self, restricted_action_function: np.ndarray, state_ids: np.ndarray
+    ) -> np.ndarray:
+        # For state g[r], with r a representative: f(g[r]) = g[f(r)].
+        representative_values = restricted_action_function[
+            self._representative_index[self._representative_of[state_ids]]
+        ]
+        return self._group[self._element_of[state_ids], representative_values]
+
+
+def detect_state_symmetry(world: BaseWorld) -> StateSymmetry:
+    """
+    Finds the automorphism group of a world among its candidate automorphisms.
+
+    Args:
+        world (BaseWorld): A world with a transition array over all possible states.
+
+    Returns:
+        StateSymmetry: The orbits of the group (trivial if no candidate is verified).
+    """
+    return StateSymmetry(find_automorphism_group(world))
@@ -17,3 +17,7 @@ class UndefinedStates(Enum):
 
     BASIC = (None,)
     """Basic undefined state representing a null or uninitialized value."""
+
+
+UNDEFINED_STATE_ID = 0
+"""Dense integer ID reserved for the undefined state in array-backed tables."""
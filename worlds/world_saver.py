@@ -1,9 +1,43 @@
 """
 Class to handle saving and loading world properties.
+
+Worlds are saved either as a single pickle file, or in a binary layout for sharing
+ one on-disk world between processes. The binary layout is a directory holding:
+
+    header.json             minimum actions, number of states, fingerprint and
+                             world-specific properties
+    transition_array.npy    the int32 transition array, loaded with mmap_mode="r"
+    states.npy              the interned states (after the undefined state) as an
+     or states.pkl           integer array, loaded with mmap_mode="r" and decoded
+                             on access; a pickled list for other states
+    states_order.npy        the permutation sorting the rows of states.npy, so
+                             that states are looked up by binary search in the
+                             mapped array (absent with states.pkl)
 """
 
+import json
 import os
 import pickle
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any
+
+import numpy as np
+
+from utils.type_definitions import StateIdType, StateType, TransitionArray
+from worlds.utils.undefined_state import UNDEFINED_STATE_ID, UndefinedStates
+
+# Directory, relative to ./saved/worlds, holding cached transition tables.
+TRANSITION_CACHE_DIR = "transition_cache"
+
+BINARY_FORMAT_VERSION = 1
+BINARY_HEADER_FILE = "header.json"
+BINARY_TRANSITION_ARRAY_FILE = "transition_array.npy"
+BINARY_STATES_ARRAY_FILE = "states.npy"
+BINARY_STATES_PICKLE_FILE = "states.pkl"
+BINARY_STATES_ORDER_FILE = "states_order.npy"
+
+# Rows decoded at a time when iterating over a memory-mapped state table.
+STATE_TABLE_CHUNK_SIZE = 65536
 
 
 class WorldSaver:
@@ -56,3 +90,349 @@ class WorldSaver:
             ],
             **additional_properties,
         }
+
+    def save_cached_transition_table(self, key: str, table: dict) -> None:
+        """Save a transition table to the on-disk cache.
+
+        Args:
+            key (str): The world configuration key (see
+             BaseWorld.get_configuration_key).
+            table (dict): The interned states, minimum actions and transition array.
+        """
+        cache_dir = os.path.join(".", "saved", "worlds", TRANSITION_CACHE_DIR)
+        os.makedirs(cache_dir, exist_ok=True)
+
+        with open(os.path.join(cache_dir, f"{key}.pkl"), "wb") as f:
+            pickle.dump(table, f)
+
+    def load_cached_transition_table(self, key: str) -> dict | None:
+        """Load a transition table from the on-disk cache.
+
+        Args:
+            key (str): The world configuration key.
+
+        Returns:
+            dict | None: The cached table, or None if there is no cache entry.
+        """
+        full_path = os.path.join(
+            ".", "saved", "worlds", TRANSITION_CACHE_DIR, f"{key}.pkl"
+        )
+        if not os.path.exists(full_path):
+            return None
+
+        with open(full_path, "rb") as f:
+            return pickle.load(f)
+
+    def save_world_binary(
+        self,
+        properties: dict,
+        states: list[StateType],
+        transition_array: TransitionArray,
+        path: str,
+        fingerprint: str | None = None,
+    ) -> None:
+        """Save a world in the binary layout (see the module docstring).
+
+        Args:
+            properties (dict): The minimum actions and world-specific properties,
+             saved in the JSON header. Tuples are tagged so that they are loaded as
+             tuples.
+            states (list[StateType]): The interned states in ID order, starting with
+             the undefined state.
+            transition_array (TransitionArray): The transition array over the IDs
+             of states.
+            path (str): The directory, relative to ./saved/worlds, to save to.
+            fingerprint (str | None): The world fingerprint (see
+             BaseWorld.fingerprint). If the directory already holds a world with
+             this fingerprint and these properties, nothing is written.
+        """
+        save_dir = os.path.join(".", "saved", "worlds", path)
+        header_path = os.path.join(save_dir, BINARY_HEADER_FILE)
+        if fingerprint is not None and os.path.exists(header_path):
+            with open(header_path) as f:
+                saved_header = json.load(f)
+            if saved_header.get("fingerprint") == fingerprint and saved_header.get(
+                "properties"
+            ) == _tag_tuples(properties):
+                print(f"\tWorld already saved in {save_dir}.")
+                return
+        os.makedirs(save_dir, exist_ok=True)
+
+        np.save(
+            os.path.join(save_dir, BINARY_TRANSITION_ARRAY_FILE),
+            np.ascontiguousarray(transition_array, dtype=np.int32),
+        )
+        states_array = _encode_states(states[1:])
+        if states_array is not None:
+            np.save(os.path.join(save_dir, BINARY_STATES_ARRAY_FILE), states_array)
+            np.save(
+                os.path.join(save_dir, BINARY_STATES_ORDER_FILE),
+                MappedStateTable(states_array).get_order(),
+            )
+        else:
+            with open(os.path.join(save_dir, BINARY_STATES_PICKLE_FILE), "wb") as f:
+                pickle.dump(list(states[1:]), f)
+
+        header = {
+            "format_version": BINARY_FORMAT_VERSION,
+            "num_state_ids": len(states),
+            "fingerprint": fingerprint,
+            "properties": _tag_tuples(properties),
+        }
+        with open(header_path, "w") as f:
+            json.dump(header, f, indent=2)
+
+    def load_world_binary(self, path: str) -> dict:
+        """Load a world saved with save_world_binary.
+
+        The transition array, and the states if saved as an array, are memory-mapped
+         rather than read, so loading takes near-constant time and processes loading
+         the same world share its pages.
+
+        Args:
+            path (str): The directory, relative to ./saved/worlds, to load from.
+
+        Returns:
+            dict: The saved properties, with the states (a MappedStateTable if
+             memory-mapped) under "states", the read-only transition array under
+             "transition_array" and the world fingerprint under "fingerprint".
+
+        Raises:
+            FileNotFoundError: If the directory does not hold a saved world.
+            ValueError: If the format version is not supported or the files are
+             inconsistent.
+        """
+        load_dir = os.path.join(".", "saved", "worlds", path)
+        with open(os.path.join(load_dir, BINARY_HEADER_FILE)) as f:
+            header = json.load(f)
+        if header.get("format_version") != BINARY_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported world format in {load_dir}."
+                f" Expected version {BINARY_FORMAT_VERSION}."
+            )
+
+        transition_array = np.load(
+            os.path.join(load_dir, BINARY_TRANSITION_ARRAY_FILE), mmap_mode="r"
+        )
+        states_path = os.path.join(load_dir, BINARY_STATES_ARRAY_FILE)
+        order_path = os.path.join(load_dir, BINARY_STATES_ORDER_FILE)
+        if os.path.exists(states_path):
+            states = MappedStateTable(
+                np.load(states_path, mmap_mode="r"),
+                order=(
+                    np.load(order_path, mmap_mode="r")
+                    if os.path.exists(order_path)
+                    else None
+                ),
+            )
+        else:
+            with open(os.path.join(load_dir, BINARY_STATES_PICKLE_FILE), "rb") as f:
+                states = [UndefinedStates.BASIC.value, *pickle.load(f)]
+
+        num_state_ids = header["num_state_ids"]
+        if len(states) != num_state_ids or len(transition_array) != num_state_ids:
+            raise ValueError(
+                f"Inconsistent saved world in {load_dir}: expected {num_state_ids}"
+                " states."
+            )
+        return {
+            **_untag_tuples(header["properties"]),
+            "fingerprint": header.get("fingerprint"),
+            "states": states,
+            "transition_array": transition_array,
+        }
+
+
+class MappedStateTable(Sequence):
+    """
+    The interned states of a world, decoded on access from an integer array.
+
+    States are decoded from the rows of the array, as ints for 1D arrays and
+     (nested) tuples otherwise. With the undefined state included, it has index
+     UNDEFINED_STATE_ID and is followed by the decoded states, so that indices are
+     state IDs.
+
+    States are looked up (see find) by binary search over the rows of the array,
+     in the order given by a permutation that sorts them.
+
+    Args:
+        states_array (np.ndarray): The encoded states after the undefined state,
+         usually memory-mapped.
+        include_undefined_state (bool): Whether the table starts with the undefined
+         state.
+        order (np.ndarray | None): The permutation sorting the rows of
+         states_array, usually memory-mapped. Computed on first lookup if not given.
+    """
+
+    def __init__(
+        self,
+        states_array: np.ndarray,
+        include_undefined_state: bool = True,
+        order: np.ndarray | None = None,
+    ) -> None:
+        self._states_array = states_array
+        self._offset = 1 if include_undefined_state else 0
+        self._order = order
+
+    def __len__(self) -> int:
+        return len(self._states_array) + self._offset
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            # Contiguous slices are tables over a slice of the same array.
+            return MappedStateTable(
+                self._states_array[
+                    max(start - self._offset, 0) : max(stop - self._offset, 0)
+                ],
+                include_undefined_state=bool(self._offset) and start == 0 < stop,
+            )
+        index = int(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("State table index out of range.")
+        if self._offset and index == UNDEFINED_STATE_ID:
+            return UndefinedStates.BASIC.value
+        return _decode_state(self._states_array[index - self._offset].tolist())
+
+    def __iter__(self) -> Iterator[StateType]:
+        if self._offset:
+            yield UndefinedStates.BASIC.value
+        for start in range(0, len(self._states_array), STATE_TABLE_CHUNK_SIZE):
+            chunk = self._states_array[start : start + STATE_TABLE_CHUNK_SIZE]
+            for row in chunk.tolist():
+                yield _decode_state(row)
+
+    def get_order(self) -> np.ndarray:
+        """Return the permutation sorting the rows of the states array."""
+        if self._order is None:
+            self._order = np.argsort(self._get_row_keys(), kind="stable")
+        return self._order
+
+    def find(self, state: StateType) -> StateIdType | None:
+        """Return the index of a state, or None if it is not in the table.
+
+        The state is encoded like the rows of the array and searched for with
+         np.searchsorted, so only the pages of the array (and of the order) along
+         the search path are read.
+        """
+        if state == UndefinedStates.BASIC.value:
+            return UNDEFINED_STATE_ID if self._offset else None
+        key = self._encode_key(state)
+        if key is None or not len(self._states_array):
+            return None
+        keys = self._get_row_keys()
+        order = self.get_order()
+        position = int(np.searchsorted(keys, key, sorter=order))
+        if position == len(order) or keys[order[position]] != key:
+            return None
+        return int(order[position]) + self._offset
+
+    def _get_row_keys(self) -> np.ndarray:
+        """View each row of the states array as one scalar, compared field by field."""
+        states_array = self._states_array
+        if states_array.ndim == 1:
+            return states_array
+        rows = states_array.reshape(len(states_array), -1)
+        return rows.view(_get_row_dtype(rows))[:, 0]
+
+    def _encode_key(self, state: StateType):
+        """Encode a state like a row of _get_row_keys, or return None if it can't be."""
+        states_array = self._states_array
+        is_tuple = isinstance(state, tuple)
+        if is_tuple != (states_array.ndim > 1):
+            return None
+        try:
+            row = np.array(state, dtype=states_array.dtype)
+        except (OverflowError, TypeError, ValueError):
+            return None
+        if row.shape != states_array.shape[1:] or row.tolist() != _untuple(state):
+            return None
+        if not is_tuple:
+            return row[()]
+        row = row.reshape(1, -1)
+        return row.view(_get_row_dtype(row))[0, 0]
+
+
+class MappedStateIndex(Mapping):
+    """
+    Maps the states of a MappedStateTable to their IDs.
+
+    States are looked up in the table itself (see MappedStateTable.find), so no
+     dictionary of the states is built on the heap.
+    """
+
+    def __init__(self, states: MappedStateTable) -> None:
+        self._states = states
+
+    def __getitem__(self, state: StateType) -> StateIdType:
+        state_id = self._states.find(state)
+        if state_id is None:
+            raise KeyError(state)
+        return state_id
+
+    def __iter__(self) -> Iterator[StateType]:
+        return iter(self._states)
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+
+def _encode_states(states: Sequence[StateType]) -> np.ndarray | None:
+    """Encode states as an integer array.
+
+    Returns None unless the states are integers or tuples of integers with a common
+     shape.
+    """
+    if not states:
+        return None
+    try:
+        states_array = np.asarray(states)
+    except ValueError:
+        return None
+    if states_array.dtype.kind not in "iu" or states_array.shape[0] != len(states):
+        return None
+    if isinstance(states[0], tuple) != (states_array.ndim > 1):
+        return None
+    return states_array
+
+
+def _get_row_dtype(rows: np.ndarray) -> np.dtype:
+    """Return a structured dtype with one field per column of a 2D array."""
+    return np.dtype([(f"f{i}", rows.dtype) for i in range(rows.shape[1])])
+
+
+def _untuple(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return [_untuple(v) for v in value]
+    return value
+
+
+def _decode_state(value) -> StateType:
+    if isinstance(value, list):
+        return tuple(_decode_state(v) for v in value)
+    return value
+
+
+def _tag_tuples(value: Any) -> Any:
+    """Tag the tuples in a value, so that they survive a JSON round trip."""
+    if isinstance(value, tuple):
+        return {"__tuple__": [_tag_tuples(v) for v in value]}
+    if isinstance(value, list):
+        return [_tag_tuples(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _tag_tuples(v) for k, v in value.items()}
+    return value
+
+
+def _untag_tuples(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_untag_tuples(v) for v in value]
+    if isinstance(value, dict):
+        if set(value) == {"__tuple__"}:
+            return tuple(_untag_tuples(v) for v in value["__tuple__"])
+        return {k: _untag_tuples(v) for k, v in value.items()}
+    return value